@@ -0,0 +1,70 @@
+###
+## cluster_maker: benchmark of centroid initialisation methods
+###
+
+"""
+Compare "random", "k-means++" and "k-means||" seeding by the number of
+Lloyd iterations needed to converge and the final inertia, on skewed
+synthetic data (clusters of very different sizes).
+
+Usage:
+    python benchmarks/bench_init.py [n_points] [k] [n_seeds]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from cluster_maker.algorithms import INIT_METHODS, kmeans_elkan
+from cluster_maker.dataframe_builder import simulate_data
+from cluster_maker.evaluation import compute_inertia
+
+
+def skewed_data(n_points: int, k: int, n_features: int = 8, seed: int = 0) -> np.ndarray:
+    """
+    Simulate k clusters whose sizes decay geometrically.
+    """
+    rng = np.random.RandomState(seed)
+    sizes = 0.6 ** np.arange(k)
+    sizes = np.maximum(1, np.round(n_points * sizes / sizes.sum())).astype(int)
+    centres = rng.uniform(-20.0, 20.0, size=(k, n_features))
+    blocks = []
+    for cid, (centre, size) in enumerate(zip(centres, sizes)):
+        seed_df = pd.DataFrame([centre])
+        block = simulate_data(seed_df, n_points=size, cluster_std=1.0, random_state=seed + cid)
+        blocks.append(block.drop(columns="true_cluster").to_numpy())
+    return np.vstack(blocks)
+
+
+def main(argv: list[str]) -> int:
+    n_points = int(argv[1]) if len(argv) > 1 else 20000
+    k = int(argv[2]) if len(argv) > 2 else 10
+    n_seeds = int(argv[3]) if len(argv) > 3 else 5
+
+    X = skewed_data(n_points, k)
+    print(f"Skewed data: n={X.shape[0]}, d={X.shape[1]}, k={k}, seeds={n_seeds}")
+    print(f"{'init':>10} {'mean iters':>11} {'mean inertia':>14} {'time (s)':>9}")
+
+    for init in INIT_METHODS:
+        iters, inertias = [], []
+        start = time.perf_counter()
+        for seed in range(n_seeds):
+            labels, centroids, stats = kmeans_elkan(
+                X, k, random_state=seed, init=init, return_stats=True
+            )
+            iters.append(stats["n_iter"])
+            inertias.append(compute_inertia(X, labels, centroids))
+        elapsed = time.perf_counter() - start
+        print(
+            f"{init:>10} {np.mean(iters):>11.1f} "
+            f"{np.mean(inertias):>14.1f} {elapsed / n_seeds:>9.3f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
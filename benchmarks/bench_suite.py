@@ -0,0 +1,211 @@
+###
+## cluster_maker: benchmark suite for the hot paths
+###
+
+"""
+Time and peak memory of the main hot paths over grids of n (samples),
+d (features) and k (clusters), on data built with ``simulate_data``.
+
+Each case is run once under ``tracemalloc`` to record the peak traced
+memory (NumPy allocations included), then ``--repeat`` times without
+tracing; the fastest of those runs is reported. Results are written as
+JSON, to be compared with ``benchmarks/compare.py``.
+
+Usage:
+    python benchmarks/bench_suite.py [--profile quick|full] [--repeat N]
+                                     [--only NAME ...] [--output FILE]
+"""
+
+from __future__ import annotations
+
+import argparse
+import atexit
+import itertools
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, Iterator, List, Tuple
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+
+from cluster_maker.algorithms import (
+    assign_clusters,
+    init_centroids,
+    kmeans,
+    sklearn_kmeans,
+    update_centroids,
+)
+from cluster_maker.dataframe_builder import simulate_data
+from cluster_maker.evaluation import elbow_curve, silhouette_score_sklearn
+from cluster_maker.interface import run_clustering
+
+# (n, d, k) grids per profile. The silhouette score is O(n^2), so its
+# sizes are capped separately.
+PROFILES = {
+    "quick": {
+        "n": [10_000, 100_000],
+        "d": [2, 16],
+        "k": [3, 10],
+        "silhouette_n": [2_000, 5_000],
+    },
+    "full": {
+        "n": [10_000, 100_000, 1_000_000],
+        "d": [2, 16, 64],
+        "k": [3, 10, 50],
+        "silhouette_n": [2_000, 10_000, 20_000],
+    },
+}
+
+# A benchmark returns a zero-argument callable that runs the measured work
+# (set-up such as building the data is excluded from the measurement).
+Setup = Callable[[int, int, int], Callable[[], object]]
+
+
+def make_data(n: int, d: int, k: int, seed: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Simulated data with k well-spread Gaussian clusters, and its labels.
+    """
+    rng = np.random.RandomState(seed)
+    seed_df = pd.DataFrame(rng.uniform(-10.0, 10.0, size=(k, d)))
+    data = simulate_data(seed_df, n_points=n, cluster_std=1.0, random_state=seed)
+    labels = data.pop("true_cluster").to_numpy()
+    return data.to_numpy(), labels
+
+
+def setup_assign_clusters(n: int, d: int, k: int) -> Callable[[], object]:
+    X, _ = make_data(n, d, k)
+    centroids = init_centroids(X, k, random_state=0)
+    return lambda: assign_clusters(X, centroids)
+
+
+def setup_update_centroids(n: int, d: int, k: int) -> Callable[[], object]:
+    X, labels = make_data(n, d, k)
+    return lambda: update_centroids(X, labels, k, random_state=0)
+
+
+def setup_kmeans(n: int, d: int, k: int) -> Callable[[], object]:
+    X, _ = make_data(n, d, k)
+    return lambda: kmeans(X, k, random_state=0, max_iter=20, tol=0.0)
+
+
+def setup_sklearn_kmeans(n: int, d: int, k: int) -> Callable[[], object]:
+    X, _ = make_data(n, d, k)
+    return lambda: sklearn_kmeans(X, k, random_state=0, n_init=1)
+
+
+def setup_elbow_curve(n: int, d: int, k: int) -> Callable[[], object]:
+    X, _ = make_data(n, d, k)
+    k_values = list(range(1, k + 1))
+    return lambda: elbow_curve(X, k_values, random_state=0, use_sklearn=False)
+
+
+def setup_silhouette(n: int, d: int, k: int) -> Callable[[], object]:
+    X, labels = make_data(n, d, k)
+    return lambda: silhouette_score_sklearn(X, labels)
+
+
+def setup_run_clustering(n: int, d: int, k: int) -> Callable[[], object]:
+    X, _ = make_data(n, d, k)
+    tmpdir = tempfile.mkdtemp(prefix="cluster_maker_bench_")
+    atexit.register(shutil.rmtree, tmpdir, ignore_errors=True)
+    path = os.path.join(tmpdir, "data.csv")
+    columns = [f"f{j}" for j in range(d)]
+    pd.DataFrame(X, columns=columns).to_csv(path, index=False)
+
+    def run() -> object:
+        result = run_clustering(
+            path, feature_cols=columns, k=k, random_state=0, silhouette_method="simplified"
+        )
+        plt.close("all")
+        return result
+
+    return run
+
+
+BENCHMARKS: Dict[str, Setup] = {
+    "assign_clusters": setup_assign_clusters,
+    "update_centroids": setup_update_centroids,
+    "kmeans": setup_kmeans,
+    "sklearn_kmeans": setup_sklearn_kmeans,
+    "elbow_curve": setup_elbow_curve,
+    "silhouette_score_sklearn": setup_silhouette,
+    "run_clustering": setup_run_clustering,
+}
+
+
+def iter_cases(profile: str, names: List[str]) -> Iterator[Tuple[str, int, int, int]]:
+    grid = PROFILES[profile]
+    for name in names:
+        sizes = grid["silhouette_n"] if name == "silhouette_score_sklearn" else grid["n"]
+        for n, d, k in itertools.product(sizes, grid["d"], grid["k"]):
+            yield name, n, d, k
+
+
+def measure(run: Callable[[], object], repeat: int) -> Dict[str, float]:
+    """
+    Peak traced memory of one run, and the best wall time of repeat runs.
+    """
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    return {"time_s": min(times), "peak_mem_bytes": int(peak)}
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="quick")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS), default=None)
+    parser.add_argument("--output", default="benchmark_results.json")
+    args = parser.parse_args(argv[1:])
+
+    names = args.only or list(BENCHMARKS)
+    results: Dict[str, Dict[str, float]] = {}
+    for name, n, d, k in iter_cases(args.profile, names):
+        case = f"{name}[n={n},d={d},k={k}]"
+        run = BENCHMARKS[name](n, d, k)
+        results[case] = dict(measure(run, args.repeat), n=n, d=d, k=k)
+        print(
+            f"{case:<48} {results[case]['time_s']:>9.4f} s "
+            f"{results[case]['peak_mem_bytes'] / 2 ** 20:>9.1f} MiB",
+            flush=True,
+        )
+
+    report = {
+        "meta": {
+            "profile": args.profile,
+            "repeat": args.repeat,
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    print(f"Results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
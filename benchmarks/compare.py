@@ -0,0 +1,104 @@
+###
+## cluster_maker: compare benchmark results against a baseline
+###
+
+"""
+Compare two JSON files written by ``benchmarks/bench_suite.py`` and fail
+if any case common to both got slower, or used more peak memory, than
+the baseline by more than a relative threshold, or if a baseline case is
+missing from the current results (a deleted or renamed benchmark would
+otherwise hide its regressions).
+
+Usage:
+    python benchmarks/compare.py BASELINE CURRENT [--time-threshold 0.2]
+                                                  [--mem-threshold 0.2]
+                                                  [--allow-missing]
+
+Exit status is 1 if there is at least one regression or missing case
+(missing cases are only reported with --allow-missing), 0 otherwise.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from typing import Dict, List, Tuple
+
+METRICS = ("time_s", "peak_mem_bytes")
+
+
+def load_results(path: str) -> Dict[str, Dict[str, float]]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+
+def compare(
+    baseline: Dict[str, Dict[str, float]],
+    current: Dict[str, Dict[str, float]],
+    thresholds: Dict[str, float],
+) -> Tuple[List[Tuple[str, str, float, float, float]], List[str], List[str]]:
+    """
+    Relative changes of every metric of every common case.
+
+    Returns
+    -------
+    rows : list of (case, metric, baseline, current, ratio)
+    regressions : list of str
+        "case metric" for each change above its threshold.
+    missing : list of str
+        Baseline cases absent from the current results.
+    """
+    rows = []
+    regressions = []
+    for case in sorted(baseline):
+        if case not in current:
+            continue
+        for metric in METRICS:
+            old, new = baseline[case][metric], current[case][metric]
+            ratio = new / old if old > 0 else float("inf") if new > 0 else 1.0
+            rows.append((case, metric, old, new, ratio))
+            if ratio > 1.0 + thresholds[metric]:
+                regressions.append(f"{case} {metric}")
+    missing = sorted(set(baseline) - set(current))
+    return rows, regressions, missing
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--time-threshold", type=float, default=0.2,
+                        help="allowed relative slow-down (default 0.2 = 20%%)")
+    parser.add_argument("--mem-threshold", type=float, default=0.2,
+                        help="allowed relative peak-memory growth (default 0.2)")
+    parser.add_argument("--allow-missing", action="store_true",
+                        help="do not fail on baseline cases missing from CURRENT")
+    args = parser.parse_args(argv[1:])
+
+    thresholds = {"time_s": args.time_threshold, "peak_mem_bytes": args.mem_threshold}
+    rows, regressions, missing = compare(
+        load_results(args.baseline), load_results(args.current), thresholds
+    )
+
+    for case, metric, old, new, ratio in rows:
+        flag = "REGRESSION" if f"{case} {metric}" in regressions else ""
+        print(f"{case:<48} {metric:<15} {old:>14.4g} {new:>14.4g} {ratio:>7.2f}x {flag}")
+    for case in missing:
+        flag = "" if args.allow_missing else "MISSING"
+        print(f"{case:<48} missing from current results {flag}")
+
+    failed = False
+    if regressions:
+        print(f"{len(regressions)} regression(s) above threshold.")
+        failed = True
+    else:
+        print("No regressions above threshold.")
+    if missing and not args.allow_missing:
+        print(f"{len(missing)} baseline case(s) missing from current results.")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv))
@@ -15,86 +15,93 @@ Allowed libraries:
 - scikit-learn
 """
 
-# --- Data generation & basic analysis ---
-from .dataframe_builder import define_dataframe_structure, simulate_data
-from .data_analyser import calculate_descriptive_statistics, calculate_correlation
-from .data_exporter import export_to_csv, export_formatted
-
-# --- Preprocessing ---
-from .preprocessing import select_features, standardise_features
-
-# --- Clustering algorithms ---
-from .algorithms import (
-    kmeans,
-    sklearn_kmeans,
-    init_centroids,
-    assign_clusters,
-    update_centroids,
-)
-
-# --- Evaluation ---
-from .evaluation import (
-    compute_inertia,
-    silhouette_score_sklearn,
-    elbow_curve,
-)
-
-# --- Plotting ---
-from .plotting_clustered import plot_clusters_2d, plot_elbow
-
-# --- High-level interface ---
-from .interface import run_clustering
-
-
-__all__ = [
-    # Data generation
-    "define_dataframe_structure",
-    "simulate_data",
-
-    # Analysis
-    "calculate_descriptive_statistics",
-    "calculate_correlation",
+# Submodules are imported on first attribute access (PEP 562), so that
+# e.g. ``from cluster_maker import kmeans`` does not pull in pandas,
+# matplotlib or scikit-learn.
+_LAZY_ATTRIBUTES = {
+    # Data generation & basic analysis
+    "define_dataframe_structure": "dataframe_builder",
+    "simulate_data": "dataframe_builder",
+    "iter_simulated_data": "dataframe_builder",
+    "write_simulated_data": "dataframe_builder",
+    "calculate_descriptive_statistics": "data_analyser",
+    "calculate_correlation": "data_analyser",
+    "summarize_numeric_columns": "data_analyser",
 
     # Export
-    "export_to_csv",
-    "export_formatted",
+    "export_to_csv": "data_exporter",
+    "export_formatted": "data_exporter",
+    "export_labelled": "data_exporter",
+    "export_labels": "data_exporter",
+
+    # Data loading
+    "load_features": "data_loader",
+    "iter_feature_chunks": "data_loader",
 
     # Preprocessing
-    "select_features",
-    "standardise_features",
+    "select_features": "preprocessing",
+    "standardise_features": "preprocessing",
+    "StreamingStandardiser": "preprocessing",
 
     # Algorithms
-    "kmeans",
-    "sklearn_kmeans",
-    "init_centroids",
-    "assign_clusters",
-    "update_centroids",
+    "kmeans": "algorithms",
+    "kmeans_elkan": "algorithms",
+    "kmeans_hamerly": "algorithms",
+    "bisecting_kmeans": "algorithms",
+    "sharded_kmeans": "sharded",
+    "BisectingTree": "algorithms",
+    "minibatch_kmeans": "algorithms",
+    "MiniBatchKMeans": "algorithms",
+    "KMeansWorkspace": "algorithms",
+    "sklearn_kmeans": "algorithms",
+    "init_centroids": "algorithms",
+    "assign_clusters": "algorithms",
+    "update_centroids": "algorithms",
+    "warm_start_centroids": "algorithms",
+    "choose_assign_method": "spatial",
+    "kdtree_nearest": "spatial",
+    "DataKDTree": "spatial",
+
+    # Coresets
+    "build_coreset": "coreset",
+    "StreamingCoreset": "coreset",
 
     # Evaluation
-    "compute_inertia",
-    "silhouette_score_sklearn",
-    "elbow_curve",
+    "compute_inertia": "evaluation",
+    "silhouette_score_sklearn": "evaluation",
+    "silhouette_score_fast": "evaluation",
+    "elbow_curve": "evaluation",
+    "iter_elbow_curve": "evaluation",
+
+    # Parallel execution
+    "shared_arrays": "parallel",
+    "SharedArray": "parallel",
+
+    # Fitted models
+    "ClusterModel": "model",
 
     # Plotting
-    "plot_clusters_2d",
-    "plot_elbow",
+    "plot_clusters_2d": "plotting_clustered",
+    "plot_elbow": "plotting_clustered",
 
     # High-level orchestration
-    "run_clustering",
+    "run_clustering": "interface",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
 
-    "calculate_descriptive_statistics",
-    "calculate_correlation",
-    "summarize_numeric_columns",
 
-]
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
 
-# Import functions from data_analyser module
-from .data_analyser import (
-    calculate_descriptive_statistics,
-    calculate_correlation,
-    summarize_numeric_columns,
-)
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache it so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
 
 
-# Import functions from data_exporter module
-from .data_exporter import export_formatted
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
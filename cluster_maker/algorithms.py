@@ -6,19 +6,53 @@
 
 from __future__ import annotations
 
-from typing import Tuple, Optional
+import time
+from functools import partial
+from typing import Dict, List, Tuple, Optional, Union
 
 import numpy as np
-from sklearn.cluster import KMeans
+from scipy import sparse
+
+from .parallel import effective_n_jobs, parallel_map
+
+
+INIT_METHODS = ("random", "k-means++", "k-means||")
 
 
 def init_centroids(
     X: np.ndarray,
     k: int,
     random_state: Optional[int] = None,
+    init: Union[str, np.ndarray] = "k-means++",
+    sample_weight: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """
-    Initialise centroids by randomly sampling points from X without replacement.
+    Choose k initial centroids from X.
+
+    Parameters
+    ----------
+    X : ndarray of shape (n_samples, n_features)
+    k : int
+    random_state : int or None
+        Seed; every method is reproducible for a fixed seed.
+    init : {"k-means++", "random", "k-means||"} or ndarray, default "k-means++"
+        - "random": k distinct rows sampled uniformly without replacement.
+        - "k-means++": D^2 sampling, each new centroid drawn with
+          probability proportional to the squared distance to the nearest
+          centroid chosen so far.
+        - "k-means||": the oversampled parallel variant of k-means++
+          (Bahmani et al.), which needs only a few passes over X and is
+          better suited to large n.
+        - an ndarray of shape (k, n_features): explicit starting centroids
+          (e.g. a warm start), returned as a copy.
+    sample_weight : ndarray of shape (n_samples,) or None
+        Optional non-negative weight per sample; every method then samples
+        rows in proportion to their weight (zero-weight rows are never
+        chosen, except as a last resort by "k-means||").
+
+    Returns
+    -------
+    centroids : ndarray of shape (k, n_features)
     """
     if k <= 0:
         raise ValueError("k must be a positive integer.")
@@ -26,48 +60,740 @@ def init_centroids(
     if k > n_samples:
         raise ValueError("k cannot be larger than the number of samples.")
 
+    if isinstance(init, np.ndarray):
+        if init.shape != (k, X.shape[1]):
+            raise ValueError("init array must have shape (k, n_features).")
+        return init.astype(_float_dtype(X))
+
+    sample_weight = _check_sample_weight(sample_weight, n_samples)
     rng = np.random.RandomState(random_state)
-    indices = rng.choice(n_samples, size=k, replace=False)
+    if init == "random":
+        p = None if sample_weight is None else sample_weight / sample_weight.sum()
+        indices = rng.choice(n_samples, size=k, replace=False, p=p)
+        return X[indices]
+    if init == "k-means++":
+        return _kmeans_plus_plus(X, k, rng, sample_weight=sample_weight)
+    if init == "k-means||":
+        return _kmeans_parallel(X, k, rng, sample_weight=sample_weight)
+    raise ValueError(f"Unknown init '{init}'. Use one of {INIT_METHODS}.")
+
+
+def _sq_distances_to(
+    X: np.ndarray,
+    x_sq: np.ndarray,
+    centre: np.ndarray,
+) -> np.ndarray:
+    """
+    Squared distances from every row of X to a single centre, via the
+    ||x||^2 - 2 x.c + ||c||^2 expansion (O(n_samples) extra memory).
+    """
+    sq_dist = X @ centre
+    sq_dist *= -2.0
+    sq_dist += x_sq
+    sq_dist += centre @ centre
+    return np.maximum(sq_dist, 0.0, out=sq_dist)
+
+
+def _kmeans_plus_plus(
+    X: np.ndarray,
+    k: int,
+    rng: np.random.RandomState,
+    sample_weight: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    (Weighted) k-means++ seeding.
+
+    The array of squared distances to the closest chosen centre is updated
+    incrementally with one matrix-vector product per new centre, instead of
+    being recomputed against all chosen centres.
+    """
+    n_samples = X.shape[0]
+    dtype = np.result_type(X.dtype, np.float32)
+    x_sq = np.einsum("ij,ij->i", X, X, dtype=dtype)
+    weights = np.ones(n_samples) if sample_weight is None else sample_weight
+
+    indices = np.empty(k, dtype=np.intp)
+    if sample_weight is None:
+        indices[0] = rng.randint(0, n_samples)
+    else:
+        indices[0] = rng.choice(n_samples, p=weights / weights.sum())
+    closest_sq = _sq_distances_to(X, x_sq, X[indices[0]].astype(dtype))
+
+    for i in range(1, k):
+        cumulative = np.cumsum(weights * closest_sq)
+        total = cumulative[-1]
+        if total > 0:
+            idx = np.searchsorted(cumulative, rng.uniform(0.0, total), side="right")
+            idx = min(idx, n_samples - 1)
+        else:
+            # Every point coincides with a chosen centre
+            idx = rng.randint(0, n_samples)
+        indices[i] = idx
+        np.minimum(
+            closest_sq,
+            _sq_distances_to(X, x_sq, X[idx].astype(dtype)),
+            out=closest_sq,
+        )
+
     return X[indices]
 
 
-def assign_clusters(X: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+def _kmeans_parallel(
+    X: np.ndarray,
+    k: int,
+    rng: np.random.RandomState,
+    n_rounds: int = 5,
+    oversampling: Optional[float] = None,
+    sample_weight: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    (Weighted) k-means|| seeding.
+
+    Each round samples every point independently with probability
+    ``oversampling * d^2(x) / sum(d^2)``, so a round is one vectorised pass
+    over X rather than k sequential draws. The resulting candidates are
+    weighted by the number of points closest to them and reduced to k
+    centres with weighted k-means++ followed by a few weighted Lloyd steps.
+    """
+    n_samples = X.shape[0]
+    if oversampling is None:
+        oversampling = 2.0 * k
+
+    if sample_weight is None:
+        first = rng.randint(0, n_samples)
+    else:
+        first = rng.choice(n_samples, p=sample_weight / sample_weight.sum())
+    rows = [np.array([first])]
+    candidates = [X[first][np.newaxis, :]]
+    _, closest_sq = _nearest_centroid(X, candidates[0])
+    for _ in range(n_rounds):
+        cost = closest_sq if sample_weight is None else sample_weight * closest_sq
+        total = cost.sum()
+        if total <= 0:
+            break
+        probs = oversampling * cost / total
+        chosen = np.flatnonzero(rng.uniform(size=n_samples) < probs)
+        if chosen.size == 0:
+            continue
+        new = X[chosen]
+        rows.append(chosen)
+        candidates.append(new)
+        _, new_sq = _nearest_centroid(X, new)
+        np.minimum(closest_sq, new_sq, out=closest_sq)
+
+    C = np.vstack(candidates)
+    if C.shape[0] <= k:
+        # Too few candidates: top up with rows sampled uniformly among
+        # those not already chosen (a chosen row has distance 0, so no row
+        # is drawn twice across rounds).
+        rest = np.setdiff1d(np.arange(n_samples), np.concatenate(rows))
+        extra = rng.choice(rest, size=k - C.shape[0], replace=False)
+        return np.vstack([C, X[extra]])
+
+    labels, _ = _nearest_centroid(X, C)
+    weights = np.bincount(labels, weights=sample_weight, minlength=C.shape[0]).astype(float)
+    centroids = _kmeans_plus_plus(C, k, rng, sample_weight=weights)
+    for _ in range(10):
+        c_labels, _ = _nearest_centroid(C, centroids)
+        new_centroids = update_centroids(
+            C, c_labels, k, random_state=rng.randint(0, 2 ** 31 - 1),
+            sample_weight=weights,
+        )
+        if np.allclose(new_centroids, centroids):
+            centroids = new_centroids
+            break
+        centroids = new_centroids
+    return centroids
+
+
+# Default working-memory budget (bytes) for the chunked distance kernel.
+DEFAULT_MEMORY_BUDGET = 64 * 1024 ** 2
+
+
+def _rows_per_chunk(
+    n_samples: int,
+    row_bytes: int,
+    chunk_size: Optional[int] = None,
+    memory_budget: Optional[int] = None,
+) -> int:
+    """
+    Number of rows to process at once, either as given or sized so that
+    one chunk of ``row_bytes``-wide rows fits in ``memory_budget`` bytes.
+    """
+    if chunk_size is not None:
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer.")
+        return int(chunk_size)
+    if memory_budget is None:
+        memory_budget = DEFAULT_MEMORY_BUDGET
+    if memory_budget <= 0:
+        raise ValueError("memory_budget must be a positive number of bytes.")
+    return int(max(1, min(n_samples, memory_budget // max(1, row_bytes))))
+
+
+def _nearest_centroid(
+    X: np.ndarray,
+    centroids: np.ndarray,
+    chunk_size: Optional[int] = None,
+    memory_budget: Optional[int] = None,
+    workspace: Optional["KMeansWorkspace"] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Chunked nearest-centroid search.
+
+    Squared distances are obtained from the expansion
+    ||x||^2 - 2 x.c + ||c||^2, so each chunk costs one matrix product and
+    only a (chunk, k) block is ever held in memory. The square root is
+    skipped because it does not change the argmin.
+
+    Rows whose best and second-best squared distances are closer than the
+    rounding error of the expansion are re-evaluated with the direct
+    ``np.linalg.norm`` formula, so the labels match the brute-force
+    computation exactly (ties still go to the lowest centroid index).
+
+    With a prepared ``workspace`` the row norms are taken from it and the
+    distance block and outputs are written into its buffers in place (the
+    returned arrays are then views of the workspace).
+
+    Returns
+    -------
+    labels : ndarray of shape (n_samples,)
+    min_sq_dist : ndarray of shape (n_samples,)
+        Squared distance from each sample to its assigned centroid.
+    """
+    n_samples, n_features = X.shape
+    k = centroids.shape[0]
+    dtype = np.result_type(X.dtype, centroids.dtype, np.float32)
+    centroids = np.asarray(centroids, dtype=dtype)
+
+    if workspace is not None:
+        rows = workspace.rows
+        labels = workspace.labels
+        min_sq_dist = workspace.min_sq_dist
+        c_sq = np.einsum("ij,ij->i", centroids, centroids, out=workspace.c_sq[:k])
+    else:
+        itemsize = np.dtype(dtype).itemsize
+        # Two (chunk, k) blocks are alive at once: the product and its copy.
+        rows = _rows_per_chunk(n_samples, 2 * k * itemsize, chunk_size, memory_budget)
+        labels = np.empty(n_samples, dtype=np.intp)
+        min_sq_dist = np.empty(n_samples, dtype=dtype)
+        c_sq = np.einsum("ij,ij->i", centroids, centroids)
+    if n_samples == 0:
+        return labels, min_sq_dist
+
+    # The exact fallback needs a (rows, k, n_features) difference tensor.
+    exact_rows = max(1, rows // max(1, n_features))
+    c_sq_max = float(c_sq.max()) if k else 0.0
+    eps = np.finfo(dtype).eps
+    error_scale = 8.0 * (n_features + 2) * eps
+    neg2_centroids = -2.0 * centroids
+
+    for start in range(0, n_samples, rows):
+        stop = min(start + rows, n_samples)
+        X_chunk = np.asarray(X[start:stop], dtype=dtype)
+        idx = np.arange(stop - start)
+
+        # ||x||^2 is constant along a row, so it is left out of the (chunk, k)
+        # block and only added to the winning distance. Scaling by -2 is
+        # exact, so it is folded into the (small) centroid matrix.
+        if workspace is not None:
+            x_sq = workspace.x_sq[start:stop]
+            sq_dist = np.matmul(
+                X_chunk, neg2_centroids.T, out=workspace.distances[:stop - start, :k]
+            )
+        else:
+            x_sq = np.einsum("ij,ij->i", X_chunk, X_chunk)
+            sq_dist = X_chunk @ neg2_centroids.T
+        sq_dist += c_sq[np.newaxis, :]
+
+        chunk_labels = np.argmin(sq_dist, axis=1, out=labels[start:stop])
+        best = sq_dist[idx, chunk_labels]
+
+        if k > 1:
+            # Rounding error of the expansion is bounded by a multiple of
+            # eps * (||x||^2 + ||c||^2); only near-ties can be affected.
+            sq_dist[idx, chunk_labels] = np.inf
+            gap = sq_dist.min(axis=1) - best
+            ambiguous = np.flatnonzero(gap <= error_scale * (x_sq + c_sq_max))
+        else:
+            ambiguous = idx[:0]
+        best += x_sq
+
+        for a_start in range(0, ambiguous.size, exact_rows):
+            rows_idx = ambiguous[a_start:a_start + exact_rows]
+            diff = X_chunk[rows_idx, np.newaxis, :] - centroids[np.newaxis, :, :]
+            distances = np.linalg.norm(diff, axis=2)
+            exact_labels = np.argmin(distances, axis=1)
+            chunk_labels[rows_idx] = exact_labels
+            best[rows_idx] = distances[np.arange(rows_idx.size), exact_labels] ** 2
+
+        np.maximum(best, 0.0, out=min_sq_dist[start:stop])
+
+    return labels, min_sq_dist
+
+
+def _sq_residuals(
+    X: np.ndarray,
+    labels: np.ndarray,
+    centroids: np.ndarray,
+    chunk_size: Optional[int] = None,
+    memory_budget: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Squared distance from each sample to its assigned centroid, computed in
+    row chunks so no full (n_samples, n_features) residual is allocated.
+    """
+    n_samples, n_features = X.shape
+    dtype = np.result_type(X.dtype, centroids.dtype, np.float32)
+    out = np.empty(n_samples, dtype=dtype)
+    rows = _rows_per_chunk(
+        n_samples, max(1, n_features) * np.dtype(dtype).itemsize,
+        chunk_size, memory_budget,
+    )
+    for start in range(0, n_samples, rows):
+        stop = min(start + rows, n_samples)
+        diff = X[start:stop] - centroids[labels[start:stop]]
+        np.einsum("ij,ij->i", diff, diff, out=out[start:stop])
+    return out
+
+
+def assign_clusters(
+    X: np.ndarray,
+    centroids: np.ndarray,
+    chunk_size: Optional[int] = None,
+    memory_budget: Optional[int] = None,
+    method: str = "auto",
+) -> np.ndarray:
     """
     Assign each sample to the nearest centroid (Euclidean distance).
+
+    Distances are computed in row chunks, so peak memory is
+    O(chunk_size * k) rather than O(n_samples * k * n_features).
+
+    Parameters
+    ----------
+    X : ndarray of shape (n_samples, n_features)
+    centroids : ndarray of shape (k, n_features)
+    chunk_size : int or None, default None
+        Number of rows per chunk. If None, it is derived from memory_budget.
+    memory_budget : int or None, default None
+        Approximate working memory in bytes for one chunk. If None,
+        DEFAULT_MEMORY_BUDGET is used.
+    method : {"auto", "brute", "kdtree", "filtering"}, default "auto"
+        Search backend; all give the same labels.
+
+        - "brute": chunked distance block (one matrix product per chunk).
+        - "kdtree": KD-tree over the centroids, queried in parallel
+          (faster for many centroids in few dimensions).
+        - "filtering": KD-tree over the data (Kanungo et al.). Building
+          the tree costs more than one brute-force pass, so this only pays
+          off when the tree is reused, as in ``kmeans(assign="filtering")``.
+        - "auto": "kdtree" or "brute" depending on k and n_features, see
+          ``spatial.choose_assign_method``.
+
+    Returns
+    -------
+    labels : ndarray of shape (n_samples,)
     """
-    # X: (n_samples, n_features)
-    # centroids: (k, n_features)
-    # Broadcast to compute distances
-    diff = X[:, np.newaxis, :] - centroids[np.newaxis, :, :]
-    distances = np.linalg.norm(diff, axis=2)  # (n_samples, k)
-    labels = np.argmin(distances, axis=1)
+    labels, _ = _assign(
+        X, centroids, method, chunk_size=chunk_size, memory_budget=memory_budget
+    )
     return labels
 
 
+def _assign(
+    X: np.ndarray,
+    centroids: np.ndarray,
+    method: str,
+    workspace: Optional["KMeansWorkspace"] = None,
+    data_tree=None,
+    chunk_size: Optional[int] = None,
+    memory_budget: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Labels and squared distances to the nearest centroid with the given
+    backend ("auto" must be resolved by the caller or is resolved here).
+    """
+    # Deferred: spatial builds on this module (and imports scipy.spatial).
+    from . import spatial
+
+    if method == "auto":
+        method = spatial.choose_assign_method(centroids.shape[0], X.shape[1])
+    if method == "brute":
+        return _nearest_centroid(
+            X, centroids, chunk_size=chunk_size, memory_budget=memory_budget,
+            workspace=workspace,
+        )
+    if method == "kdtree":
+        return spatial.kdtree_nearest(
+            X, centroids, chunk_size=chunk_size, memory_budget=memory_budget
+        )
+    if method == "filtering":
+        if data_tree is None:
+            data_tree = spatial.DataKDTree(X)
+        labels, min_sq_dist, _ = data_tree.nearest(centroids)
+        return labels, min_sq_dist
+    raise ValueError(
+        f"Unknown assignment method '{method}'. Use one of {spatial.ASSIGN_METHODS}."
+    )
+
+
+def _check_sample_weight(
+    sample_weight: Optional[np.ndarray],
+    n_samples: int,
+) -> Optional[np.ndarray]:
+    """
+    Validate an optional per-sample weight vector.
+    """
+    if sample_weight is None:
+        return None
+    sample_weight = np.asarray(sample_weight, dtype=float)
+    if sample_weight.shape != (n_samples,):
+        raise ValueError("sample_weight must have shape (n_samples,).")
+    if np.any(sample_weight < 0):
+        raise ValueError("sample_weight must be non-negative.")
+    return sample_weight
+
+
+def _float_dtype(X: np.ndarray) -> np.dtype:
+    """
+    Floating-point dtype for arrays derived from X: X's own dtype if it is
+    floating (so float32 input stays float32), otherwise float64.
+    """
+    if np.issubdtype(X.dtype, np.floating):
+        return X.dtype
+    return np.dtype(np.float64)
+
+
+# Rows per sparse product in _cluster_sums; partial sums are accumulated
+# in float64 so float32 input does not lose precision over many rows.
+_SUM_CHUNK_ROWS = 65536
+
+
+def _cluster_sums(
+    X: np.ndarray,
+    labels: np.ndarray,
+    k: int,
+    sample_weight: Optional[np.ndarray] = None,
+    workspace: Optional["KMeansWorkspace"] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Per-cluster (weighted) feature sums and counts in a single pass.
+
+    The sums are computed as a sparse one-hot (k, rows) matrix times each
+    block of rows of X, in X's own precision, so no per-cluster copies of X
+    are made and float32 input is never upcast as a whole. The one-hot
+    matrix is built directly in CSC form (one entry per column), which
+    needs no sorting; with a workspace its index and value arrays are
+    reused and the results are written into its buffers.
+
+    Returns
+    -------
+    sums : ndarray of shape (k, n_features), float64
+    counts : ndarray of shape (k,), float64
+        Number of samples (or total weight) in each cluster.
+    """
+    n_samples, n_features = X.shape
+    dtype = _float_dtype(X)
+    block = min(n_samples, _SUM_CHUNK_ROWS)
+    if workspace is not None:
+        sums = workspace.sums[:k]
+        sums.fill(0.0)
+        ones, indptr = workspace.ones, workspace.indptr
+    else:
+        sums = np.zeros((k, n_features))
+        ones, indptr = np.ones(block, dtype=dtype), np.arange(block + 1)
+
+    for start in range(0, n_samples, _SUM_CHUNK_ROWS):
+        stop = min(start + _SUM_CHUNK_ROWS, n_samples)
+        m = stop - start
+        if sample_weight is None:
+            weights = ones[:m]
+        else:
+            weights = sample_weight[start:stop].astype(dtype)
+        one_hot = sparse.csc_matrix(
+            (weights, labels[start:stop], indptr[:m + 1]),
+            shape=(k, m),
+        )
+        sums += one_hot @ X[start:stop]
+
+    counts = np.bincount(labels, weights=sample_weight, minlength=k)
+    if workspace is not None:
+        workspace.counts[:k] = counts
+        counts = workspace.counts[:k]
+    else:
+        counts = counts.astype(float)
+    return sums, counts
+
+
+def _update_centroids_into(
+    X: np.ndarray,
+    labels: np.ndarray,
+    k: int,
+    out: np.ndarray,
+    random_state: Optional[int] = None,
+    sample_weight: Optional[np.ndarray] = None,
+    workspace: Optional["KMeansWorkspace"] = None,
+) -> np.ndarray:
+    """
+    ``update_centroids`` writing into a preallocated (k, n_features) array.
+    """
+    sums, counts = _cluster_sums(X, labels, k, sample_weight, workspace)
+
+    non_empty = counts > 0
+    if non_empty.all():
+        np.divide(sums, counts[:, np.newaxis], out=out, casting="unsafe")
+    else:
+        out[non_empty] = sums[non_empty] / counts[non_empty, np.newaxis]
+        # Empty clusters: re-initialise randomly (in cluster order, as before).
+        # The generator is only created when it is actually needed.
+        rng = np.random.RandomState(random_state)
+        for cluster_id in np.flatnonzero(~non_empty):
+            idx = rng.randint(0, X.shape[0])
+            out[cluster_id] = X[idx]
+    return out
+
+
 def update_centroids(
     X: np.ndarray,
     labels: np.ndarray,
     k: int,
     random_state: Optional[int] = None,
+    sample_weight: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """
-    Update centroids by taking the mean of points in each cluster.
+    Update centroids by taking the (weighted) mean of points in each cluster.
     If a cluster becomes empty, re-initialise its centroid randomly from X.
+
+    Parameters
+    ----------
+    X : ndarray of shape (n_samples, n_features)
+    labels : ndarray of shape (n_samples,)
+    k : int
+    random_state : int or None
+        Seed used when re-initialising empty clusters.
+    sample_weight : ndarray of shape (n_samples,) or None
+        Optional non-negative weight per sample. A cluster whose total
+        weight is zero is treated as empty.
+
+    Returns
+    -------
+    new_centroids : ndarray of shape (k, n_features)
+    """
+    sample_weight = _check_sample_weight(sample_weight, X.shape[0])
+    out = np.empty((k, X.shape[1]), dtype=_float_dtype(X))
+    return _update_centroids_into(
+        X, labels, k, out, random_state=random_state, sample_weight=sample_weight
+    )
+
+
+class KMeansWorkspace:
+    """
+    Preallocated work buffers for Lloyd iterations.
+
+    The distance block, row norms, labels, squared distances, per-cluster
+    sums/counts and the new-centroid buffer are allocated once and updated
+    in place on every iteration. One workspace can serve any number of fits
+    on data with the same shape and dtype and at most ``k`` clusters, e.g.
+    the restarts of ``kmeans`` or the fits of an elbow sweep. A workspace
+    must not be shared by fits running concurrently.
+
+    Parameters
+    ----------
+    n_samples, n_features : int
+        Shape of the data.
+    k : int
+        Largest number of clusters the workspace will be used for.
+    dtype : numpy dtype, default float64
+        Floating-point dtype of the data.
+    chunk_size, memory_budget : int or None
+        Row-chunking of the distance block, as in ``assign_clusters``.
     """
-    n_features = X.shape[1]
-    new_centroids = np.zeros((k, n_features), dtype=float)
+
+    def __init__(
+        self,
+        n_samples: int,
+        n_features: int,
+        k: int,
+        dtype: Union[str, np.dtype] = np.float64,
+        chunk_size: Optional[int] = None,
+        memory_budget: Optional[int] = None,
+    ) -> None:
+        if k <= 0:
+            raise ValueError("k must be a positive integer.")
+        dtype = np.dtype(dtype)
+        self.n_samples = n_samples
+        self.n_features = n_features
+        self.k = k
+        self.dtype = dtype
+
+        self.rows = _rows_per_chunk(
+            n_samples, 2 * k * dtype.itemsize, chunk_size, memory_budget
+        )
+        self.distances = np.empty((self.rows, k), dtype=dtype)
+        self.x_sq = np.empty(n_samples, dtype=dtype)
+        self.labels = np.empty(n_samples, dtype=np.intp)
+        self.previous_labels = np.empty(n_samples, dtype=np.intp)
+        self.min_sq_dist = np.empty(n_samples, dtype=dtype)
+        self.c_sq = np.empty(k, dtype=dtype)
+        self.sums = np.empty((k, n_features))
+        self.counts = np.empty(k)
+        self.centroids = np.empty((k, n_features), dtype=dtype)
+
+        block = min(n_samples, _SUM_CHUNK_ROWS)
+        self.ones = np.ones(block, dtype=dtype)
+        self.indptr = np.arange(block + 1)
+
+    @classmethod
+    def for_data(cls, X: np.ndarray, k: int, **kwargs) -> "KMeansWorkspace":
+        """
+        Workspace sized for X and up to k clusters.
+        """
+        return cls(X.shape[0], X.shape[1], k, dtype=_float_dtype(X), **kwargs)
+
+    def fits(self, X: np.ndarray, k: int) -> bool:
+        """
+        True if this workspace can be used for a fit of X with k clusters.
+        """
+        return (
+            X.shape == (self.n_samples, self.n_features)
+            and _float_dtype(X) == self.dtype
+            and k <= self.k
+        )
+
+    def prepare(self, X: np.ndarray) -> None:
+        """
+        Cache the squared row norms of X (constant over a fit).
+        """
+        if X.shape != (self.n_samples, self.n_features):
+            raise ValueError("X does not match the workspace shape.")
+        for start in range(0, self.n_samples, self.rows):
+            stop = min(start + self.rows, self.n_samples)
+            X_chunk = np.asarray(X[start:stop], dtype=self.dtype)
+            np.einsum("ij,ij->i", X_chunk, X_chunk, out=self.x_sq[start:stop])
+
+
+def _restart_seeds(random_state: Optional[int], n_init: int) -> List[Optional[int]]:
+    """
+    Independent seeds for ``n_init`` restarts, derived from ``random_state``.
+
+    A single run uses ``random_state`` itself, so n_init=1 reproduces the
+    single-initialisation result.
+    """
+    if n_init <= 0:
+        raise ValueError("n_init must be a positive integer.")
+    if n_init == 1:
+        return [random_state]
     rng = np.random.RandomState(random_state)
+    return [int(seed) for seed in rng.randint(0, 2 ** 31 - 1, size=n_init)]
 
-    for cluster_id in range(k):
-        mask = labels == cluster_id
-        if not np.any(mask):
-            # Empty cluster: re-initialise randomly
-            idx = rng.randint(0, X.shape[0])
-            new_centroids[cluster_id] = X[idx]
+
+def _kmeans_single(
+    X: np.ndarray,
+    k: int,
+    max_iter: int,
+    tol: float,
+    random_state: Optional[int],
+    init: str,
+    workspace: Optional[KMeansWorkspace] = None,
+    assign_method: str = "brute",
+    data_tree=None,
+    sample_weight: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray, float, Dict[str, object]]:
+    """
+    One Lloyd run from one initialisation; returns labels, centroids,
+    inertia (taken from the final assignment pass) and the run statistics
+    described in ``kmeans``.
+
+    Assignment and update run in place in ``workspace`` (a new one is made
+    if none, or an unsuitable one, is given). ``assign_method`` is a resolved
+    backend of ``assign_clusters`` ("brute", "kdtree" or "filtering", the
+    latter searching ``data_tree``, built here if not given).
+    ``sample_weight`` must already be validated.
+
+    The run stops when the centroid shift falls below tol or when an
+    assignment pass changes no label: the centroids are then already the
+    means of the current partition, so another update would reproduce them
+    exactly and the result is the same as iterating until the shift test.
+    """
+    if workspace is None or not workspace.fits(X, k):
+        workspace = KMeansWorkspace.for_data(X, k)
+    workspace.prepare(X)
+    if assign_method == "filtering" and data_tree is None:
+        from . import spatial
+
+        data_tree = spatial.DataKDTree(X)
+
+    start_time = time.perf_counter()
+    # A copy in the working dtype: the buffer swap below writes into it, and
+    # init_centroids returns rows of X (integer for integer X).
+    centroids = init_centroids(
+        X, k, random_state=random_state, init=init, sample_weight=sample_weight
+    ).astype(workspace.dtype)
+    time_init = time.perf_counter() - start_time
+    new_centroids = workspace.centroids[:k]
+    previous_labels = workspace.previous_labels
+
+    inertia_history: List[float] = []
+    reassigned_history: List[int] = []
+    time_assign = time_update = 0.0
+    n_iter = 0
+    converged = False
+    stable = False
+
+    def assign() -> Tuple[np.ndarray, np.ndarray]:
+        nonlocal time_assign
+        start = time.perf_counter()
+        labels, min_sq_dist = _assign(
+            X, centroids, assign_method, workspace=workspace, data_tree=data_tree
+        )
+        if inertia_history:
+            n_reassigned = int(np.count_nonzero(labels != previous_labels))
+        else:
+            n_reassigned = labels.shape[0]
+        np.copyto(previous_labels, labels)
+        if sample_weight is None:
+            inertia_history.append(float(min_sq_dist.sum(dtype=np.float64)))
         else:
-            new_centroids[cluster_id] = X[mask].mean(axis=0)
+            inertia_history.append(float(np.dot(sample_weight, min_sq_dist)))
+        reassigned_history.append(n_reassigned)
+        time_assign += time.perf_counter() - start
+        return labels, min_sq_dist
 
-    return new_centroids
+    for _ in range(max_iter):
+        labels, min_sq_dist = assign()
+        if len(reassigned_history) > 1 and reassigned_history[-1] == 0:
+            converged = stable = True
+            break
+
+        start = time.perf_counter()
+        _update_centroids_into(
+            X, labels, k, new_centroids, random_state=random_state,
+            sample_weight=sample_weight, workspace=workspace,
+        )
+        shift = np.linalg.norm(new_centroids - centroids)
+        # Swap buffers: the old centroids become the next output buffer
+        centroids, new_centroids = new_centroids, centroids
+        time_update += time.perf_counter() - start
+        n_iter += 1
+        if shift < tol:
+            converged = True
+            break
+
+    if not stable:
+        labels, min_sq_dist = assign()
+
+    stats: Dict[str, object] = {
+        "n_iter": n_iter,
+        "converged": converged,
+        "assign": assign_method,
+        "inertia_per_iter": inertia_history,
+        "n_reassigned_per_iter": reassigned_history,
+        "time_init": time_init,
+        "time_assign": time_assign,
+        "time_update": time_update,
+    }
+    return labels.copy(), centroids.copy(), inertia_history[-1], stats
 
 
 def kmeans(
@@ -76,10 +802,23 @@ def kmeans(
     max_iter: int = 300,
     tol: float = 1e-4,
     random_state: Optional[int] = None,
-) -> Tuple[np.ndarray, np.ndarray]:
+    init: Union[str, np.ndarray] = "k-means++",
+    n_init: int = 1,
+    n_jobs: Optional[int] = None,
+    backend: str = "threads",
+    return_inertia: bool = False,
+    dtype: Optional[Union[str, np.dtype]] = None,
+    workspace: Optional[KMeansWorkspace] = None,
+    return_stats: bool = False,
+    assign: str = "auto",
+    sample_weight: Optional[np.ndarray] = None,
+):
     """
     Simple manual K-means implementation.
 
+    Centroids and all intermediate buffers use X's floating-point precision
+    (float32 input stays float32); integer input is computed in float64.
+
     Parameters
     ----------
     X : ndarray of shape (n_samples, n_features)
@@ -90,50 +829,926 @@ def kmeans(
     tol : float, default 1e-4
         Convergence tolerance on centroid movement.
     random_state : int or None
+    init : {"k-means++", "random", "k-means||"} or ndarray, default "k-means++"
+        Seeding method or explicit starting centroids, see ``init_centroids``.
+    n_init : int, default 1
+        Number of restarts. Each restart gets its own seed derived from
+        random_state and the lowest-inertia run is returned (the earliest
+        restart wins ties), independently of how the restarts are scheduled.
+    n_jobs : int or None, default None
+        Number of restarts run concurrently (-1 for all CPUs).
+    backend : {"threads", "processes"}, default "threads"
+        Pool used when n_jobs > 1. Worker processes read X (and
+        sample_weight) from shared memory rather than a pickled copy.
+    return_inertia : bool, default False
+        If True, also return the inertia, taken from the squared distances
+        of the final assignment pass (no extra pass over X).
+    dtype : str, numpy dtype or None, default None
+        If given, X is converted to this dtype (e.g. "float32") first.
+    workspace : KMeansWorkspace or None, default None
+        Preallocated buffers to run in. If None, one is created and shared
+        by all restarts run serially (concurrent restarts get their own).
+        Pass the same workspace to repeated fits of the same data shape,
+        e.g. over several k, to avoid reallocating it.
+    return_stats : bool, default False
+        If True, also return a dict describing the selected run:
+
+        - "n_iter": number of centroid updates performed
+        - "converged": False if max_iter was reached first
+        - "assign": the assignment backend used
+        - "inertia_per_iter": inertia after each assignment pass
+        - "n_reassigned_per_iter": points whose label changed in each
+          assignment pass (all points for the first one)
+        - "time_init", "time_assign", "time_update": wall time in seconds
+          spent in seeding, assignment and update
+    assign : {"auto", "brute", "kdtree", "filtering"}, default "auto"
+        Nearest-centroid search backend, see ``assign_clusters``; the
+        result is the same with every backend. With "filtering" the KD-tree
+        over X is built once and shared by all iterations and restarts (each
+        restart builds its own with backend="processes").
+    sample_weight : ndarray of shape (n_samples,) or None, default None
+        Optional non-negative weight per sample (e.g. the weights of a
+        coreset, see ``build_coreset``). Seeding, centroid updates and the
+        inertia are then weighted.
+
+    Iterations stop when the centroid shift is below tol or when an
+    assignment pass leaves every label unchanged (the centroids are then
+    already final).
 
     Returns
     -------
     labels : ndarray of shape (n_samples,)
     centroids : ndarray of shape (k, n_features)
+    inertia : float, only if return_inertia is True
+    stats : dict, only if return_stats is True
     """
     if not isinstance(X, np.ndarray):
         raise TypeError("X must be a NumPy array.")
+    if dtype is not None:
+        X = X.astype(dtype, copy=False)
 
-    centroids = init_centroids(X, k, random_state=random_state)
-    for _ in range(max_iter):
-        labels = assign_clusters(X, centroids)
+    from . import spatial
+
+    if assign not in spatial.ASSIGN_METHODS:
+        raise ValueError(
+            f"Unknown assignment method '{assign}'. Use one of {spatial.ASSIGN_METHODS}."
+        )
+    if assign == "auto":
+        assign = spatial.choose_assign_method(k, X.shape[1])
+    sample_weight = _check_sample_weight(sample_weight, X.shape[0])
+
+    seeds = _restart_seeds(random_state, n_init)
+    in_workers = min(effective_n_jobs(n_jobs), len(seeds)) > 1
+    if in_workers:
+        workspace = None
+    elif workspace is None:
+        workspace = KMeansWorkspace.for_data(X, k)
+    # Worker processes receive X through shared memory (see parallel_map);
+    # a tree built here would hold X and be pickled with it.
+    data_tree = None
+    if assign == "filtering" and not (in_workers and backend == "processes"):
+        data_tree = spatial.DataKDTree(X)
+    runs = parallel_map(
+        partial(
+            _kmeans_single, X, k, max_iter, tol, init=init, workspace=workspace,
+            assign_method=assign, data_tree=data_tree, sample_weight=sample_weight,
+        ),
+        seeds,
+        n_jobs=n_jobs,
+        backend=backend,
+    )
+    best = min(range(len(runs)), key=lambda i: runs[i][2])
+    labels, centroids, inertia, stats = runs[best]
+    result = [labels, centroids]
+    if return_inertia:
+        result.append(inertia)
+    if return_stats:
+        result.append(stats)
+    return tuple(result)
+
+
+def _exact_distances(
+    X: np.ndarray,
+    centroids: np.ndarray,
+    memory_budget: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Direct Euclidean distances ``np.linalg.norm(x - c)``, computed in row
+    chunks so the difference tensor stays within the memory budget.
+    """
+    n_samples, n_features = X.shape
+    k = centroids.shape[0]
+    dtype = np.result_type(X.dtype, centroids.dtype, np.float32)
+    distances = np.empty((n_samples, k), dtype=dtype)
+    row_bytes = k * max(1, n_features) * np.dtype(dtype).itemsize
+    rows = _rows_per_chunk(n_samples, row_bytes, memory_budget=memory_budget)
+    for start in range(0, n_samples, rows):
+        stop = min(start + rows, n_samples)
+        diff = X[start:stop, np.newaxis, :] - centroids[np.newaxis, :, :]
+        distances[start:stop] = np.linalg.norm(diff, axis=2)
+    return distances
+
+
+def _half_centroid_gaps(
+    centroids: np.ndarray,
+    slack: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Half of the centroid-to-centroid distances, shrunk by ``slack`` so that
+    rounding can never make a pruning test too aggressive.
+
+    Returns
+    -------
+    half_cc : ndarray of shape (k, k)
+    half_min : ndarray of shape (k,)
+        For each centroid, half the distance to its nearest other centroid
+        (``inf`` when k == 1).
+    """
+    half_cc = 0.5 * _exact_distances(centroids, centroids) * (1.0 - slack)
+    off_diag = half_cc.copy()
+    np.fill_diagonal(off_diag, np.inf)
+    return half_cc, off_diag.min(axis=1)
+
+
+def _elkan_assign(
+    X: np.ndarray,
+    centroids: np.ndarray,
+    labels: np.ndarray,
+    upper: np.ndarray,
+    lower: np.ndarray,
+    slack: float,
+) -> int:
+    """
+    One Elkan assignment pass, updating labels and bounds in place.
+
+    ``upper`` holds an upper bound on each point's distance to its assigned
+    centroid and ``lower`` (n_samples, k) lower bounds on the distances to
+    every centroid. Candidates are visited in increasing centroid order and
+    ties go to the lowest index, so the labels equal ``assign_clusters``.
+
+    Returns the number of point-to-centroid distances evaluated.
+    """
+    k = centroids.shape[0]
+    half_cc, half_min = _half_centroid_gaps(centroids, slack)
+
+    active = np.flatnonzero(upper >= half_min[labels])
+    if active.size == 0:
+        return 0
+
+    # Candidate centroids under the loose upper bound; u only shrinks from
+    # here on, so this is a superset of the centroids that can win.
+    a = labels[active]
+    u = upper[active]
+    low = lower[active]
+    maybe = (u[:, np.newaxis] >= low) & (u[:, np.newaxis] >= half_cc[a])
+    maybe[np.arange(active.size), a] = False
+    keep = np.flatnonzero(maybe.any(axis=1))
+    if keep.size == 0:
+        return 0
+    active, a, low, maybe = active[keep], a[keep], low[keep], maybe[keep]
+
+    # Tighten the upper bound to the exact distance to the current centroid
+    u = np.linalg.norm(X[active] - centroids[a], axis=1)
+    n_computed = active.size
+    low[np.arange(active.size), a] = u
+
+    for j in np.flatnonzero(maybe.any(axis=0)):
+        candidates = np.flatnonzero(maybe[:, j])
+        candidates = candidates[
+            (u[candidates] >= low[candidates, j])
+            & (u[candidates] >= half_cc[a[candidates], j])
+        ]
+        if candidates.size == 0:
+            continue
+        d = np.linalg.norm(X[active[candidates]] - centroids[j], axis=1)
+        n_computed += candidates.size
+        low[candidates, j] = d
+
+        u_c = u[candidates]
+        better = (d < u_c) | ((d == u_c) & (j < a[candidates]))
+        switch = candidates[better]
+        a[switch] = j
+        u[switch] = d[better]
+
+    labels[active] = a
+    upper[active] = u
+    lower[active] = low
+    return n_computed
+
+
+def _hamerly_assign(
+    X: np.ndarray,
+    centroids: np.ndarray,
+    labels: np.ndarray,
+    upper: np.ndarray,
+    lower: np.ndarray,
+    slack: float,
+) -> int:
+    """
+    One Hamerly assignment pass, updating labels and bounds in place.
+
+    Like ``_elkan_assign`` but with a single lower bound per point (on the
+    distance to the second-closest centroid), so memory is O(n_samples).
+
+    Returns the number of point-to-centroid distances evaluated.
+    """
+    _, half_min = _half_centroid_gaps(centroids, slack)
+    bound = np.maximum(half_min[labels], lower)
+
+    active = np.flatnonzero(upper >= bound)
+    if active.size == 0:
+        return 0
+
+    upper[active] = np.linalg.norm(X[active] - centroids[labels[active]], axis=1)
+    n_computed = active.size
+
+    active = active[upper[active] >= bound[active]]
+    if active.size:
+        distances = _exact_distances(X[active], centroids)
+        n_computed += distances.size
+        _bounds_from_distances(distances, active, labels, upper, lower)
+    return n_computed
+
+
+def _bounds_from_distances(
+    distances: np.ndarray,
+    rows: np.ndarray,
+    labels: np.ndarray,
+    upper: np.ndarray,
+    second: np.ndarray,
+) -> None:
+    """
+    Fill labels, the distance to the closest centroid and the distance to
+    the second-closest centroid for ``rows`` from a full distance block.
+    """
+    idx = np.arange(distances.shape[0])
+    closest = np.argmin(distances, axis=1)
+    labels[rows] = closest
+    upper[rows] = distances[idx, closest]
+    distances[idx, closest] = np.inf
+    second[rows] = distances.min(axis=1)
+
+
+def _move_bounds(
+    upper: np.ndarray,
+    lower: np.ndarray,
+    labels: np.ndarray,
+    move: np.ndarray,
+    slack: float,
+) -> None:
+    """
+    Loosen the bounds in place after the centroids moved by ``move``.
+
+    ``lower`` is either (n_samples, k) for Elkan or (n_samples,) for Hamerly.
+    """
+    upper += move[labels]
+    upper *= 1.0 + slack
+    if lower.ndim == 2:
+        lower -= move[np.newaxis, :]
+    else:
+        # Largest movement of any centroid other than the assigned one
+        order = np.argsort(move)[::-1]
+        largest = np.full(labels.shape[0], move[order[0]])
+        if move.size > 1:
+            largest[labels == order[0]] = move[order[1]]
+        lower -= largest
+    np.maximum(lower, 0.0, out=lower)
+    lower *= 1.0 - slack
+
+
+def _bounded_kmeans(
+    X: np.ndarray,
+    k: int,
+    max_iter: int,
+    tol: float,
+    random_state: Optional[int],
+    init: str,
+    method: str,
+) -> Tuple[np.ndarray, np.ndarray, Dict[str, object]]:
+    """
+    Shared driver for the Elkan and Hamerly variants.
+
+    The iteration mirrors ``kmeans`` step for step (same initialisation,
+    same ``update_centroids`` call, same convergence tests), only the
+    assignment step is replaced by a bound-pruned search.
+    """
+    if not isinstance(X, np.ndarray):
+        raise TypeError("X must be a NumPy array.")
+
+    n_samples = X.shape[0]
+    centroids = init_centroids(X, k, random_state=random_state, init=init)
+    dtype = np.result_type(X.dtype, centroids.dtype, np.float32)
+    # Relative safety margin applied to every bound update.
+    slack = 64 * np.finfo(dtype).eps
+
+    labels = np.empty(n_samples, dtype=np.intp)
+    upper = np.empty(n_samples, dtype=dtype)
+    if method == "elkan":
+        lower = _exact_distances(X, centroids)
+        _bounds_from_distances(
+            lower.copy(), np.arange(n_samples), labels, upper,
+            np.empty(n_samples, dtype=dtype),
+        )
+        assign_step = _elkan_assign
+    else:
+        lower = np.empty(n_samples, dtype=dtype)
+        distances = _exact_distances(X, centroids)
+        _bounds_from_distances(distances, np.arange(n_samples), labels, upper, lower)
+        del distances
+        assign_step = _hamerly_assign
+
+    n_computed = n_samples * k
+    n_passes = 1
+    n_iter = 0
+    converged = False
+    stable = False
+    reassigned_history = [n_samples]
+    time_assign = time_update = 0.0
+    previous_labels = labels.copy()
+
+    for it in range(max_iter):
+        if it > 0:
+            start = time.perf_counter()
+            n_computed += assign_step(X, centroids, labels, upper, lower, slack)
+            n_passes += 1
+            reassigned_history.append(int(np.count_nonzero(labels != previous_labels)))
+            np.copyto(previous_labels, labels)
+            time_assign += time.perf_counter() - start
+            if reassigned_history[-1] == 0:
+                # Same partition, so the update would not move any centroid
+                converged = stable = True
+                break
+        start = time.perf_counter()
         new_centroids = update_centroids(X, labels, k, random_state=random_state)
+        move = np.linalg.norm(new_centroids - centroids, axis=1)
         shift = np.linalg.norm(new_centroids - centroids)
         centroids = new_centroids
+        _move_bounds(upper, lower, labels, move, slack)
+        time_update += time.perf_counter() - start
+        n_iter += 1
         if shift < tol:
+            converged = True
+            break
+
+    if n_iter > 0 and not stable:
+        start = time.perf_counter()
+        n_computed += assign_step(X, centroids, labels, upper, lower, slack)
+        n_passes += 1
+        reassigned_history.append(int(np.count_nonzero(labels != previous_labels)))
+        time_assign += time.perf_counter() - start
+
+    n_total = n_passes * n_samples * k
+    stats = {
+        "n_iter": n_iter,
+        "converged": converged,
+        "n_reassigned_per_iter": reassigned_history,
+        "time_assign": time_assign,
+        "time_update": time_update,
+        "n_distances_total": n_total,
+        "n_distances_computed": n_computed,
+        "n_distances_skipped": n_total - n_computed,
+    }
+    return labels, centroids, stats
+
+
+def _with_extras(
+    X: np.ndarray,
+    labels: np.ndarray,
+    centroids: np.ndarray,
+    stats: Dict[str, object],
+    return_inertia: bool,
+    return_stats: bool,
+):
+    """
+    Build the (labels, centroids[, inertia][, stats]) return value of the
+    bound-accelerated variants.
+    """
+    result = [labels, centroids]
+    if return_inertia:
+        # Bounds are not exact distances, so sum the residuals in chunks
+        result.append(float(_sq_residuals(X, labels, centroids).sum(dtype=np.float64)))
+    if return_stats:
+        result.append(stats)
+    return tuple(result)
+
+
+def kmeans_elkan(
+    X: np.ndarray,
+    k: int,
+    max_iter: int = 300,
+    tol: float = 1e-4,
+    random_state: Optional[int] = None,
+    init: str = "k-means++",
+    return_inertia: bool = False,
+    return_stats: bool = False,
+):
+    """
+    K-means accelerated with Elkan's triangle-inequality bounds.
+
+    Keeps an upper bound per point and a lower bound per (point, centroid)
+    pair, together with the centroid-to-centroid distances, so that most
+    distance evaluations are skipped once points stop changing cluster.
+    Returns the same labels and centroids as ``kmeans`` for the same seed.
+    Memory for the bounds is O(n_samples * k).
+
+    Parameters
+    ----------
+    X : ndarray of shape (n_samples, n_features)
+    k : int
+    max_iter : int, default 300
+    tol : float, default 1e-4
+    random_state : int or None
+    init : {"k-means++", "random", "k-means||"}, default "k-means++"
+    return_inertia : bool, default False
+        If True, also return the inertia of the final solution.
+    return_stats : bool, default False
+        If True, also return a dict with "n_iter", "converged",
+        "n_reassigned_per_iter", "time_assign" and "time_update" (as in
+        ``kmeans``; no per-iteration inertia, since the bounds are not
+        exact distances) plus "n_distances_total", "n_distances_computed"
+        and "n_distances_skipped".
+
+    Returns
+    -------
+    labels : ndarray of shape (n_samples,)
+    centroids : ndarray of shape (k, n_features)
+    inertia : float, only if return_inertia is True
+    stats : dict, only if return_stats is True
+    """
+    labels, centroids, stats = _bounded_kmeans(
+        X, k, max_iter, tol, random_state, init, method="elkan"
+    )
+    return _with_extras(X, labels, centroids, stats, return_inertia, return_stats)
+
+
+def kmeans_hamerly(
+    X: np.ndarray,
+    k: int,
+    max_iter: int = 300,
+    tol: float = 1e-4,
+    random_state: Optional[int] = None,
+    init: str = "k-means++",
+    return_inertia: bool = False,
+    return_stats: bool = False,
+):
+    """
+    K-means accelerated with Hamerly's bounds.
+
+    Keeps one upper and one lower bound per point (O(n_samples) memory),
+    which prunes less than Elkan's method for large k but is cheaper per
+    iteration. Returns the same labels and centroids as ``kmeans`` for the
+    same seed. Parameters and return values are as for ``kmeans_elkan``.
+    """
+    labels, centroids, stats = _bounded_kmeans(
+        X, k, max_iter, tol, random_state, init, method="hamerly"
+    )
+    return _with_extras(X, labels, centroids, stats, return_inertia, return_stats)
+
+
+class MiniBatchKMeans:
+    """
+    Mini-batch K-means with an incremental ``partial_fit`` API.
+
+    Each call to ``partial_fit`` assigns a batch to the current centroids
+    and moves every centroid to the running mean of all points it has been
+    assigned so far (a per-centre learning rate of 1 / count). Only one
+    batch is held in memory at a time, so data that does not fit in RAM can
+    be clustered by feeding it chunk by chunk.
+
+    Parameters
+    ----------
+    k : int
+        Number of clusters.
+    random_state : int or None
+        Seed used to pick the initial centroids from the first batch.
+    init : {"k-means++", "random", "k-means||"}, default "k-means++"
+        Seeding method applied to the first batch.
+
+    Attributes
+    ----------
+    centroids_ : ndarray of shape (k, n_features) or None
+    counts_ : ndarray of shape (k,) or None
+        Number of samples assigned to each centroid so far.
+    n_batches_ : int
+    """
+
+    def __init__(
+        self,
+        k: int,
+        random_state: Optional[int] = None,
+        init: str = "k-means++",
+    ) -> None:
+        if k <= 0:
+            raise ValueError("k must be a positive integer.")
+        self.k = k
+        self.random_state = random_state
+        self.init = init
+        self.centroids_: Optional[np.ndarray] = None
+        self.counts_: Optional[np.ndarray] = None
+        self.n_batches_ = 0
+
+    def partial_fit(self, X: np.ndarray) -> "MiniBatchKMeans":
+        """
+        Update the centroids with one batch of samples.
+
+        The first batch must contain at least k rows.
+        """
+        if not isinstance(X, np.ndarray):
+            raise TypeError("X must be a NumPy array.")
+        if X.shape[0] == 0:
+            return self
+
+        if self.centroids_ is None:
+            self.centroids_ = init_centroids(
+                X, self.k, random_state=self.random_state, init=self.init
+            ).astype(_float_dtype(X))
+            self.counts_ = np.zeros(self.k)
+
+        labels = assign_clusters(X, self.centroids_)
+        sums, counts = _cluster_sums(X, labels, self.k)
+
+        new_counts = self.counts_ + counts
+        hit = counts > 0
+        self.centroids_[hit] += (
+            sums[hit] - counts[hit, np.newaxis] * self.centroids_[hit]
+        ) / new_counts[hit, np.newaxis]
+        self.counts_ = new_counts
+        self.n_batches_ += 1
+        return self
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """
+        Assign each sample to the nearest fitted centroid.
+        """
+        if self.centroids_ is None:
+            raise ValueError("MiniBatchKMeans must be fitted before predict.")
+        return assign_clusters(X, self.centroids_)
+
+
+def minibatch_kmeans(
+    X: np.ndarray,
+    k: int,
+    batch_size: int = 1024,
+    n_epochs: int = 10,
+    tol: float = 1e-4,
+    random_state: Optional[int] = None,
+    init: str = "k-means++",
+    return_inertia: bool = False,
+):
+    """
+    Mini-batch K-means on an in-memory array.
+
+    Parameters
+    ----------
+    X : ndarray of shape (n_samples, n_features)
+    k : int
+    batch_size : int, default 1024
+        Number of rows per mini-batch.
+    n_epochs : int, default 10
+        Maximum number of shuffled passes over X.
+    tol : float, default 1e-4
+        Stop when the centroids move less than this over a whole epoch.
+    random_state : int or None
+    init : {"k-means++", "random", "k-means||"}, default "k-means++"
+    return_inertia : bool, default False
+        If True, also return the inertia from the final assignment pass.
+
+    Returns
+    -------
+    labels : ndarray of shape (n_samples,)
+    centroids : ndarray of shape (k, n_features)
+    inertia : float, only if return_inertia is True
+    """
+    if not isinstance(X, np.ndarray):
+        raise TypeError("X must be a NumPy array.")
+    if batch_size <= 0:
+        raise ValueError("batch_size must be a positive integer.")
+
+    n_samples = X.shape[0]
+    if k > n_samples:
+        raise ValueError("k cannot be larger than the number of samples.")
+
+    model = MiniBatchKMeans(k, random_state=random_state, init=init)
+    rng = np.random.RandomState(random_state)
+    # Start from the same centroids as kmeans with the same seed
+    model.centroids_ = init_centroids(
+        X, k, random_state=random_state, init=init
+    ).astype(_float_dtype(X))
+    model.counts_ = np.zeros(k)
+
+    for _ in range(n_epochs):
+        previous = model.centroids_.copy()
+        order = rng.permutation(n_samples)
+        for start in range(0, n_samples, batch_size):
+            model.partial_fit(X[order[start:start + batch_size]])
+        if np.linalg.norm(model.centroids_ - previous) < tol:
             break
 
-    labels = assign_clusters(X, centroids)
+    centroids = model.centroids_
+    labels, min_sq_dist = _nearest_centroid(X, centroids)
+    if return_inertia:
+        return labels, centroids, float(min_sq_dist.sum(dtype=np.float64))
     return labels, centroids
 
 
+def warm_start_centroids(
+    X: np.ndarray,
+    labels: np.ndarray,
+    centroids: np.ndarray,
+    random_state: Optional[int] = None,
+    sample_weight: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Starting centroids for k + 1 clusters from a k-cluster solution.
+
+    The cluster with the highest within-cluster sum of squares is split in
+    two with a 2-means on its own points; all other centroids are kept.
+
+    Parameters
+    ----------
+    X : ndarray of shape (n_samples, n_features)
+    labels : ndarray of shape (n_samples,)
+    centroids : ndarray of shape (k, n_features)
+    random_state : int or None
+    sample_weight : ndarray of shape (n_samples,) or None
+        Optional weight per sample, for the sums of squares and the split.
+
+    Returns
+    -------
+    new_centroids : ndarray of shape (k + 1, n_features)
+    """
+    k = centroids.shape[0]
+    if k >= X.shape[0]:
+        raise ValueError("k cannot be larger than the number of samples.")
+
+    sample_weight = _check_sample_weight(sample_weight, X.shape[0])
+    residuals = _sq_residuals(X, labels, centroids)
+    if sample_weight is not None:
+        residuals *= sample_weight
+    sse = np.bincount(labels, weights=residuals, minlength=k)
+    worst = int(np.argmax(sse))
+    members = np.flatnonzero(labels == worst)
+
+    if sse[worst] <= 0 or members.size < 2:
+        # Nothing to split: add a data point that is not already a centroid
+        _, min_sq_dist = _nearest_centroid(X, centroids)
+        extra = X[int(np.argmax(min_sq_dist))]
+        return np.vstack([centroids, extra])
+
+    member_weight = None if sample_weight is None else sample_weight[members]
+    _, halves = kmeans(
+        X[members], 2, random_state=random_state, sample_weight=member_weight
+    )
+    new_centroids = np.vstack([centroids, halves[1]])
+    new_centroids[worst] = halves[0]
+    return new_centroids
+
+
+class BisectingTree:
+    """
+    Split history of a ``bisecting_kmeans`` fit.
+
+    Clusters are numbered in the order they were created: the split at
+    step s (s = 1, ..., k - 1) keeps one half under its parent's label and
+    gives the other half label s. The partition into k' <= k clusters is
+    therefore the fitted one with every label >= k' mapped back to its
+    ancestor below k', so one fit gives labels, centroids and inertia for
+    every number of clusters up to k.
+
+    Attributes
+    ----------
+    parent : ndarray of shape (k,)
+        Label of the cluster each cluster was split from (-1 for 0).
+    sums : ndarray of shape (k, n_features)
+        Per-cluster feature sums of the final partition (float64).
+    counts : ndarray of shape (k,)
+        Per-cluster sizes of the final partition.
+    inertia_path : ndarray of shape (k,)
+        ``inertia_path[k' - 1]`` is the inertia of the k'-cluster partition.
+    leaf_labels : ndarray of shape (n_samples,)
+        Labels of the final partition.
+    """
+
+    def __init__(
+        self,
+        parent: np.ndarray,
+        sums: np.ndarray,
+        counts: np.ndarray,
+        inertia_path: np.ndarray,
+        leaf_labels: np.ndarray,
+        dtype: Union[str, np.dtype] = np.float64,
+    ) -> None:
+        self.parent = parent
+        self.sums = sums
+        self.counts = counts
+        self.inertia_path = inertia_path
+        self.leaf_labels = leaf_labels
+        self.dtype = np.dtype(dtype)
+
+    @property
+    def k(self) -> int:
+        return self.parent.shape[0]
+
+    def _check_k(self, k: int) -> None:
+        if not 1 <= k <= self.k:
+            raise ValueError(f"k must be between 1 and {self.k}.")
+
+    def ancestors(self, k: int) -> np.ndarray:
+        """
+        Label in the k-cluster partition of each final cluster.
+        """
+        self._check_k(k)
+        mapping = np.arange(self.k)
+        # Parents have lower labels, so they are mapped before their children
+        for label in range(k, self.k):
+            mapping[label] = mapping[self.parent[label]]
+        return mapping
+
+    def labels(self, k: int) -> np.ndarray:
+        """
+        Labels of the k-cluster partition.
+        """
+        return self.ancestors(k)[self.leaf_labels]
+
+    def centroids(self, k: int) -> np.ndarray:
+        """
+        Centroids (cluster means) of the k-cluster partition.
+        """
+        mapping = self.ancestors(k)
+        sums = np.zeros((k, self.sums.shape[1]))
+        np.add.at(sums, mapping, self.sums)
+        counts = np.bincount(mapping, weights=self.counts, minlength=k)
+        return (sums / counts[:, np.newaxis]).astype(self.dtype)
+
+    def inertia(self, k: int) -> float:
+        """
+        Inertia of the k-cluster partition.
+        """
+        self._check_k(k)
+        return float(self.inertia_path[k - 1])
+
+
+def bisecting_kmeans(
+    X: np.ndarray,
+    k: int,
+    max_iter: int = 300,
+    tol: float = 1e-4,
+    random_state: Optional[int] = None,
+    init: str = "k-means++",
+    n_init: int = 1,
+    return_inertia: bool = False,
+    return_tree: bool = False,
+):
+    """
+    Bisecting K-means: starting from a single cluster, repeatedly split the
+    cluster with the highest within-cluster sum of squares in two with a
+    2-means on its own points, until there are k clusters.
+
+    Each split only touches the points of the cluster being split, so the
+    cost grows with n * log(k) for balanced splits instead of n * k per
+    Lloyd iteration, which suits large k. The splits are greedy and the
+    partition is not refined globally afterwards, so the inertia is usually
+    somewhat higher than with ``kmeans``.
+
+    Parameters
+    ----------
+    X : ndarray of shape (n_samples, n_features)
+    k : int
+    max_iter, tol : as in ``kmeans``, for each 2-means split.
+    random_state : int or None
+        Seed; each split gets its own seed derived from it.
+    init : {"k-means++", "random", "k-means||"}, default "k-means++"
+    n_init : int, default 1
+        Restarts of each 2-means split.
+    return_inertia : bool, default False
+        If True, also return the inertia.
+    return_tree : bool, default False
+        If True, also return the ``BisectingTree`` of the splits, which
+        gives the labels, centroids and inertia for every number of
+        clusters up to k. A fit with k clusters makes the same first
+        splits as any fit with more clusters and the same seed.
+
+    Returns
+    -------
+    labels : ndarray of shape (n_samples,)
+    centroids : ndarray of shape (k, n_features)
+        Cluster means.
+    inertia : float, only if return_inertia is True
+    tree : BisectingTree, only if return_tree is True
+    """
+    if not isinstance(X, np.ndarray):
+        raise TypeError("X must be a NumPy array.")
+    if k <= 0:
+        raise ValueError("k must be a positive integer.")
+    n_samples, n_features = X.shape
+    if k > n_samples:
+        raise ValueError("k cannot be larger than the number of samples.")
+
+    dtype = _float_dtype(X)
+    rng = np.random.RandomState(random_state)
+    labels = np.zeros(n_samples, dtype=np.intp)
+    members: List[np.ndarray] = [np.arange(n_samples)]
+    parent = np.full(k, -1, dtype=np.intp)
+    sums = np.zeros((k, n_features))
+    counts = np.zeros(k)
+    sse = np.zeros(k)
+    inertia_path = np.zeros(k)
+
+    sums[0] = X.sum(axis=0, dtype=np.float64)
+    counts[0] = n_samples
+    mean = (sums[:1] / n_samples).astype(dtype)
+    sse[0] = _sq_residuals(X, labels, mean).sum(dtype=np.float64)
+    inertia_path[0] = sse[0]
+
+    for new in range(1, k):
+        # Highest-SSE cluster that still has two points (-1 marks the rest)
+        splittable = np.where(counts[:new] >= 2, sse[:new], -1.0)
+        target = int(np.argmax(splittable))
+        idx = members[target]
+        X_sub = X[idx]
+
+        halves, _ = kmeans(
+            X_sub, 2, max_iter=max_iter, tol=tol, init=init, n_init=n_init,
+            random_state=int(rng.randint(0, 2 ** 31 - 1)), assign="brute",
+        )
+        moved = halves == 1
+        if not moved.any() or moved.all():
+            # Identical points cannot be separated: split off the last one
+            moved = np.zeros(idx.size, dtype=bool)
+            moved[-1] = True
+            halves = moved.astype(np.intp)
+
+        members[target] = idx[~moved]
+        members.append(idx[moved])
+        labels[idx[moved]] = new
+        parent[new] = target
+
+        half_sums, half_counts = _cluster_sums(X_sub, halves, 2)
+        half_means = (half_sums / half_counts[:, np.newaxis]).astype(dtype)
+        half_sse = np.bincount(
+            halves, weights=_sq_residuals(X_sub, halves, half_means), minlength=2
+        )
+        sums[target], sums[new] = half_sums
+        counts[target], counts[new] = half_counts
+        inertia_path[new] = inertia_path[new - 1] - sse[target] + half_sse.sum()
+        sse[target], sse[new] = half_sse
+
+    tree = BisectingTree(parent, sums, counts, inertia_path, labels, dtype=dtype)
+    result = [labels, tree.centroids(k)]
+    if return_inertia:
+        result.append(tree.inertia(k))
+    if return_tree:
+        result.append(tree)
+    return tuple(result)
+
+
 def sklearn_kmeans(
     X: np.ndarray,
     k: int,
     random_state: Optional[int] = None,
-) -> Tuple[np.ndarray, np.ndarray]:
+    n_init: int = 10,
+    init: Union[str, np.ndarray] = "k-means++",
+    return_inertia: bool = False,
+    sample_weight: Optional[np.ndarray] = None,
+):
     """
     Thin wrapper around scikit-learn's KMeans.
 
+    Parameters
+    ----------
+    X : ndarray of shape (n_samples, n_features)
+    k : int
+    random_state : int or None
+    n_init : int, default 10
+        Number of restarts performed by scikit-learn. Ignored (a single run
+        is made) when init is an array.
+    init : {"k-means++", "random"} or ndarray, default "k-means++"
+    return_inertia : bool, default False
+        If True, also return scikit-learn's ``inertia_``.
+    sample_weight : ndarray of shape (n_samples,) or None
+        Optional non-negative weight per sample, passed to ``fit``.
+
     Returns
     -------
     labels : ndarray of shape (n_samples,)
     centroids : ndarray of shape (k, n_features)
+    inertia : float, only if return_inertia is True
     """
     if not isinstance(X, np.ndarray):
         raise TypeError("X must be a NumPy array.")
 
+    # Deferred: scikit-learn is slow to import and only needed here
+    from sklearn.cluster import KMeans
+
     model = KMeans(
         n_clusters=k,
+        init=init,
         random_state=random_state,
-        n_init=10,
+        n_init=1 if isinstance(init, np.ndarray) else n_init,
     )
-    model.fit(X)
+    model.fit(X, sample_weight=sample_weight)
     labels = model.labels_
     centroids = model.cluster_centers_
+    if return_inertia:
+        return labels, centroids, float(model.inertia_)
     return labels, centroids
\ No newline at end of file
@@ -0,0 +1,229 @@
+###
+## cluster_maker
+## James Foadi - University of Bath
+## November 2025
+###
+
+from __future__ import annotations
+
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from .algorithms import (
+    _check_sample_weight,
+    _float_dtype,
+    _kmeans_plus_plus,
+    _nearest_centroid,
+)
+
+DEFAULT_CORESET_SIZE = 4096
+
+
+def _sensitivity_sample(
+    X: np.ndarray,
+    weights: np.ndarray,
+    k: int,
+    size: int,
+    rng: np.random.RandomState,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce the weighted set (X, weights) to at most ``size`` weighted points
+    by sensitivity (importance) sampling.
+
+    A k-means++ seeding B gives an upper bound on the contribution of each
+    point to any k-clustering cost (Bachem, Lucic & Krause, "Practical
+    coreset constructions for machine learning", 2017):
+
+        s(x) = a d(x, B)^2 / c + 2 a cost(B_x) / (W(B_x) c) + 4 W / W(B_x)
+
+    with c the mean cost, B_x the seed cluster of x, W total weight and
+    a = 16 (log k + 2). Points are drawn with probability proportional to
+    w(x) s(x) and given weight w(x) / (size * q(x)), so weighted sums over
+    the sample are unbiased estimates of those over X. Repeated draws are
+    merged into one point.
+    """
+    n_samples = X.shape[0]
+    if n_samples <= size:
+        return X, weights
+
+    seeds = _kmeans_plus_plus(X, k, rng, sample_weight=weights)
+    labels, sq_dist = _nearest_centroid(X, seeds)
+    sq_dist = sq_dist.astype(np.float64)
+
+    total_weight = weights.sum()
+    cluster_weight = np.bincount(labels, weights=weights, minlength=k)[labels]
+    cluster_cost = np.bincount(labels, weights=weights * sq_dist, minlength=k)
+    mean_cost = cluster_cost.sum() / total_weight
+    if mean_cost > 0:
+        alpha = 16.0 * (np.log(k) + 2.0)
+        sensitivity = (
+            alpha * sq_dist / mean_cost
+            + 2.0 * alpha * cluster_cost[labels] / (cluster_weight * mean_cost)
+            + 4.0 * total_weight / cluster_weight
+        )
+    else:
+        # Every point sits on a seed: only the cluster sizes matter
+        sensitivity = total_weight / cluster_weight
+    sensitivity *= weights
+    probs = sensitivity / sensitivity.sum()
+
+    draws = rng.choice(n_samples, size=size, p=probs)
+    chosen, n_draws = np.unique(draws, return_counts=True)
+    new_weights = n_draws * weights[chosen] / (size * probs[chosen])
+    return X[chosen], new_weights
+
+
+class StreamingCoreset:
+    """
+    Weighted coreset of a stream of row chunks, built in a single pass.
+
+    Each chunk is reduced to at most ``size`` weighted points by
+    sensitivity sampling (see ``build_coreset``), and reduced sets are
+    combined by merge-and-reduce: as in a binary counter, two sets of the
+    same level are merged and reduced into one set of the next level. Only
+    O(size * log(n_chunks)) points are kept, and every row goes through
+    O(log(n_chunks)) reductions.
+
+    Parameters
+    ----------
+    k : int
+        Number of clusters the coreset is built for (use the largest k of
+        interest, e.g. the largest k of an elbow curve).
+    size : int, default 4096
+        Number of weighted points kept per reduced set (and at most in the
+        final coreset).
+    random_state : int or None
+
+    Attributes
+    ----------
+    n_samples_seen_ : int
+        Number of rows passed to ``partial_fit``.
+    """
+
+    def __init__(
+        self,
+        k: int,
+        size: int = DEFAULT_CORESET_SIZE,
+        random_state: Optional[int] = None,
+    ) -> None:
+        if k <= 0:
+            raise ValueError("k must be a positive integer.")
+        if size < k:
+            raise ValueError("size must be at least k.")
+        self.k = k
+        self.size = size
+        self.random_state = random_state
+        self.n_samples_seen_ = 0
+        self._rng = np.random.RandomState(random_state)
+        self._levels: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def _reduce(self, X: np.ndarray, weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        return _sensitivity_sample(X, weights, self.k, self.size, self._rng)
+
+    def partial_fit(
+        self,
+        X: np.ndarray,
+        sample_weight: Optional[np.ndarray] = None,
+    ) -> "StreamingCoreset":
+        """
+        Add a chunk of rows (and optional per-row weights) to the coreset.
+        """
+        X = np.asarray(X)
+        if X.shape[0] == 0:
+            return self
+        X = X.astype(_float_dtype(X), copy=False)
+        sample_weight = _check_sample_weight(sample_weight, X.shape[0])
+        weights = np.ones(X.shape[0]) if sample_weight is None else sample_weight
+        self.n_samples_seen_ += X.shape[0]
+
+        points, weights = self._reduce(X, weights)
+        if points is X:
+            # Small chunks are kept as they are: do not hold on to the caller's rows
+            points, weights = X.copy(), weights.copy()
+        level = 0
+        while level in self._levels:
+            other_points, other_weights = self._levels.pop(level)
+            points, weights = self._reduce(
+                np.vstack([other_points, points]),
+                np.concatenate([other_weights, weights]),
+            )
+            level += 1
+        self._levels[level] = (points, weights)
+        return self
+
+    def coreset(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        The coreset of all rows seen so far.
+
+        Returns
+        -------
+        points : ndarray of shape (m, n_features), with m <= size
+        weights : ndarray of shape (m,)
+            Positive weights; they sum to about ``n_samples_seen_`` (the
+            total input weight).
+        """
+        if not self._levels:
+            raise ValueError("No rows have been passed to partial_fit.")
+        levels = [self._levels[level] for level in sorted(self._levels)]
+        points = np.vstack([p for p, _ in levels])
+        weights = np.concatenate([w for _, w in levels])
+        if points.shape[0] > self.size:
+            # Use a copy of the generator so coreset() can be called
+            # repeatedly without changing later results.
+            rng = np.random.RandomState()
+            rng.set_state(self._rng.get_state())
+            points, weights = _sensitivity_sample(points, weights, self.k, self.size, rng)
+        return points, weights
+
+
+def build_coreset(
+    X: np.ndarray,
+    k: int,
+    size: int = DEFAULT_CORESET_SIZE,
+    sample_weight: Optional[np.ndarray] = None,
+    random_state: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Weighted coreset of X for k-means: a few thousand weighted points whose
+    weighted clustering cost approximates that of X for any k centroids.
+
+    Fitting ``kmeans(points, k, sample_weight=weights)`` and then assigning
+    every row of X to the resulting centroids is far cheaper than
+    clustering X itself, at the price of a slightly higher inertia.
+
+    Parameters
+    ----------
+    X : ndarray of shape (n_samples, n_features)
+        May be a memory map: with chunk_size, only one chunk is read at a
+        time.
+    k : int
+        Number of clusters (use the largest k of interest).
+    size : int, default 4096
+        Maximum number of coreset points. If X has no more rows, X itself
+        is returned with its weights.
+    sample_weight : ndarray of shape (n_samples,) or None
+    random_state : int or None
+    chunk_size : int or None, default None
+        If given, X is processed in chunks of this many rows with
+        ``StreamingCoreset``; otherwise in one piece.
+
+    Returns
+    -------
+    points : ndarray of shape (m, n_features), with m <= size
+    weights : ndarray of shape (m,)
+    """
+    sample_weight = _check_sample_weight(sample_weight, X.shape[0])
+    if chunk_size is None:
+        chunk_size = max(1, X.shape[0])
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer.")
+
+    builder = StreamingCoreset(k, size=size, random_state=random_state)
+    for start in range(0, X.shape[0], chunk_size):
+        stop = start + chunk_size
+        builder.partial_fit(
+            X[start:stop], None if sample_weight is None else sample_weight[start:stop]
+        )
+    return builder.coreset()
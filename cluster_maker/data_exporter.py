@@ -6,16 +6,49 @@
 
 from __future__ import annotations
 
-from typing import Union, TextIO
+from typing import List, Optional, Union, TextIO
 
+import numpy as np
 import pandas as pd
 
 
+def _cast_floats(
+    data: pd.DataFrame,
+    dtype: Optional[Union[str, np.dtype]],
+    columns: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """
+    Return data with its floating-point columns (only those in columns, if
+    given) converted to dtype (no copy when dtype is None).
+    """
+    if dtype is None:
+        return data
+    dtype = np.dtype(dtype)
+    float_cols = [
+        col for col in data.select_dtypes(include="floating").columns
+        if data[col].dtype != dtype and (columns is None or col in columns)
+    ]
+    if not float_cols:
+        return data
+    return data.astype({col: dtype for col in float_cols})
+
+
+COMPRESSIONS = (None, "gzip", "zstd")
+
+# Rows written per chunk by the labelled-result exporters
+DEFAULT_EXPORT_CHUNK_ROWS = 100_000
+
+
 def export_to_csv(
     data: pd.DataFrame,
     filename: str,
     delimiter: str = ",",
     include_index: bool = False,
+    append: bool = False,
+    dtype: Optional[Union[str, np.dtype]] = None,
+    float_format: Optional[str] = None,
+    compression: Optional[str] = None,
+    dtype_columns: Optional[List[str]] = None,
 ) -> None:
     """
     Export a DataFrame to CSV.
@@ -27,16 +60,153 @@ def export_to_csv(
         Output filename.
     delimiter : str, default ","
     include_index : bool, default False
+    append : bool, default False
+        If True, append rows to an existing file without writing the header.
+        Used to write large results chunk by chunk.
+    dtype : str, numpy dtype or None, default None
+        If given, floating-point columns are written at this precision
+        (e.g. "float32" gives shortest float32 representations).
+    float_format : str or None, default None
+        printf-style format for floats (e.g. "%.6g"), written instead of
+        the full round-trip representation.
+    compression : {None, "gzip", "zstd"}, default None
+        Compress the output ("zstd" requires the zstandard package).
+        Appending adds a new compressed member/frame, which readers
+        decompress as one stream.
+    dtype_columns : list of str or None, default None
+        If given, dtype applies to these columns only; other columns are
+        written at their own precision.
     """
     if not isinstance(data, pd.DataFrame):
         raise TypeError("data must be a pandas DataFrame.")
-    data.to_csv(filename, sep=delimiter, index=include_index)
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unknown compression '{compression}'. Use one of {COMPRESSIONS}.")
+    data = _cast_floats(data, dtype, dtype_columns)
+    data.to_csv(
+        filename,
+        sep=delimiter,
+        index=include_index,
+        mode="a" if append else "w",
+        header=not append,
+        float_format=float_format,
+        compression=compression,
+    )
+
+
+def export_labelled(
+    data: Union[pd.DataFrame, np.ndarray],
+    labels: np.ndarray,
+    filename: str,
+    columns: Optional[List[str]] = None,
+    label_column: str = "cluster",
+    delimiter: str = ",",
+    include_index: bool = False,
+    append: bool = False,
+    dtype: Optional[Union[str, np.dtype]] = None,
+    float_format: Optional[str] = None,
+    compression: Optional[str] = None,
+    chunk_size: int = DEFAULT_EXPORT_CHUNK_ROWS,
+    dtype_columns: Optional[List[str]] = None,
+) -> None:
+    """
+    Write rows of data together with their cluster labels to CSV.
+
+    Rows are written ``chunk_size`` at a time, and only the chunk being
+    written gets the label column, so the full table is never copied.
+    This is the same file as adding the label column to data and calling
+    ``export_to_csv``.
+
+    Parameters
+    ----------
+    data : pandas.DataFrame or ndarray of shape (n_samples, n_features)
+        An array (e.g. memory-mapped) is written with the given columns.
+    labels : ndarray of shape (n_samples,)
+    filename : str
+    columns : list of str or None
+        Column names for array data (default "0", "1", ...).
+    label_column : str, default "cluster"
+    delimiter, include_index, append, dtype, float_format, compression
+        As for ``export_to_csv``.
+    chunk_size : int, default 100000
+        Rows per chunk.
+    dtype_columns : list of str or None, default None
+        As for ``export_to_csv``.
+    """
+    if not isinstance(data, (pd.DataFrame, np.ndarray)):
+        raise TypeError("data must be a pandas DataFrame or a NumPy array.")
+    labels = np.asarray(labels)
+    if labels.shape != (len(data),):
+        raise ValueError("labels must have one entry per row of data.")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer.")
+    if isinstance(data, np.ndarray) and columns is None:
+        columns = [str(j) for j in range(data.shape[1])]
+
+    # An empty table still gets its header
+    starts = range(0, len(data), chunk_size) if len(data) else [0]
+    for start in starts:
+        stop = start + chunk_size
+        if isinstance(data, pd.DataFrame):
+            chunk = data.iloc[start:stop].assign(**{label_column: labels[start:stop]})
+        else:
+            chunk = pd.DataFrame(np.asarray(data[start:stop]), columns=columns)
+            chunk[label_column] = labels[start:stop]
+        export_to_csv(
+            chunk,
+            filename,
+            delimiter=delimiter,
+            include_index=include_index,
+            append=append or start > 0,
+            dtype=dtype,
+            float_format=float_format,
+            compression=compression,
+            dtype_columns=dtype_columns,
+        )
+
+
+def export_labels(
+    labels: np.ndarray,
+    filename: str,
+    row_ids: Optional[np.ndarray] = None,
+) -> None:
+    """
+    Write cluster labels alone as a compact binary sidecar file.
+
+    Labels are stored with the smallest unsigned integer type that holds
+    them (one byte per row for up to 256 clusters). Without row_ids the
+    row id is the position in the array and a ``.npy`` file is written;
+    with row_ids a ``.npz`` file with "row_id" and "cluster" arrays is
+    written. Both load with ``np.load``.
+
+    Parameters
+    ----------
+    labels : ndarray of shape (n_samples,)
+        Non-negative integer labels.
+    filename : str
+    row_ids : ndarray of shape (n_samples,) or None
+    """
+    labels = np.asarray(labels)
+    if labels.ndim != 1:
+        raise ValueError("labels must be a 1D array.")
+    if labels.size and labels.min() < 0:
+        raise ValueError("labels must be non-negative.")
+    compact = labels.astype(np.min_scalar_type(int(labels.max()) if labels.size else 0))
+    if row_ids is None:
+        with open(filename, "wb") as f:
+            np.save(f, compact)
+        return
+    row_ids = np.asarray(row_ids)
+    if row_ids.shape != labels.shape:
+        raise ValueError("row_ids must have one entry per label.")
+    with open(filename, "wb") as f:
+        np.savez(f, row_id=row_ids, cluster=compact)
 
 
 def export_formatted(
     data: pd.DataFrame,
     file: Union[str, TextIO],
     include_index: bool = False,
+    dtype: Optional[Union[str, np.dtype]] = None,
 ) -> None:
     """
     Export a DataFrame as a formatted text table.
@@ -47,9 +217,12 @@ def export_formatted(
     file : str or file-like
         Filename or open file handle.
     include_index : bool, default False
+    dtype : str, numpy dtype or None, default None
+        If given, floating-point columns are formatted at this precision.
     """
     if not isinstance(data, pd.DataFrame):
         raise TypeError("data must be a pandas DataFrame.")
+    data = _cast_floats(data, dtype)
 
     table_str = data.to_string(index=include_index)
 
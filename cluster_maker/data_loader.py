@@ -0,0 +1,198 @@
+###
+## cluster_maker
+## James Foadi - University of Bath
+## November 2025
+###
+
+from __future__ import annotations
+
+import os
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .preprocessing import select_features
+
+# File suffix -> input format. Anything else is read as CSV.
+INPUT_FORMATS = {
+    ".csv": "csv",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".feather": "feather",
+    ".arrow": "feather",
+    ".ipc": "feather",
+    ".npy": "npy",
+}
+
+
+def input_format(path: str) -> str:
+    """
+    Input format of a file, from its suffix ("csv" if unknown).
+    """
+    return INPUT_FORMATS.get(os.path.splitext(str(path))[1].lower(), "csv")
+
+
+def feature_names(path: str, feature_cols: Sequence[Union[str, int]]) -> List[str]:
+    """
+    Column names used for the features of ``path`` in outputs (the column
+    indices as strings for ``.npy`` input).
+    """
+    if input_format(path) == "npy":
+        return [str(col) for col in feature_cols]
+    return list(feature_cols)
+
+
+def _npy_columns(X: np.ndarray, feature_cols: Sequence[Union[str, int]]) -> List[int]:
+    if X.ndim != 2:
+        raise ValueError(".npy input must hold a 2D array.")
+    try:
+        cols = [int(col) for col in feature_cols]
+    except (TypeError, ValueError):
+        raise KeyError(
+            f"For .npy input, feature_cols must be column indices, got {list(feature_cols)}"
+        ) from None
+    out_of_range = [col for col in cols if not -X.shape[1] <= col < X.shape[1]]
+    if out_of_range:
+        raise KeyError(f"The following feature columns are missing: {out_of_range}")
+    if not np.issubdtype(X.dtype, np.number):
+        raise TypeError(".npy input must hold a numeric array.")
+    return cols
+
+
+def _select_npy(
+    X: np.ndarray,
+    cols: List[int],
+    dtype: Union[str, np.dtype],
+) -> np.ndarray:
+    """
+    Feature columns of a (memory-mapped) array. When all columns are used
+    in order and X already has the requested dtype, the memory map itself
+    is returned and nothing is read into RAM.
+    """
+    if cols != list(range(X.shape[1])):
+        X = X[:, cols]
+    return X.astype(dtype, copy=False)
+
+
+def load_features(
+    input_path: str,
+    feature_cols: Sequence[Union[str, int]],
+    dtype: Union[str, np.dtype] = "float64",
+) -> Tuple[Optional[pd.DataFrame], np.ndarray]:
+    """
+    Load a data file and its feature matrix.
+
+    The format is chosen from the file suffix:
+
+    - ``.parquet``/``.pq``: only ``feature_cols`` are read (column
+      projection), so the returned DataFrame holds the features only.
+    - ``.feather``/``.arrow``/``.ipc`` (Arrow IPC): only ``feature_cols``
+      are read.
+    - ``.npy``: a 2D numeric array opened with ``np.load(mmap_mode="r")``;
+      ``feature_cols`` are column indices. No DataFrame is built, and the
+      feature matrix is the memory map itself when all columns are used
+      and the dtype already matches.
+    - anything else is parsed as CSV.
+
+    Parquet and Arrow input require pyarrow.
+
+    Parameters
+    ----------
+    input_path : str
+    feature_cols : list of str (or of int for .npy)
+    dtype : str or numpy dtype, default "float64"
+
+    Returns
+    -------
+    data : pandas.DataFrame or None
+        The loaded table (None for .npy).
+    X : ndarray of shape (n_samples, n_features)
+    """
+    fmt = input_format(input_path)
+    if fmt == "npy":
+        X = np.load(input_path, mmap_mode="r", allow_pickle=False)
+        return None, _select_npy(X, _npy_columns(X, feature_cols), dtype)
+
+    if fmt == "parquet":
+        data = pd.read_parquet(input_path, columns=list(feature_cols))
+    elif fmt == "feather":
+        data = pd.read_feather(input_path, columns=list(feature_cols))
+    else:
+        data = pd.read_csv(input_path)
+    X_df = select_features(data, list(feature_cols), dtype=dtype)
+    return data, X_df.to_numpy(dtype=dtype)
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError as exc:
+        raise ImportError("Reading Parquet or Arrow files requires pyarrow.") from exc
+    return pyarrow
+
+
+def _iter_parquet_batches(
+    input_path: str,
+    columns: List[str],
+    chunk_size: int,
+) -> Iterator[pd.DataFrame]:
+    pa = _import_pyarrow()
+    parquet_file = pa.parquet.ParquetFile(input_path)
+    for batch in parquet_file.iter_batches(batch_size=chunk_size, columns=columns):
+        yield batch.to_pandas()
+
+
+def _iter_ipc_batches(
+    input_path: str,
+    columns: List[str],
+    chunk_size: int,
+) -> Iterator[pd.DataFrame]:
+    pa = _import_pyarrow()
+    with pa.memory_map(input_path, "r") as source:
+        reader = pa.ipc.open_file(source)
+        missing = [col for col in columns if col not in reader.schema.names]
+        if missing:
+            raise KeyError(f"The following feature columns are missing: {missing}")
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i).select(columns)
+            for start in range(0, batch.num_rows, chunk_size):
+                yield batch.slice(start, chunk_size).to_pandas()
+
+
+def iter_feature_chunks(
+    input_path: str,
+    feature_cols: Sequence[Union[str, int]],
+    chunk_size: int,
+    dtype: Union[str, np.dtype] = "float64",
+) -> Iterator[Tuple[pd.DataFrame, np.ndarray]]:
+    """
+    Yield (chunk DataFrame, feature matrix) pairs of at most chunk_size
+    rows, reading only one chunk at a time.
+
+    CSV files are read with ``pd.read_csv(chunksize=...)``, Parquet and
+    Arrow IPC files record batch by record batch (feature columns only)
+    and ``.npy`` files as slices of the memory map.
+    """
+    fmt = input_format(input_path)
+    if fmt == "npy":
+        X = np.load(input_path, mmap_mode="r", allow_pickle=False)
+        cols = _npy_columns(X, feature_cols)
+        names = feature_names(input_path, feature_cols)
+        for start in range(0, X.shape[0], chunk_size):
+            X_chunk = np.asarray(X[start:start + chunk_size][:, cols], dtype=dtype)
+            yield pd.DataFrame(X_chunk, columns=names, copy=True), X_chunk
+        return
+
+    if fmt == "parquet":
+        chunks = _iter_parquet_batches(input_path, list(feature_cols), chunk_size)
+    elif fmt == "feather":
+        chunks = _iter_ipc_batches(input_path, list(feature_cols), chunk_size)
+    else:
+        chunks = pd.read_csv(input_path, chunksize=chunk_size)
+
+    for chunk in chunks:
+        X_df = select_features(chunk, list(feature_cols), dtype=dtype)
+        yield chunk, X_df.to_numpy(dtype=dtype)
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from typing import List, Dict, Any, Sequence
+from typing import List, Dict, Any, Iterator, Sequence, Tuple, Union
 import numpy as np
 import pandas as pd
 
+from .data_exporter import export_to_csv
+from .data_loader import input_format
+
 
 def define_dataframe_structure(column_specs: List[Dict[str, Any]]) -> pd.DataFrame:
     """
@@ -34,40 +37,161 @@ def define_dataframe_structure(column_specs: List[Dict[str, Any]]) -> pd.DataFra
     return pd.DataFrame(data)
 
 
-def simulate_data(
+def _simulation_plan(
     seed_df: pd.DataFrame,
-    n_points: int = 100,
-    cluster_std: float | str = "1.0",
-    random_state: int | None = None,
-) -> pd.DataFrame:
-
-    if n_points <= 0:
-        raise ValueError("n_points must be a positive integer.")
+    n_points: Union[int, Sequence[int]],
+    cluster_std: Union[float, str, Sequence[float]],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Validate the simulation parameters and return the cluster centres,
+    the number of points per cluster and the std per cluster.
+    """
+    centres = seed_df.to_numpy(dtype=float)
+    n_clusters = centres.shape[0]
+
+    if np.ndim(n_points) == 0:
+        n_points = int(n_points)
+        if n_points <= 0:
+            raise ValueError("n_points must be a positive integer.")
+        # even distribution of points
+        base = n_points // n_clusters
+        remainder = n_points % n_clusters
+        counts = np.full(n_clusters, base, dtype=np.int64)
+        counts[:remainder] += 1
+    else:
+        counts = np.asarray(n_points, dtype=np.int64)
+        if counts.shape != (n_clusters,):
+            raise ValueError("n_points must give one count per cluster.")
+        if np.any(counts < 0) or counts.sum() == 0:
+            raise ValueError("Per-cluster counts must be non-negative with a positive total.")
 
     # FIX: convert string → float BEFORE comparing
-    cluster_std = float(cluster_std)
-    if cluster_std <= 0:
+    if isinstance(cluster_std, str) or np.ndim(cluster_std) == 0:
+        stds = np.full(n_clusters, float(cluster_std))
+    else:
+        stds = np.asarray(cluster_std, dtype=float)
+        if stds.shape != (n_clusters,):
+            raise ValueError("cluster_std must give one value per cluster.")
+    if np.any(stds <= 0):
         raise ValueError("cluster_std must be positive.")
 
+    return centres, counts, stds
+
+
+def _simulate_rows(
+    seed_df: pd.DataFrame,
+    rng: np.random.RandomState,
+    centres: np.ndarray,
+    stds: np.ndarray,
+    cluster_ids: np.ndarray,
+) -> pd.DataFrame:
+    """
+    Draw the points for the given (cluster-sorted) cluster ids with a
+    single ``rng.normal`` call and build the DataFrame from column arrays.
+    """
+    noise = rng.normal(0.0, 1.0, size=(cluster_ids.size, centres.shape[1]))
+    noise *= stds[cluster_ids, np.newaxis]
+    points = centres[cluster_ids] + noise
+    data = {col: points[:, j] for j, col in enumerate(seed_df.columns)}
+    data["true_cluster"] = cluster_ids
+    return pd.DataFrame(data, copy=False)
+
+
+def simulate_data(
+    seed_df: pd.DataFrame,
+    n_points: Union[int, Sequence[int]] = 100,
+    cluster_std: Union[float, str, Sequence[float]] = "1.0",
+    random_state: int | None = None,
+) -> pd.DataFrame:
+    """
+    Simulate clustered data around the centres of a seed DataFrame.
+
+    Points are Gaussian around each centre and are returned cluster by
+    cluster, with the cluster index in a "true_cluster" column. All the
+    noise is drawn in one call, so the output is the same as drawing it
+    cluster by cluster from the same seed.
+
+    Parameters
+    ----------
+    seed_df : pandas.DataFrame
+        One row per cluster centre, one column per feature.
+    n_points : int or sequence of int, default 100
+        Total number of points, spread as evenly as possible over the
+        clusters, or the number of points of each cluster.
+    cluster_std : float, str or sequence of float, default "1.0"
+        Standard deviation of the noise, shared or per cluster.
+    random_state : int or None
+
+    Returns
+    -------
+    data : pandas.DataFrame
+    """
+    centres, counts, stds = _simulation_plan(seed_df, n_points, cluster_std)
     rng = np.random.RandomState(random_state)
+    cluster_ids = np.repeat(np.arange(centres.shape[0]), counts)
+    return _simulate_rows(seed_df, rng, centres, stds, cluster_ids)
 
-    centres = seed_df.to_numpy(dtype=float)
-    n_clusters, n_features = centres.shape
 
-    # even distribution of points
-    base = n_points // n_clusters
-    remainder = n_points % n_clusters
-    counts = np.full(n_clusters, base, dtype=int)
-    counts[:remainder] += 1
+def iter_simulated_data(
+    seed_df: pd.DataFrame,
+    n_points: Union[int, Sequence[int]] = 100,
+    cluster_std: Union[float, str, Sequence[float]] = "1.0",
+    random_state: int | None = None,
+    chunk_size: int = 1_000_000,
+) -> Iterator[pd.DataFrame]:
+    """
+    Chunked form of ``simulate_data`` for datasets larger than memory.
+
+    Yields DataFrames of at most chunk_size rows; concatenated, they are
+    exactly ``simulate_data`` with the same arguments.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer.")
+    centres, counts, stds = _simulation_plan(seed_df, n_points, cluster_std)
+    rng = np.random.RandomState(random_state)
+    ends = np.cumsum(counts)
+    for start in range(0, int(ends[-1]), chunk_size):
+        rows = np.arange(start, min(start + chunk_size, int(ends[-1])))
+        cluster_ids = np.searchsorted(ends, rows, side="right")
+        yield _simulate_rows(seed_df, rng, centres, stds, cluster_ids)
 
-    records = []
 
-    for cid, (centre, count) in enumerate(zip(centres, counts)):
-        noise = rng.normal(0, cluster_std, size=(count, n_features))
-        points = centre + noise
-        for point in points:
-            rec = {col: val for col, val in zip(seed_df.columns, point)}
-            rec["true_cluster"] = cid
-            records.append(rec)
+def write_simulated_data(
+    seed_df: pd.DataFrame,
+    path: str,
+    n_points: Union[int, Sequence[int]] = 100,
+    cluster_std: Union[float, str, Sequence[float]] = "1.0",
+    random_state: int | None = None,
+    chunk_size: int = 1_000_000,
+) -> None:
+    """
+    Simulate data chunk by chunk straight to a file, so that only one
+    chunk is ever in memory.
 
-    return pd.DataFrame.from_records(records)
+    The format follows the suffix of path: ".parquet"/".pq" is written as
+    one Parquet row group per chunk (requires pyarrow), anything else as
+    CSV.
+    """
+    chunks = iter_simulated_data(
+        seed_df, n_points, cluster_std, random_state=random_state, chunk_size=chunk_size
+    )
+    if input_format(path) == "parquet":
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise ImportError("Writing Parquet files requires pyarrow.") from exc
+        writer = None
+        try:
+            for chunk in chunks:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+        return
+
+    for i, chunk in enumerate(chunks):
+        export_to_csv(chunk, path, append=i > 0)
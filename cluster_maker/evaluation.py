@@ -6,27 +6,47 @@
 
 from __future__ import annotations
 
-from typing import List, Dict, Optional
+from functools import partial
+from typing import Iterator, List, Dict, Optional, Tuple
 
 import numpy as np
-from sklearn.metrics import silhouette_score
 
-from .algorithms import kmeans, sklearn_kmeans
+from .algorithms import (
+    KMeansWorkspace,
+    kmeans,
+    sklearn_kmeans,
+    warm_start_centroids,
+    _check_sample_weight,
+    _cluster_sums,
+    _float_dtype,
+    _rows_per_chunk,
+    _sq_residuals,
+)
+from .parallel import effective_n_jobs, parallel_as_completed
 
 
 def compute_inertia(
     X: np.ndarray,
     labels: np.ndarray,
     centroids: np.ndarray,
+    sample_weight: Optional[np.ndarray] = None,
 ) -> float:
     """
     Compute the within-cluster sum of squared distances (inertia).
 
+    The residuals are formed in row chunks, so no (n_samples, n_features)
+    copy of X is made. When the clustering comes from ``kmeans`` (or one of
+    its variants) prefer ``return_inertia=True`` there, which reuses the
+    distances of the final assignment pass.
+
     Parameters
     ----------
     X : ndarray of shape (n_samples, n_features)
     labels : ndarray of shape (n_samples,)
     centroids : ndarray of shape (k, n_features)
+    sample_weight : ndarray of shape (n_samples,) or None
+        Optional weight per sample (e.g. coreset weights); the inertia is
+        then the weighted sum.
 
     Returns
     -------
@@ -35,18 +55,32 @@ def compute_inertia(
     if X.shape[0] != labels.shape[0]:
         raise ValueError("X and labels must have the same number of samples.")
 
-    distances = X - centroids[labels]
-    sq_dist = np.sum(distances ** 2)
-    return float(sq_dist)
+    residuals = _sq_residuals(X, labels, centroids)
+    if sample_weight is None:
+        return float(residuals.sum(dtype=np.float64))
+    sample_weight = _check_sample_weight(sample_weight, X.shape[0])
+    return float(np.dot(sample_weight, residuals))
 
 
 def silhouette_score_sklearn(
     X: np.ndarray,
     labels: np.ndarray,
+    sample_size: Optional[int] = None,
+    random_state: Optional[int] = None,
 ) -> float:
     """
     Compute the silhouette score using scikit-learn.
 
+    Parameters
+    ----------
+    X : ndarray of shape (n_samples, n_features)
+    labels : ndarray of shape (n_samples,)
+    sample_size : int or None, default None
+        If given, score a sample of about this many rows, stratified by
+        cluster, instead of all of X.
+    random_state : int or None
+        Seed for the sample.
+
     Returns
     -------
     score : float
@@ -54,14 +88,365 @@ def silhouette_score_sklearn(
     # Silhouette is only defined when there are at least 2 clusters
     if len(np.unique(labels)) < 2:
         raise ValueError("Silhouette score requires at least 2 clusters.")
+    if sample_size is not None:
+        idx = _stratified_sample(labels, sample_size, random_state=random_state)
+        X, labels = X[idx], labels[idx]
+    # Deferred: scikit-learn is slow to import
+    from sklearn.metrics import silhouette_score
+
     return float(silhouette_score(X, labels))
 
 
+SILHOUETTE_METHODS = ("exact", "sampled", "simplified")
+
+# Default cost budget for silhouette_score_fast(method="auto"), in pairwise
+# distance evaluations (the exact score needs n_samples ** 2 of them).
+DEFAULT_SILHOUETTE_BUDGET = 10 ** 8
+
+
+def _stratified_sample(
+    labels: np.ndarray,
+    sample_size: int,
+    random_state: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Indices of a sample of about ``sample_size`` rows, drawn per cluster in
+    proportion to cluster size (at least two rows per cluster when
+    available), so small clusters are always represented.
+    """
+    if sample_size <= 0:
+        raise ValueError("sample_size must be a positive integer.")
+    n_samples = labels.shape[0]
+    if sample_size >= n_samples:
+        return np.arange(n_samples)
+
+    rng = np.random.RandomState(random_state)
+    _, inverse, counts = np.unique(labels, return_inverse=True, return_counts=True)
+    quota = np.maximum(
+        np.floor(sample_size * counts / n_samples).astype(int),
+        np.minimum(counts, 2),
+    )
+
+    # Shuffle, then group by cluster: the first quota rows of each group
+    order = rng.permutation(n_samples)
+    order = order[np.argsort(inverse[order], kind="stable")]
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    rank = np.arange(n_samples) - np.repeat(starts, counts)
+    keep = rank < np.repeat(quota, counts)
+    return np.sort(order[keep])
+
+
+def _silhouette_exact(
+    X: np.ndarray,
+    labels: np.ndarray,
+    memory_budget: Optional[int] = None,
+) -> float:
+    """
+    Exact mean silhouette coefficient, computed in row chunks.
+
+    Each chunk holds one (chunk, n_samples) block of distances, reduced to
+    per-cluster sums straight away, so memory is bounded by memory_budget
+    rather than growing as n_samples ** 2.
+    """
+    n_samples = X.shape[0]
+    _, inverse, counts = np.unique(labels, return_inverse=True, return_counts=True)
+
+    # Sort rows by cluster so per-cluster sums are contiguous reductions
+    order = np.argsort(inverse, kind="stable")
+    X_sorted = X[order]
+    own_sorted = inverse[order]
+    boundaries = np.concatenate([[0], np.cumsum(counts)[:-1]])
+
+    dtype = np.result_type(X.dtype, np.float32)
+    x_sq = np.einsum("ij,ij->i", X_sorted, X_sorted, dtype=dtype)
+    rows = _rows_per_chunk(
+        n_samples, 2 * n_samples * np.dtype(dtype).itemsize, memory_budget=memory_budget
+    )
+
+    total = 0.0
+    for start in range(0, n_samples, rows):
+        stop = min(start + rows, n_samples)
+        idx = np.arange(stop - start)
+        X_chunk = X_sorted[start:stop]
+        dist = X_chunk @ X_sorted.T
+        dist *= -2.0
+        dist += x_sq[start:stop, np.newaxis]
+        dist += x_sq[np.newaxis, :]
+        np.maximum(dist, 0.0, out=dist)
+        np.sqrt(dist, out=dist)
+        dist[idx, start + idx] = 0.0
+
+        sums = np.add.reduceat(dist, boundaries, axis=1)
+        own = own_sorted[start:stop]
+        own_size = counts[own]
+        a = sums[idx, own] / np.maximum(own_size - 1, 1)
+        mean_other = sums / counts
+        mean_other[idx, own] = np.inf
+        b = mean_other.min(axis=1)
+
+        denom = np.maximum(a, b)
+        s = np.where(denom > 0, (b - a) / np.where(denom > 0, denom, 1.0), 0.0)
+        s[own_size == 1] = 0.0
+        total += float(s.sum())
+
+    return total / n_samples
+
+
+def _silhouette_simplified(
+    X: np.ndarray,
+    labels: np.ndarray,
+    centroids: Optional[np.ndarray] = None,
+) -> float:
+    """
+    Centroid-based ("simplified") silhouette: a is the distance to the
+    sample's own centroid and b the distance to the nearest other centroid.
+    O(n_samples * k) time and O(chunk * k) memory.
+    """
+    uniq, inverse = np.unique(labels, return_inverse=True)
+    k = uniq.shape[0]
+    if centroids is None:
+        sums, counts = _cluster_sums(X, inverse, k)
+        centroids = sums / counts[:, np.newaxis]
+    else:
+        centroids = centroids[uniq]
+
+    n_samples = X.shape[0]
+    dtype = _float_dtype(X)
+    centroids = np.asarray(centroids, dtype=dtype)
+    c_sq = np.einsum("ij,ij->i", centroids, centroids)
+    rows = _rows_per_chunk(n_samples, 2 * k * dtype.itemsize)
+    total = 0.0
+    for start in range(0, n_samples, rows):
+        stop = min(start + rows, n_samples)
+        idx = np.arange(stop - start)
+        X_chunk = np.asarray(X[start:stop], dtype=dtype)
+        dist = X_chunk @ centroids.T
+        dist *= -2.0
+        dist += np.einsum("ij,ij->i", X_chunk, X_chunk)[:, np.newaxis]
+        dist += c_sq[np.newaxis, :]
+        np.maximum(dist, 0.0, out=dist)
+        np.sqrt(dist, out=dist)
+
+        own = inverse[start:stop]
+        a = dist[idx, own]
+        dist[idx, own] = np.inf
+        b = dist.min(axis=1)
+        denom = np.maximum(a, b)
+        s = np.where(denom > 0, (b - a) / np.where(denom > 0, denom, 1.0), 0.0)
+        total += float(s.sum())
+
+    return total / n_samples
+
+
+def choose_silhouette_method(
+    n_samples: int,
+    n_clusters: int,
+    budget: int = DEFAULT_SILHOUETTE_BUDGET,
+) -> Tuple[str, Optional[int]]:
+    """
+    Pick a silhouette strategy for a cost budget in pairwise distances.
+
+    Returns ("exact", None) when n_samples ** 2 fits in the budget,
+    otherwise ("sampled", sample_size) with sample_size ** 2 ~ budget, or
+    ("simplified", None) when such a sample would leave fewer than about
+    20 points per cluster.
+    """
+    if n_samples ** 2 <= budget:
+        return "exact", None
+    sample_size = int(np.sqrt(budget))
+    if sample_size < 20 * n_clusters:
+        return "simplified", None
+    return "sampled", sample_size
+
+
+def silhouette_score_fast(
+    X: np.ndarray,
+    labels: np.ndarray,
+    method: str = "auto",
+    sample_size: Optional[int] = None,
+    centroids: Optional[np.ndarray] = None,
+    random_state: Optional[int] = None,
+    budget: int = DEFAULT_SILHOUETTE_BUDGET,
+    memory_budget: Optional[int] = None,
+) -> float:
+    """
+    Silhouette score for large inputs.
+
+    Parameters
+    ----------
+    X : ndarray of shape (n_samples, n_features)
+    labels : ndarray of shape (n_samples,)
+    method : {"auto", "exact", "sampled", "simplified"}, default "auto"
+        - "exact": the usual silhouette, computed in memory-bounded chunks.
+        - "sampled": exact silhouette of a sample stratified by cluster.
+        - "simplified": centroid-based approximation, O(n_samples * k).
+        - "auto": chosen from n_samples and budget, see
+          ``choose_silhouette_method``.
+    sample_size : int or None
+        Sample size for "sampled" (defaults to sqrt(budget)).
+    centroids : ndarray of shape (k, n_features) or None
+        Centroids for "simplified"; computed as cluster means if None.
+    random_state : int or None
+        Seed for the sample.
+    budget : int, default DEFAULT_SILHOUETTE_BUDGET
+        Cost budget for "auto", in pairwise distance evaluations.
+    memory_budget : int or None
+        Working memory in bytes for one chunk of the exact computation.
+
+    Returns
+    -------
+    score : float
+    """
+    n_clusters = len(np.unique(labels))
+    if n_clusters < 2:
+        raise ValueError("Silhouette score requires at least 2 clusters.")
+    if X.shape[0] != labels.shape[0]:
+        raise ValueError("X and labels must have the same number of samples.")
+
+    if method == "auto":
+        method, auto_size = choose_silhouette_method(X.shape[0], n_clusters, budget)
+        sample_size = sample_size or auto_size
+
+    if method == "exact":
+        return _silhouette_exact(X, labels, memory_budget=memory_budget)
+    if method == "sampled":
+        if sample_size is None:
+            sample_size = int(np.sqrt(budget))
+        idx = _stratified_sample(labels, sample_size, random_state=random_state)
+        return _silhouette_exact(X[idx], labels[idx], memory_budget=memory_budget)
+    if method == "simplified":
+        return _silhouette_simplified(X, labels, centroids)
+    raise ValueError(
+        f"Unknown method '{method}'. Use 'auto' or one of {SILHOUETTE_METHODS}."
+    )
+
+
+def _iter_elbow_chain(
+    X: np.ndarray,
+    k_values: List[int],
+    random_state: Optional[int],
+    use_sklearn: bool,
+    warm_start: bool,
+    sample_weight: Optional[np.ndarray] = None,
+) -> Iterator[Tuple[int, float]]:
+    """
+    Fit the k values in order, yielding (k, inertia) after each fit.
+
+    With warm_start, a k that directly follows the previous one starts from
+    the previous solution with its highest-SSE cluster split in two. Fits
+    of the manual kmeans share one workspace sized for the largest k.
+    """
+    labels = centroids = None
+    previous_k = None
+    fit = sklearn_kmeans
+    if not use_sklearn:
+        fit = partial(kmeans, workspace=KMeansWorkspace.for_data(X, max(k_values)))
+    for k in k_values:
+        if warm_start and centroids is not None and k == previous_k + 1:
+            init = warm_start_centroids(
+                X, labels, centroids, random_state=random_state,
+                sample_weight=sample_weight,
+            )
+        else:
+            init = "k-means++"
+        labels, centroids, inertia = fit(
+            X, k, random_state=random_state, init=init, return_inertia=True,
+            sample_weight=sample_weight,
+        )
+        previous_k = k
+        yield k, inertia
+
+
+def _elbow_chain(
+    k_values: List[int],
+    X: np.ndarray,
+    random_state: Optional[int],
+    use_sklearn: bool,
+    warm_start: bool,
+    sample_weight: Optional[np.ndarray] = None,
+) -> List[Tuple[int, float]]:
+    """
+    List version of ``_iter_elbow_chain`` (one pool task).
+    """
+    return list(
+        _iter_elbow_chain(X, k_values, random_state, use_sklearn, warm_start, sample_weight)
+    )
+
+
+def iter_elbow_curve(
+    X: np.ndarray,
+    k_values: List[int],
+    random_state: Optional[int] = None,
+    use_sklearn: bool = True,
+    n_jobs: Optional[int] = None,
+    warm_start: bool = False,
+    precomputed: Optional[Dict[int, float]] = None,
+    backend: str = "threads",
+    sample_weight: Optional[np.ndarray] = None,
+) -> Iterator[Tuple[int, float]]:
+    """
+    Yield (k, inertia) pairs as soon as each fit finishes.
+
+    This is the streaming form of ``elbow_curve`` (same parameters), useful
+    to draw the elbow plot progressively. Pairs arrive in completion order,
+    not necessarily in the order of k_values.
+    """
+    for k in k_values:
+        if k <= 0:
+            raise ValueError("All k values must be positive integers.")
+
+    precomputed = precomputed or {}
+    todo: List[int] = []
+    seen = set()
+    for k in k_values:
+        if k in seen:
+            continue
+        seen.add(k)
+        if k in precomputed:
+            yield k, float(precomputed[k])
+        else:
+            todo.append(k)
+    if not todo:
+        return
+
+    n_workers = min(effective_n_jobs(n_jobs), len(todo))
+    if n_workers <= 1:
+        yield from _iter_elbow_chain(
+            X, todo, random_state, use_sklearn, warm_start, sample_weight
+        )
+        return
+
+    if warm_start:
+        # Contiguous blocks of sorted k: cold start per block, warm inside
+        tasks = [
+            [int(k) for k in block]
+            for block in np.array_split(np.array(sorted(todo)), n_workers)
+        ]
+    else:
+        tasks = [[k] for k in todo]
+
+    chain = partial(
+        _elbow_chain,
+        X=X,
+        random_state=random_state,
+        use_sklearn=use_sklearn,
+        warm_start=warm_start,
+        sample_weight=sample_weight,
+    )
+    for _, results in parallel_as_completed(chain, tasks, n_jobs=n_workers, backend=backend):
+        yield from results
+
+
 def elbow_curve(
     X: np.ndarray,
     k_values: List[int],
     random_state: Optional[int] = None,
     use_sklearn: bool = True,
+    n_jobs: Optional[int] = None,
+    warm_start: bool = False,
+    precomputed: Optional[Dict[int, float]] = None,
+    backend: str = "threads",
+    sample_weight: Optional[np.ndarray] = None,
 ) -> Dict[int, float]:
     """
     Compute inertia values for multiple K values (elbow method).
@@ -73,22 +458,39 @@ def elbow_curve(
     random_state : int or None
     use_sklearn : bool, default True
         If True, use scikit-learn KMeans; otherwise use manual kmeans.
+    n_jobs : int or None, default None
+        Number of k values fitted concurrently (-1 for all CPUs).
+    warm_start : bool, default False
+        If True, each k is started from the (k-1)-cluster solution with its
+        highest-SSE cluster split in two, instead of from scratch. Warm
+        starts need the previous k, so with n_jobs > 1 the sorted k values
+        are split into one contiguous block per worker.
+    precomputed : dict or None, default None
+        Inertias already known (e.g. from the main fit), mapping k to
+        inertia. These k values are not refitted.
+    backend : {"threads", "processes"}, default "threads"
+        Pool used when n_jobs > 1. Worker processes read X from shared
+        memory rather than a pickled copy.
+    sample_weight : ndarray of shape (n_samples,) or None, default None
+        Optional weight per sample, e.g. to compute the curve on a weighted
+        coreset (see ``build_coreset``) instead of on all rows.
 
     Returns
     -------
     inertia_dict : dict
-        Mapping from k to inertia.
+        Mapping from k to inertia, in the order of k_values.
     """
-    inertia_dict: Dict[int, float] = {}
-
-    for k in k_values:
-        if k <= 0:
-            raise ValueError("All k values must be positive integers.")
-        if use_sklearn:
-            labels, centroids = sklearn_kmeans(X, k, random_state=random_state)
-        else:
-            labels, centroids = kmeans(X, k, random_state=random_state)
-        inertia = compute_inertia(X, labels, centroids)
-        inertia_dict[k] = inertia
-
-    return inertia_dict
\ No newline at end of file
+    inertia_dict = dict(
+        iter_elbow_curve(
+            X,
+            k_values,
+            random_state=random_state,
+            use_sklearn=use_sklearn,
+            n_jobs=n_jobs,
+            warm_start=warm_start,
+            precomputed=precomputed,
+            backend=backend,
+            sample_weight=sample_weight,
+        )
+    )
+    return {k: inertia_dict[k] for k in k_values}
@@ -6,16 +6,42 @@
 
 from __future__ import annotations
 
-from typing import Dict, Any, List, Optional
+from functools import partial
+from typing import Dict, Any, List, Optional, Tuple, Union
 
 import numpy as np
-import pandas as pd
 
-from .preprocessing import select_features, standardise_features, apply_pca
-from .algorithms import kmeans, sklearn_kmeans
-from .evaluation import compute_inertia, elbow_curve, silhouette_score_sklearn
+from .preprocessing import (
+    StreamingStandardiser,
+    standardise_features,
+    apply_pca,
+)
+from .algorithms import (
+    _nearest_centroid,
+    bisecting_kmeans,
+    kmeans,
+    kmeans_elkan,
+    kmeans_hamerly,
+    minibatch_kmeans,
+    sklearn_kmeans,
+    MiniBatchKMeans,
+)
+from .evaluation import (
+    DEFAULT_SILHOUETTE_BUDGET,
+    choose_silhouette_method,
+    elbow_curve,
+    silhouette_score_fast,
+)
+from .model import ClusterModel
 from .plotting_clustered import plot_clusters_2d, plot_elbow
-from .data_exporter import export_to_csv
+from .data_exporter import export_labelled, export_labels
+from .data_loader import feature_names, iter_feature_chunks, load_features
+from .coreset import StreamingCoreset, build_coreset
+
+PCA_STAGES = ("after_for_plot", "before")
+
+# Algorithms that can be fitted on a weighted coreset
+CORESET_ALGORITHMS = ("kmeans", "sklearn_kmeans")
 
 
 def run_clustering(
@@ -30,12 +56,26 @@ def run_clustering(
     elbow_k_values: Optional[List[int]] = None,
     use_pca: bool = False,
     pca_components: Optional[int] = None,
+    pca_stage: str = "after_for_plot",
+    pca_solver: str = "auto",
+    stream: bool = False,
+    chunk_size: int = 100_000,
+    elbow_n_jobs: Optional[int] = None,
+    elbow_warm_start: bool = False,
+    silhouette_method: str = "auto",
+    silhouette_budget: int = DEFAULT_SILHOUETTE_BUDGET,
+    dtype: Union[str, np.dtype] = "float64",
+    float_format: Optional[str] = None,
+    compression: Optional[str] = None,
+    labels_only: bool = False,
+    assign: str = "auto",
+    coreset_size: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
     High-level function to run the full clustering workflow.
 
     Steps:
-    1. Load data from CSV
+    1. Load data (CSV, Parquet, Arrow IPC/Feather or .npy)
     2. Select feature columns
     3. Optionally standardise features
     4. Run the chosen clustering algorithm
@@ -46,90 +86,327 @@ def run_clustering(
     Parameters
     ----------
     input_path : str
-        Path to the input CSV file.
+        Path to the input file. The format follows the suffix: ".parquet"
+        and ".feather"/".arrow" files are read with column projection
+        (only feature_cols, which requires pyarrow, so "data" then holds
+        just the features and labels), ".npy" files are memory-mapped and
+        anything else is parsed as CSV. See ``load_features``.
     feature_cols : list of str
-        Names of feature columns to use.
-    algorithm : {"kmeans", "sklearn_kmeans"}, default "kmeans"
+        Names of feature columns to use (column indices for ".npy").
+    algorithm : {"kmeans", "kmeans_elkan", "kmeans_hamerly", "bisecting_kmeans",
+                 "minibatch_kmeans", "sklearn_kmeans"}, default "kmeans"
+        "kmeans_elkan" and "kmeans_hamerly" give the same result as "kmeans"
+        but skip most distance computations using triangle-inequality bounds.
+        "bisecting_kmeans" splits clusters one at a time (suited to large
+        k); a single fit up to the largest elbow k also gives the whole
+        elbow curve.
     k : int, default 3
         Number of clusters.
     standardise : bool, default True
     output_path : str or None, default None
-        If provided, the input data with cluster labels will be saved to this CSV.
+        If provided, the input data with cluster labels will be saved to this
+        CSV, written in chunks of ``chunk_size`` rows.
     random_state : int or None, default None
     compute_elbow : bool, default False
         If True, compute inertia for multiple k values.
     elbow_k_values : list of int or None, default None
         k-values for elbow curve. If None and compute_elbow is True, defaults
         to range 1..(k+5).
+    use_pca : bool, default False
+        If True, reduce the (standardised) features with PCA.
+    pca_components : int or None, default None
+        Number of principal components (default min(2, n_features)).
+    pca_stage : {"after_for_plot", "before"}, default "after_for_plot"
+        "before" clusters in the reduced space, which makes every fit and
+        metric cheaper on wide data; centroids, metrics and the returned
+        model are then in PCA coordinates. "after_for_plot" clusters the
+        full feature space and uses PCA only for the silhouette score, the
+        plot and the elbow curve (the centroids are projected for the
+        plot).
+    pca_solver : {"auto", "full", "randomized", "arpack", "incremental"}, default "auto"
+        PCA solver, see ``apply_pca``. "randomized" and "incremental"
+        avoid a full dense SVD on large matrices.
+    stream : bool, default False
+        If True, never load the whole file: it is read in chunks of
+        ``chunk_size`` rows (any of the input formats), centroids are
+        fitted with ``MiniBatchKMeans`` (requires
+        algorithm="minibatch_kmeans"), or on a coreset built in the same
+        pass if ``coreset_size`` is given, and a second pass assigns labels
+        chunk by chunk, appending them to ``output_path``. Peak memory then
+        depends on ``chunk_size`` rather than on the file size. In this
+        mode "data" and "labels" are None, the silhouette score is not
+        computed, the cluster plot shows the first chunk only, the elbow
+        curve needs a coreset and the PCA options are not available.
+    chunk_size : int, default 100000
+        Number of rows per chunk in streaming mode and when writing the
+        output CSV. Streaming with "minibatch_kmeans" needs at least k
+        rows per chunk.
+    elbow_n_jobs : int or None, default None
+        Number of elbow-curve k values fitted concurrently.
+    elbow_warm_start : bool, default False
+        Warm-start each elbow k from the (k-1) solution, see ``elbow_curve``.
+    silhouette_method : {"auto", "exact", "sampled", "simplified"}, default "auto"
+        Silhouette strategy, see ``silhouette_score_fast``. "auto" uses the
+        exact score when n_samples ** 2 fits in silhouette_budget and a
+        cluster-stratified sample (or the centroid-based approximation)
+        otherwise.
+    silhouette_budget : int, default DEFAULT_SILHOUETTE_BUDGET
+        Cost budget for "auto", in pairwise distance evaluations.
+    dtype : str or numpy dtype, default "float64"
+        Floating-point precision of the whole pipeline. With "float32" the
+        features, scaling, PCA, centroids and the exported feature columns
+        all stay float32, halving memory. Other columns of the input are
+        exported at their own precision.
+    float_format : str or None, default None
+        printf-style float format for the output CSV (e.g. "%.6g").
+    compression : {None, "gzip", "zstd"}, default None
+        Compression of the output CSV.
+    labels_only : bool, default False
+        If True, write only the labels to output_path, as a compact binary
+        ``.npy`` array (row i holds the label of input row i), instead of
+        re-serialising the features. See ``export_labels``.
+    assign : {"auto", "brute", "kdtree", "filtering"}, default "auto"
+        Nearest-centroid search backend of algorithm="kmeans" (same
+        result, different speed), see ``kmeans``.
+    coreset_size : int or None, default None
+        If given, fit the centroids (and the elbow curve) on a weighted
+        coreset of at most this many points instead of on every row, then
+        assign all rows in one chunked pass. Meant for quick exploratory
+        runs on very large tables; the inertia is somewhat higher than a
+        full fit. The coreset is built chunk by chunk in a single pass, so
+        it also works with ``stream=True``. Requires algorithm "kmeans" or
+        "sklearn_kmeans". See ``build_coreset``.
 
     Returns
     -------
     result : dict
         Dictionary containing:
-        - "data": DataFrame with added "cluster" column
+        - "data": DataFrame with added "cluster" column (None for ".npy"
+          input)
         - "labels": ndarray of cluster labels
         - "centroids": ndarray of cluster centroids
-        - "metrics": dict with "inertia" and optional "silhouette"
+        - "metrics": dict with "inertia", optional "silhouette" and the
+          "silhouette_method" used
         - "fig_cluster": Figure for the cluster plot
         - "fig_elbow": Figure for the elbow plot or None
         - "elbow_inertias": dict mapping k -> inertia (if computed)
+        - "model": fitted ``ClusterModel`` (scaling, PCA basis and
+          centroids) to assign new rows with ``model.predict``
+        - "fit_stats": dict of iteration statistics (iterations, label
+          changes and phase timings, plus distance-computation counts for
+          the accelerated variants) for the manual K-means algorithms,
+          otherwise None
+        - "split_tree": ``BisectingTree`` of the splits for
+          "bisecting_kmeans" (labels for every k up to its size),
+          otherwise None
     """
-    # Load data
-    df = pd.read_csv(input_path)
+    if coreset_size is not None and algorithm not in CORESET_ALGORITHMS:
+        raise ValueError(
+            f"coreset_size requires algorithm to be one of {CORESET_ALGORITHMS}."
+        )
+    if stream:
+        return _run_clustering_streaming(
+            input_path,
+            feature_cols,
+            algorithm=algorithm,
+            k=k,
+            standardise=standardise,
+            output_path=output_path,
+            random_state=random_state,
+            compute_elbow=compute_elbow,
+            use_pca=use_pca,
+            chunk_size=chunk_size,
+            dtype=dtype,
+            float_format=float_format,
+            compression=compression,
+            labels_only=labels_only,
+            elbow_k_values=elbow_k_values,
+            coreset_size=coreset_size,
+            assign=assign,
+        )
+
+    if pca_stage not in PCA_STAGES:
+        raise ValueError(f"Unknown pca_stage '{pca_stage}'. Use one of {PCA_STAGES}.")
 
-    # Select and optionally standardise features
-    X_df = select_features(df, feature_cols)
-    X = X_df.to_numpy(dtype=float)
+    # Load data (df is None for .npy input, whose X is memory-mapped)
+    df, X = load_features(input_path, feature_cols, dtype=dtype)
+    X_raw = X
+    names = feature_names(input_path, feature_cols)
 
+    # Optionally standardise features
+    mean = scale = None
     if standardise:
-        X = standardise_features(X)
+        X, mean, scale = standardise_features(X, dtype=dtype, return_params=True)
 
-    # Run clustering
-    if algorithm == "kmeans":
-        labels, centroids = kmeans(X, k=k, random_state=random_state)
+    pca_mean = pca_basis = None
+    if use_pca:
+        n_comp = pca_components or min(2, X.shape[1])
+        fit_pca = partial(
+            apply_pca,
+            n_components=n_comp,
+            dtype=dtype,
+            return_params=True,
+            svd_solver=pca_solver,
+            random_state=random_state,
+        )
+    # Cluster in the reduced space
+    pca_before = use_pca and pca_stage == "before"
+    if pca_before:
+        X, pca_mean, pca_basis = fit_pca(X)
+
+    if compute_elbow and elbow_k_values is None:
+        elbow_k_values = list(range(1, max(2, k + 5) + 1))
+    # True when the clustering runs in the space the metrics use
+    same_space = not use_pca or pca_before
+
+    # Run clustering (inertia comes from the final assignment pass)
+    fit_stats: Optional[Dict[str, object]] = None
+    split_tree = None
+    coreset = None
+    if coreset_size is not None:
+        coreset_k = _coreset_k(k, elbow_k_values if compute_elbow and same_space else None)
+        coreset = build_coreset(
+            X, coreset_k, size=coreset_size, random_state=random_state,
+            chunk_size=chunk_size,
+        )
+        centroids, coreset_inertia, fit_stats = _fit_coreset(
+            coreset, algorithm, k, random_state, assign
+        )
+        # One chunked pass over all rows for the labels and the inertia
+        labels, min_sq_dist = _nearest_centroid(X, centroids)
+        inertia = float(min_sq_dist.sum(dtype=np.float64))
+    elif algorithm == "kmeans":
+        labels, centroids, inertia, fit_stats = kmeans(
+            X, k=k, random_state=random_state, return_inertia=True, return_stats=True,
+            assign=assign,
+        )
+    elif algorithm == "kmeans_elkan":
+        labels, centroids, inertia, fit_stats = kmeans_elkan(
+            X, k=k, random_state=random_state, return_inertia=True, return_stats=True
+        )
+    elif algorithm == "kmeans_hamerly":
+        labels, centroids, inertia, fit_stats = kmeans_hamerly(
+            X, k=k, random_state=random_state, return_inertia=True, return_stats=True
+        )
+    elif algorithm == "bisecting_kmeans":
+        # Splitting on to the largest elbow k gives the elbow curve for free
+        # and leaves the first k - 1 splits unchanged.
+        max_k = k
+        if compute_elbow and same_space:
+            max_k = max(k, min(max(elbow_k_values), X.shape[0]))
+        _, _, split_tree = bisecting_kmeans(
+            X, k=max_k, random_state=random_state, return_tree=True
+        )
+        labels = split_tree.labels(k)
+        centroids = split_tree.centroids(k)
+        inertia = split_tree.inertia(k)
+    elif algorithm == "minibatch_kmeans":
+        labels, centroids, inertia = minibatch_kmeans(
+            X, k=k, random_state=random_state, return_inertia=True
+        )
     elif algorithm == "sklearn_kmeans":
-        labels, centroids = sklearn_kmeans(X, k=k, random_state=random_state)
+        labels, centroids, inertia = sklearn_kmeans(
+            X, k=k, random_state=random_state, return_inertia=True
+        )
     else:
-        raise ValueError(f"Unknown algorithm '{algorithm}'. Use 'kmeans' or 'sklearn_kmeans'.")
+        raise ValueError(
+            f"Unknown algorithm '{algorithm}'. Use 'kmeans', 'kmeans_elkan', "
+            "'kmeans_hamerly', 'bisecting_kmeans', 'minibatch_kmeans' or "
+            "'sklearn_kmeans'."
+        )
 
-    # Optional PCA step
-    if use_pca:
-        n_comp = pca_components or min(2, X.shape[1])
-        X = apply_pca(X, n_components=n_comp)
+    # Optional PCA step for the metrics and plot only
+    plot_centroids = centroids
+    if use_pca and not pca_before:
+        X, pca_mean, pca_basis = fit_pca(X)
+        plot_centroids = (centroids - pca_mean) @ pca_basis.T
+
+    model = ClusterModel(
+        centroids,
+        mean=mean,
+        scale=scale,
+        pca_mean=pca_mean,
+        pca_components=pca_basis,
+        cluster_space="pca" if pca_before else "features",
+        feature_names=names,
+    )
 
     # Compute metrics
-    inertia = compute_inertia(X, labels, centroids)
     metrics: Dict[str, Any] = {"inertia": inertia}
 
+    sil_method, sample_size = silhouette_method, None
+    if sil_method == "auto":
+        sil_method, sample_size = choose_silhouette_method(
+            X.shape[0], len(np.unique(labels)), silhouette_budget
+        )
     try:
-        sil = silhouette_score_sklearn(X, labels)
+        sil = silhouette_score_fast(
+            X,
+            labels,
+            method=sil_method,
+            sample_size=sample_size,
+            centroids=centroids if same_space else None,
+            random_state=random_state,
+        )
     except ValueError:
         sil = None
     metrics["silhouette"] = sil
+    metrics["silhouette_method"] = sil_method
 
-    # Add labels to DataFrame
-    df = df.copy()
-    df["cluster"] = labels
-
-    # Export if requested
+    # Export if requested (streamed in chunks, without copying df)
     if output_path is not None:
-        export_to_csv(df, output_path, delimiter=",", include_index=False)
+        if labels_only:
+            export_labels(labels, output_path)
+        else:
+            export_labelled(
+                df if df is not None else X_raw,
+                labels,
+                output_path,
+                columns=names,
+                dtype=dtype,
+                dtype_columns=names,
+                float_format=float_format,
+                compression=compression,
+                chunk_size=chunk_size,
+            )
+
+    # Add labels to the loaded DataFrame (our own, so no copy is needed)
+    if df is not None:
+        df["cluster"] = labels
 
     # Plot clusters (2D)
-    fig_cluster, _ = plot_clusters_2d(X, labels, centroids=centroids, title="Cluster plot")
+    fig_cluster, _ = plot_clusters_2d(X, labels, centroids=plot_centroids, title="Cluster plot")
 
     # Optional elbow curve
     fig_elbow = None
     elbow_inertias: Optional[Dict[int, float]] = None
     if compute_elbow:
-        if elbow_k_values is None:
-            max_k = max(2, k + 5)
-            elbow_k_values = list(range(1, max_k + 1))
+        # The main fit already gives the inertia for k when the elbow curve
+        # would repeat exactly the same fit on the same data.
+        precomputed = None
+        exact_algorithms = ("kmeans", "kmeans_elkan", "kmeans_hamerly", "sklearn_kmeans")
+        elbow_X, elbow_weight = X, None
+        if same_space and coreset is not None:
+            # The elbow curve is fitted on the coreset as well
+            elbow_X, elbow_weight = coreset
+            precomputed = {k: coreset_inertia}
+        elif same_space and algorithm in exact_algorithms:
+            precomputed = {k: inertia}
+        elif same_space and split_tree is not None:
+            precomputed = {
+                val: split_tree.inertia(val)
+                for val in elbow_k_values
+                if 1 <= val <= split_tree.k
+            }
         elbow_inertias = elbow_curve(
-            X,
+            elbow_X,
             k_values=elbow_k_values,
             random_state=random_state,
             use_sklearn=(algorithm == "sklearn_kmeans"),
+            n_jobs=elbow_n_jobs,
+            warm_start=elbow_warm_start,
+            precomputed=precomputed,
+            sample_weight=elbow_weight,
         )
         fig_elbow, _ = plot_elbow(
             elbow_k_values,
@@ -144,5 +421,201 @@ def run_clustering(
         "fig_cluster": fig_cluster,
         "fig_elbow": fig_elbow,
         "elbow_inertias": elbow_inertias,
+        "model": model,
+        "fit_stats": fit_stats,
+        "split_tree": split_tree,
+    }
+    return result
+
+
+def _streaming_scale(
+    input_path: str,
+    feature_cols: List[str],
+    chunk_size: int,
+) -> StreamingStandardiser:
+    """
+    One pass over the CSV to accumulate the per-feature mean and variance
+    used by ``standardise_features``.
+    """
+    standardiser = StreamingStandardiser()
+    for _, X in iter_feature_chunks(input_path, feature_cols, chunk_size):
+        standardiser.partial_fit(X)
+    if standardiser.n_samples_seen_ == 0:
+        raise ValueError("The input file contains no rows.")
+    return standardiser
+
+
+def _coreset_k(k: int, elbow_k_values: Optional[List[int]]) -> int:
+    """
+    Number of clusters a coreset must serve: k and every elbow k.
+    """
+    return max([k] + list(elbow_k_values or []))
+
+
+def _fit_coreset(
+    coreset: Tuple[np.ndarray, np.ndarray],
+    algorithm: str,
+    k: int,
+    random_state: Optional[int],
+    assign: str = "auto",
+) -> Tuple[np.ndarray, float, Optional[Dict[str, object]]]:
+    """
+    Fit centroids on a weighted coreset.
+
+    Returns
+    -------
+    centroids : ndarray of shape (k, n_features)
+    inertia : float
+        Weighted inertia on the coreset (an estimate of the full one).
+    fit_stats : dict or None
+    """
+    points, weights = coreset
+    if algorithm == "kmeans":
+        _, centroids, inertia, fit_stats = kmeans(
+            points, k=k, random_state=random_state, return_inertia=True,
+            return_stats=True, assign=assign, sample_weight=weights,
+        )
+        return centroids, inertia, fit_stats
+    _, centroids, inertia = sklearn_kmeans(
+        points, k=k, random_state=random_state, return_inertia=True,
+        sample_weight=weights,
+    )
+    return centroids, inertia, None
+
+
+def _run_clustering_streaming(
+    input_path: str,
+    feature_cols: List[str],
+    algorithm: str,
+    k: int,
+    standardise: bool,
+    output_path: Optional[str],
+    random_state: Optional[int],
+    compute_elbow: bool,
+    use_pca: bool,
+    chunk_size: int,
+    dtype: Union[str, np.dtype],
+    float_format: Optional[str] = None,
+    compression: Optional[str] = None,
+    labels_only: bool = False,
+    elbow_k_values: Optional[List[int]] = None,
+    coreset_size: Optional[int] = None,
+    assign: str = "auto",
+) -> Dict[str, Any]:
+    """
+    Out-of-core variant of ``run_clustering`` (see its ``stream`` option).
+
+    Without a coreset the centroids are fitted with mini-batch K-means;
+    with ``coreset_size`` the first pass builds a weighted coreset instead,
+    which the centroids and the optional elbow curve are fitted on.
+    """
+    if coreset_size is None and algorithm != "minibatch_kmeans":
+        raise ValueError(
+            "Streaming mode requires algorithm='minibatch_kmeans' (or a coreset_size)."
+        )
+    if use_pca:
+        raise ValueError("use_pca is not supported in streaming mode.")
+    if compute_elbow and coreset_size is None:
+        raise ValueError("compute_elbow in streaming mode requires a coreset_size.")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer.")
+    if coreset_size is None and chunk_size < k:
+        # MiniBatchKMeans seeds its k centroids from the first chunk
+        raise ValueError(
+            f"chunk_size ({chunk_size}) must be at least k ({k}) in streaming mode "
+            "with algorithm='minibatch_kmeans'."
+        )
+    if compute_elbow and elbow_k_values is None:
+        elbow_k_values = list(range(1, max(2, k + 5) + 1))
+
+    names = feature_names(input_path, feature_cols)
+    standardiser = mean = std = None
+    if standardise:
+        standardiser = _streaming_scale(input_path, feature_cols, chunk_size)
+        mean = standardiser.mean_.astype(dtype)
+        std = standardiser.scale_.astype(dtype)
+
+    # Pass 1: fit centroids incrementally, or build the coreset (chunks are
+    # standardised in place)
+    if coreset_size is None:
+        estimator = MiniBatchKMeans(k, random_state=random_state)
+    else:
+        estimator = StreamingCoreset(
+            _coreset_k(k, elbow_k_values), size=coreset_size, random_state=random_state
+        )
+    for _, X in iter_feature_chunks(input_path, feature_cols, chunk_size, dtype):
+        if standardise:
+            X = standardiser.transform(X, copy=False)
+        estimator.partial_fit(X)
+
+    fit_stats = None
+    fig_elbow = elbow_inertias = None
+    if coreset_size is None:
+        centroids = estimator.centroids_
+    else:
+        coreset = estimator.coreset()
+        centroids, coreset_inertia, fit_stats = _fit_coreset(
+            coreset, algorithm, k, random_state, assign
+        )
+        if compute_elbow:
+            elbow_inertias = elbow_curve(
+                coreset[0],
+                k_values=elbow_k_values,
+                random_state=random_state,
+                use_sklearn=(algorithm == "sklearn_kmeans"),
+                precomputed={k: coreset_inertia},
+                sample_weight=coreset[1],
+            )
+            fig_elbow, _ = plot_elbow(
+                elbow_k_values, [elbow_inertias[val] for val in elbow_k_values]
+            )
+
+    # Pass 2: assign labels chunk by chunk and stream them to disk
+    label_chunks: List[np.ndarray] = []
+    inertia = 0.0
+    first = True
+    fig_cluster = None
+    for chunk, X in iter_feature_chunks(input_path, feature_cols, chunk_size, dtype):
+        if standardise:
+            X = standardiser.transform(X, copy=False)
+        labels, min_sq_dist = _nearest_centroid(X, centroids)
+        inertia += float(min_sq_dist.sum(dtype=np.float64))
+
+        if output_path is not None:
+            if labels_only:
+                # Kept in the compact sidecar type until the single write
+                label_chunks.append(labels.astype(np.min_scalar_type(k - 1)))
+            else:
+                export_labelled(
+                    chunk, labels, output_path, append=not first, dtype=dtype,
+                    float_format=float_format, compression=compression,
+                    chunk_size=chunk_size, dtype_columns=names,
+                )
+        if first and X.shape[1] >= 2:
+            fig_cluster, _ = plot_clusters_2d(
+                X, labels, centroids=centroids, title="Cluster plot (first chunk)"
+            )
+        first = False
+
+    if output_path is not None and labels_only:
+        labels_all = np.concatenate(label_chunks) if label_chunks else np.empty(0, np.uint8)
+        export_labels(labels_all, output_path)
+
+    result: Dict[str, Any] = {
+        "data": None,
+        "labels": None,
+        "centroids": centroids,
+        "metrics": {"inertia": inertia, "silhouette": None},
+        "fig_cluster": fig_cluster,
+        "fig_elbow": fig_elbow,
+        "elbow_inertias": elbow_inertias,
+        "model": ClusterModel(
+            centroids,
+            mean=mean,
+            scale=std,
+            feature_names=names,
+        ),
+        "fit_stats": fit_stats,
+        "split_tree": None,
     }
-    return result
\ No newline at end of file
+    return result
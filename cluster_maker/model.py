@@ -0,0 +1,228 @@
+###
+## cluster_maker
+## James Foadi - University of Bath
+## November 2025
+###
+
+from __future__ import annotations
+
+from typing import List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .algorithms import _nearest_centroid
+from .preprocessing import select_features
+
+CLUSTER_SPACES = ("features", "pca")
+
+# Below this many (row, centroid, feature) terms, predict() computes the
+# distances directly: for single rows and small batches this avoids the
+# chunking set-up of the nearest-centroid search.
+_DIRECT_PREDICT_SIZE = 1 << 15
+
+
+class ClusterModel:
+    """
+    Fitted clustering pipeline: feature scaling, optional PCA and centroids.
+
+    ``predict`` applies the same transforms as ``run_clustering`` to new
+    rows and returns the index of the nearest centroid, so new data can be
+    scored without re-running the pipeline. Models are saved to and loaded
+    from a small ``.npz`` file holding only plain arrays.
+
+    Parameters
+    ----------
+    centroids : ndarray of shape (k, n_dims)
+        Cluster centres, in the space the clustering was run in.
+    mean, scale : ndarray of shape (n_features,) or None
+        Standardisation parameters (``(X - mean) / scale``); None if the
+        features were not standardised.
+    pca_mean : ndarray of shape (n_features,) or None
+    pca_components : ndarray of shape (n_components, n_features) or None
+        PCA basis fitted on the (scaled) features, if any.
+    cluster_space : {"features", "pca"}, default "features"
+        "pca" if the centroids live in PCA coordinates (the PCA basis is
+        then applied before the nearest-centroid lookup); with "features"
+        the PCA basis is only used by ``project``.
+    feature_names : list of str or None
+        Feature columns, used to select and order the columns when
+        predicting from a DataFrame.
+    """
+
+    def __init__(
+        self,
+        centroids: np.ndarray,
+        mean: Optional[np.ndarray] = None,
+        scale: Optional[np.ndarray] = None,
+        pca_mean: Optional[np.ndarray] = None,
+        pca_components: Optional[np.ndarray] = None,
+        cluster_space: str = "features",
+        feature_names: Optional[List[str]] = None,
+    ) -> None:
+        centroids = np.asarray(centroids)
+        if centroids.ndim != 2:
+            raise ValueError("centroids must be a 2D array.")
+        if cluster_space not in CLUSTER_SPACES:
+            raise ValueError(
+                f"Unknown cluster_space '{cluster_space}'. Use one of {CLUSTER_SPACES}."
+            )
+        if (mean is None) != (scale is None):
+            raise ValueError("mean and scale must be given together.")
+        if (pca_mean is None) != (pca_components is None):
+            raise ValueError("pca_mean and pca_components must be given together.")
+        if cluster_space == "pca" and pca_components is None:
+            raise ValueError("cluster_space='pca' requires a PCA basis.")
+
+        dtype = centroids.dtype
+        self.centroids = centroids
+        self.mean = None if mean is None else np.asarray(mean, dtype=dtype)
+        self.scale = None if scale is None else np.asarray(scale, dtype=dtype)
+        self.pca_mean = None if pca_mean is None else np.asarray(pca_mean, dtype=dtype)
+        self.pca_components = (
+            None if pca_components is None else np.asarray(pca_components, dtype=dtype)
+        )
+        self.cluster_space = cluster_space
+        self.feature_names = None if feature_names is None else list(feature_names)
+
+        if self.pca_components is not None:
+            n_features = self.pca_components.shape[1]
+        elif self.mean is not None:
+            n_features = self.mean.shape[0]
+        else:
+            n_features = centroids.shape[1]
+        self.n_features = n_features
+
+    @property
+    def k(self) -> int:
+        return self.centroids.shape[0]
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.centroids.dtype
+
+    def _as_array(self, X: Union[np.ndarray, pd.DataFrame]) -> np.ndarray:
+        if isinstance(X, pd.DataFrame):
+            if self.feature_names is not None:
+                X = select_features(X, self.feature_names)
+            X = X.to_numpy()
+        X = np.asarray(X, dtype=self.dtype)
+        if X.ndim == 1:
+            X = X[np.newaxis, :]
+        if X.ndim != 2 or X.shape[1] != self.n_features:
+            raise ValueError(
+                f"Expected data with {self.n_features} features, got shape {X.shape}."
+            )
+        return X
+
+    def _scale(self, X: np.ndarray) -> np.ndarray:
+        if self.mean is None:
+            return X
+        X = X - self.mean
+        X /= self.scale
+        return X
+
+    def transform(self, X: Union[np.ndarray, pd.DataFrame]) -> np.ndarray:
+        """
+        Map raw feature rows to the space the centroids live in.
+
+        Parameters
+        ----------
+        X : ndarray of shape (n_samples, n_features) or (n_features,), or DataFrame
+
+        Returns
+        -------
+        Z : ndarray of shape (n_samples, n_dims)
+        """
+        Z = self._scale(self._as_array(X))
+        if self.cluster_space == "pca":
+            Z = (Z - self.pca_mean) @ self.pca_components.T
+        return Z
+
+    def project(self, X: Union[np.ndarray, pd.DataFrame]) -> np.ndarray:
+        """
+        PCA coordinates of raw feature rows (e.g. to plot new points).
+
+        Raises
+        ------
+        ValueError
+            If the model has no PCA basis.
+        """
+        if self.pca_components is None:
+            raise ValueError("This model has no PCA basis.")
+        Z = self._scale(self._as_array(X))
+        return (Z - self.pca_mean) @ self.pca_components.T
+
+    def predict(
+        self,
+        X: Union[np.ndarray, pd.DataFrame],
+        chunk_size: Optional[int] = None,
+        memory_budget: Optional[int] = None,
+    ) -> np.ndarray:
+        """
+        Assign raw feature rows to the nearest centroid.
+
+        Parameters
+        ----------
+        X : ndarray of shape (n_samples, n_features) or (n_features,), or DataFrame
+            A single row may be passed as a 1D array.
+        chunk_size, memory_budget : int or None
+            Row-chunking of large batches, as in ``assign_clusters``.
+
+        Returns
+        -------
+        labels : ndarray of shape (n_samples,)
+        """
+        Z = self.transform(X)
+        if Z.shape[0] * self.centroids.size <= _DIRECT_PREDICT_SIZE:
+            diff = Z[:, np.newaxis, :] - self.centroids[np.newaxis, :, :]
+            return np.argmin(np.linalg.norm(diff, axis=2), axis=1)
+        labels, _ = _nearest_centroid(
+            Z, self.centroids, chunk_size=chunk_size, memory_budget=memory_budget
+        )
+        return labels
+
+    def save(self, path: str) -> None:
+        """
+        Write the model to an uncompressed ``.npz`` file (plain arrays only,
+        so it loads without pickle). The file is written to path exactly,
+        with no ``.npz`` suffix added, so ``load(path)`` reads it back.
+        """
+        arrays = {
+            "centroids": self.centroids,
+            "cluster_space": np.array(self.cluster_space),
+        }
+        for name in ("mean", "scale", "pca_mean", "pca_components"):
+            value = getattr(self, name)
+            if value is not None:
+                arrays[name] = value
+        if self.feature_names is not None:
+            arrays["feature_names"] = np.array(self.feature_names, dtype=str)
+        with open(path, "wb") as f:
+            np.savez(f, **arrays)
+
+    @classmethod
+    def load(cls, path: str) -> "ClusterModel":
+        """
+        Read a model written by ``save``.
+        """
+        with np.load(path, allow_pickle=False) as data:
+            optional = {
+                name: data[name] if name in data.files else None
+                for name in ("mean", "scale", "pca_mean", "pca_components")
+            }
+            feature_names = (
+                data["feature_names"].tolist() if "feature_names" in data.files else None
+            )
+            return cls(
+                data["centroids"],
+                cluster_space=str(data["cluster_space"]),
+                feature_names=feature_names,
+                **optional,
+            )
+
+    def __repr__(self) -> str:
+        return (
+            f"ClusterModel(k={self.k}, n_features={self.n_features}, "
+            f"cluster_space='{self.cluster_space}', dtype={self.dtype})"
+        )
@@ -0,0 +1,250 @@
+###
+## cluster_maker
+## Parallel execution helpers
+###
+
+from __future__ import annotations
+
+import os
+from contextlib import ExitStack, contextmanager
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import partial
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+BACKENDS = ("threads", "processes")
+
+# Array arguments at least this large are handed to worker processes
+# through shared memory instead of being pickled for every task.
+SHARED_MEMORY_MIN_BYTES = 1 << 20
+
+# Shared-memory segments attached by this (worker) process, by name. They
+# stay mapped for the life of the process, which for pool workers is the
+# duration of one parallel call.
+_ATTACHED: Dict[str, Tuple[shared_memory.SharedMemory, np.ndarray]] = {}
+
+
+class SharedArray:
+    """
+    Picklable handle to an array held in ``multiprocessing.shared_memory``.
+
+    Only the segment name, shape and dtype are pickled. ``attach`` maps the
+    segment in the calling process and returns a read-only NumPy view of
+    it, without copying. Segments are created and removed by
+    ``shared_arrays``.
+    """
+
+    __slots__ = ("name", "shape", "dtype")
+
+    def __init__(self, name: str, shape: Tuple[int, ...], dtype: str) -> None:
+        self.name = name
+        self.shape = tuple(shape)
+        self.dtype = dtype
+
+    def attach(self) -> np.ndarray:
+        if self.name not in _ATTACHED:
+            segment = shared_memory.SharedMemory(name=self.name)
+            view = np.ndarray(self.shape, dtype=self.dtype, buffer=segment.buf)
+            view.flags.writeable = False
+            _ATTACHED[self.name] = (segment, view)
+        return _ATTACHED[self.name][1]
+
+    def __getstate__(self):
+        return self.name, self.shape, self.dtype
+
+    def __setstate__(self, state) -> None:
+        self.name, self.shape, self.dtype = state
+
+    def __repr__(self) -> str:
+        return f"SharedArray(name='{self.name}', shape={self.shape}, dtype='{self.dtype}')"
+
+
+@contextmanager
+def shared_arrays(arrays: Sequence[np.ndarray]) -> Iterator[List[SharedArray]]:
+    """
+    Copy arrays into shared memory once and yield picklable handles to
+    them, for worker processes to ``attach`` without copying.
+
+    The segments are closed and unlinked when the block exits, whether it
+    completes or raises (and, should this process die first, the
+    multiprocessing resource tracker removes them).
+
+    Examples
+    --------
+    >>> with shared_arrays([X]) as (X_handle,):
+    ...     results = parallel_map(partial(work, X_handle), items,
+    ...                            n_jobs=4, backend="processes")
+    """
+    segments: List[shared_memory.SharedMemory] = []
+    try:
+        handles = []
+        for array in arrays:
+            array = np.asarray(array)
+            segment = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+            segments.append(segment)
+            view = np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf)
+            view[...] = array
+            del view
+            handles.append(SharedArray(segment.name, array.shape, array.dtype.str))
+        yield handles
+    finally:
+        for segment in segments:
+            segment.close()
+            segment.unlink()
+
+
+def resolve_shared(value: Any) -> Any:
+    """
+    The array behind a ``SharedArray`` handle, or value itself.
+    """
+    if isinstance(value, SharedArray):
+        return value.attach()
+    return value
+
+
+def _is_large_array(value: Any) -> bool:
+    return isinstance(value, np.ndarray) and value.nbytes >= SHARED_MEMORY_MIN_BYTES
+
+
+class _SharedCall:
+    """
+    Picklable stand-in for ``functools.partial(func, *args, **keywords)``
+    whose ``SharedArray`` arguments are attached in the worker.
+    """
+
+    def __init__(self, func: Callable, args: tuple, keywords: Dict[str, Any]) -> None:
+        self.func = func
+        self.args = args
+        self.keywords = keywords
+
+    def __call__(self, *more: Any) -> Any:
+        args = [resolve_shared(value) for value in self.args]
+        keywords = {name: resolve_shared(value) for name, value in self.keywords.items()}
+        return self.func(*args, *more, **keywords)
+
+
+def _share_partial_arrays(func: Callable, stack: ExitStack) -> Callable:
+    """
+    For a ``functools.partial`` sent to worker processes, move its large
+    array arguments (e.g. the data matrix X) into shared memory owned by
+    ``stack``, so each task pickles a small handle instead of the array.
+    """
+    if not isinstance(func, partial):
+        return func
+    args = list(func.args)
+    keywords = dict(func.keywords)
+    positions = [i for i, value in enumerate(args) if _is_large_array(value)]
+    names = [name for name, value in keywords.items() if _is_large_array(value)]
+    if not positions and not names:
+        return func
+
+    handles = stack.enter_context(
+        shared_arrays([args[i] for i in positions] + [keywords[name] for name in names])
+    )
+    for i, handle in zip(positions, handles):
+        args[i] = handle
+    for name, handle in zip(names, handles[len(positions):]):
+        keywords[name] = handle
+    return _SharedCall(func.func, tuple(args), keywords)
+
+
+def effective_n_jobs(n_jobs: Optional[int]) -> int:
+    """
+    Number of workers to use for ``n_jobs``.
+
+    None means 1 (run serially), -1 means one worker per CPU, -2 all CPUs
+    but one, and so on.
+    """
+    if n_jobs is None:
+        return 1
+    if n_jobs == 0:
+        raise ValueError("n_jobs must be a non-zero integer or None.")
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return int(n_jobs)
+
+
+def parallel_map(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    n_jobs: Optional[int] = None,
+    backend: str = "threads",
+) -> List[Any]:
+    """
+    Apply ``func`` to every item, optionally in a thread or process pool.
+
+    Results are returned in the order of ``items`` whatever order the pool
+    finishes them in, so callers that reduce over the list get the same
+    answer for any ``n_jobs``.
+
+    Parameters
+    ----------
+    func : callable
+        Must be picklable (a module-level function or a functools.partial
+        of one) when backend is "processes". Large array arguments of a
+        partial (at least SHARED_MEMORY_MIN_BYTES) are then passed to the
+        workers through shared memory, once, rather than pickled for every
+        item; the workers see read-only views of them.
+    items : iterable
+    n_jobs : int or None, default None
+        See ``effective_n_jobs``.
+    backend : {"threads", "processes"}, default "threads"
+        Threads suit NumPy/BLAS-heavy work, which releases the GIL.
+
+    Returns
+    -------
+    results : list
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}'. Use one of {BACKENDS}.")
+    items = list(items)
+    n_workers = min(effective_n_jobs(n_jobs), len(items))
+    if n_workers <= 1:
+        return [func(item) for item in items]
+
+    if backend == "threads":
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            return list(executor.map(func, items))
+    with ExitStack() as stack:
+        func = _share_partial_arrays(func, stack)
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            return list(executor.map(func, items))
+
+
+def parallel_as_completed(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    n_jobs: Optional[int] = None,
+    backend: str = "threads",
+) -> Iterator[Tuple[int, Any]]:
+    """
+    Like ``parallel_map`` but yield ``(index, result)`` pairs as soon as
+    each item finishes, so callers can consume results progressively.
+    Large array arguments are shared with worker processes in the same
+    way, and released when the generator finishes or is closed.
+
+    With a single worker the items are processed lazily, in order.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}'. Use one of {BACKENDS}.")
+    items = list(items)
+    n_workers = min(effective_n_jobs(n_jobs), len(items))
+    if n_workers <= 1:
+        for index, item in enumerate(items):
+            yield index, func(item)
+        return
+
+    executor_cls = ThreadPoolExecutor if backend == "threads" else ProcessPoolExecutor
+    with ExitStack() as stack:
+        if backend == "processes":
+            func = _share_partial_arrays(func, stack)
+        executor = stack.enter_context(executor_cls(max_workers=n_workers))
+        futures = {executor.submit(func, item): index for index, item in enumerate(items)}
+        try:
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            for future in futures:
+                future.cancel()
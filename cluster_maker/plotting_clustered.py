@@ -6,10 +6,13 @@
 
 from __future__ import annotations
 
-from typing import List, Tuple, Optional
+from typing import TYPE_CHECKING, List, Tuple, Optional
 
 import numpy as np
-import matplotlib.pyplot as plt
+
+if TYPE_CHECKING:
+    # matplotlib itself is imported when a plot is made
+    import matplotlib.pyplot as plt
 
 
 def plot_clusters_2d(
@@ -35,6 +38,8 @@ def plot_clusters_2d(
     if X.shape[1] < 2:
         raise ValueError("X must have at least 2 features for a 2D plot.")
 
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots()
     scatter = ax.scatter(X[:, 0], X[:, 1], c=labels, cmap="tab10", alpha=0.8)
 
@@ -81,6 +86,8 @@ def plot_elbow(
     if len(k_values) != len(inertias):
         raise ValueError("k_values and inertias must have the same length.")
 
+    import matplotlib.pyplot as plt
+
     fig, ax = plt.subplots()
     ax.plot(k_values, inertias, marker="o")
     ax.set_xlabel("Number of clusters (k)")
@@ -6,14 +6,17 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
-from sklearn.preprocessing import StandardScaler
 
 
-def select_features(data: pd.DataFrame, feature_cols: List[str]) -> pd.DataFrame:
+def select_features(
+    data: pd.DataFrame,
+    feature_cols: List[str],
+    dtype: Optional[Union[str, np.dtype]] = None,
+) -> pd.DataFrame:
     """
     Select a subset of columns to use as features, ensuring they are numeric.
 
@@ -22,6 +25,9 @@ def select_features(data: pd.DataFrame, feature_cols: List[str]) -> pd.DataFrame
     data : pandas.DataFrame
     feature_cols : list of str
         Column names to select.
+    dtype : str, numpy dtype or None, default None
+        If given, the selected columns are converted to this dtype
+        (e.g. "float32"); otherwise their own dtypes are kept.
 
     Returns
     -------
@@ -48,30 +54,244 @@ def select_features(data: pd.DataFrame, feature_cols: List[str]) -> pd.DataFrame
     if non_numeric:
         raise TypeError(f"The following feature columns are not numeric: {non_numeric}")
 
+    if dtype is not None:
+        X_df = X_df.astype(dtype)
     return X_df
 
 
-def standardise_features(X: np.ndarray) -> np.ndarray:
+# Rows per block when fitting or transforming an in-memory array in chunks
+_STANDARDISE_CHUNK_ROWS = 65536
+
+
+class StreamingStandardiser:
+    """
+    Per-feature mean and variance accumulated chunk by chunk.
+
+    Each chunk's count, mean and sum of squared deviations are computed
+    directly and merged into the running totals with the pairwise update
+    of Chan et al. (the batch form of Welford's algorithm), which is
+    numerically stable and does not depend on how the rows are split.
+    Statistics built on separate chunks, threads or worker processes can be
+    combined with ``merge``; the object only holds small arrays, so it
+    pickles cheaply.
+
+    The resulting transform is the one of ``standardise_features``:
+    ``(X - mean) / scale`` with the population standard deviation as scale
+    and constant features given a scale of 1.
+
+    Attributes
+    ----------
+    n_samples_seen_ : int
+    mean_ : ndarray of shape (n_features,), float64, or None before any data
+    m2_ : ndarray of shape (n_features,), float64, or None before any data
+        Sum of squared deviations from the mean.
+    """
+
+    def __init__(self) -> None:
+        self.n_samples_seen_ = 0
+        self.mean_: Optional[np.ndarray] = None
+        self.m2_: Optional[np.ndarray] = None
+
+    def _combine(self, n_b: int, mean_b: np.ndarray, m2_b: np.ndarray) -> None:
+        n_a = self.n_samples_seen_
+        if n_b == 0:
+            return
+        if n_a == 0:
+            self.n_samples_seen_, self.mean_, self.m2_ = n_b, mean_b, m2_b
+            return
+        if mean_b.shape != self.mean_.shape:
+            raise ValueError("Statistics were computed on different numbers of features.")
+        n = n_a + n_b
+        delta = mean_b - self.mean_
+        self.mean_ = self.mean_ + delta * (n_b / n)
+        self.m2_ = self.m2_ + m2_b + delta ** 2 * (n_a * n_b / n)
+        self.n_samples_seen_ = n
+
+    def partial_fit(self, X: np.ndarray) -> "StreamingStandardiser":
+        """
+        Update the statistics with one chunk of rows.
+        """
+        X = np.asarray(X)
+        if X.ndim != 2:
+            raise ValueError("X must be a 2D array.")
+        n_b = X.shape[0]
+        if n_b == 0:
+            return self
+        mean_b = X.mean(axis=0, dtype=np.float64)
+        deviations = X - mean_b
+        m2_b = np.einsum("ij,ij->j", deviations, deviations)
+        self._combine(n_b, mean_b, m2_b)
+        return self
+
+    def fit(
+        self,
+        X: np.ndarray,
+        chunk_size: int = _STANDARDISE_CHUNK_ROWS,
+    ) -> "StreamingStandardiser":
+        """
+        Accumulate the statistics of an array (e.g. memory-mapped) in row
+        blocks, so only one block-sized temporary is ever allocated.
+        """
+        for start in range(0, X.shape[0], chunk_size):
+            self.partial_fit(X[start:start + chunk_size])
+        return self
+
+    def merge(self, other: "StreamingStandardiser") -> "StreamingStandardiser":
+        """
+        Add the statistics of another standardiser (e.g. one fitted on a
+        different part of the data in another process) to this one.
+        """
+        if other.n_samples_seen_:
+            self._combine(other.n_samples_seen_, other.mean_, other.m2_)
+        return self
+
+    @property
+    def var_(self) -> np.ndarray:
+        if self.mean_ is None:
+            raise ValueError("No data has been seen yet.")
+        return self.m2_ / self.n_samples_seen_
+
+    @property
+    def scale_(self) -> np.ndarray:
+        var = self.var_
+        # Same constant-feature test as scikit-learn's StandardScaler
+        n = self.n_samples_seen_
+        eps = np.finfo(np.float64).eps
+        constant = var <= n * eps * var + (n * self.mean_ * eps) ** 2
+        scale = np.sqrt(var)
+        scale[constant] = 1.0
+        return scale
+
+    def transform(
+        self,
+        X: np.ndarray,
+        copy: bool = True,
+        chunk_size: int = _STANDARDISE_CHUNK_ROWS,
+    ) -> np.ndarray:
+        """
+        Standardise X as ``(X - mean) / scale``.
+
+        With copy=False a writable floating-point X is overwritten in place,
+        in row blocks (this works on writable memory-mapped arrays), and no
+        second (n_samples, n_features) array is allocated. Otherwise one
+        output array is allocated, in X's float precision.
+        """
+        X = np.asarray(X)
+        dtype = X.dtype if np.issubdtype(X.dtype, np.floating) else np.dtype(np.float64)
+        mean = self.mean_.astype(dtype)
+        scale = self.scale_.astype(dtype)
+        if copy or X.dtype != dtype or not X.flags.writeable:
+            out = np.empty(X.shape, dtype=dtype)
+        else:
+            out = X
+        for start in range(0, X.shape[0], chunk_size):
+            stop = start + chunk_size
+            np.subtract(X[start:stop], mean, out=out[start:stop], casting="unsafe")
+            out[start:stop] /= scale
+        return out
+
+
+def standardise_features(
+    X: np.ndarray,
+    dtype: Optional[Union[str, np.dtype]] = None,
+    return_params: bool = False,
+    copy: bool = True,
+):
     """
     Standardise features to zero mean and unit variance.
 
     Parameters
     ----------
     X : ndarray of shape (n_samples, n_features)
+    dtype : str, numpy dtype or None, default None
+        If given, X is converted to this dtype first. Floating-point input
+        keeps its precision (float32 in, float32 out).
+    return_params : bool, default False
+        If True, also return the fitted mean and scale, so that new data
+        can be transformed as ``(X_new - mean) / scale``.
+    copy : bool, default True
+        If False, the statistics are accumulated and X is standardised in
+        place, in row blocks, with ``StreamingStandardiser`` (floating-point
+        X only; X may be a writable memory-mapped array). No second
+        (n_samples, n_features) array is allocated.
 
     Returns
     -------
     X_scaled : ndarray of shape (n_samples, n_features)
+    mean, scale : ndarray of shape (n_features,), only if return_params is True
+        Constant features get a scale of 1.
     """
     if not isinstance(X, np.ndarray):
         raise TypeError("X must be a NumPy array.")
-    scaler = StandardScaler()
-    return scaler.fit_transform(X)
+    if dtype is not None:
+        X = X.astype(dtype, copy=False)
+    if not copy:
+        standardiser = StreamingStandardiser().fit(X)
+        X_scaled = standardiser.transform(X, copy=False)
+        mean, scale = standardiser.mean_, standardiser.scale_
+    else:
+        from sklearn.preprocessing import StandardScaler
+
+        scaler = StandardScaler()
+        X_scaled = scaler.fit_transform(X)
+        mean, scale = scaler.mean_, scaler.scale_
+    if return_params:
+        dtype = X_scaled.dtype
+        return X_scaled, mean.astype(dtype), scale.astype(dtype)
+    return X_scaled
+
+
+PCA_SOLVERS = ("auto", "full", "randomized", "arpack", "incremental")
+
+
+def _incremental_pca(
+    X: np.ndarray,
+    n_components: int,
+    dtype: np.dtype,
+    batch_size: Optional[int],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Fit IncrementalPCA one row block at a time and project X block by
+    block, so only one (batch_size, n_features) block of X is converted
+    and held at a time (X may be a memory-mapped array).
+    """
+    n_samples, n_features = X.shape
+    if batch_size is None:
+        batch_size = 5 * n_features
+    batch_size = max(batch_size, n_components)
+    if n_samples < n_components:
+        raise ValueError("n_components cannot exceed the number of samples.")
+
+    # Every batch must have at least n_components rows: a short last
+    # batch is merged into the previous one.
+    bounds = list(range(0, n_samples, batch_size)) + [n_samples]
+    if len(bounds) > 2 and bounds[-1] - bounds[-2] < n_components:
+        del bounds[-2]
+
+    from sklearn.decomposition import IncrementalPCA
+
+    ipca = IncrementalPCA(n_components=n_components)
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        ipca.partial_fit(np.asarray(X[start:stop], dtype=dtype))
 
-from sklearn.decomposition import PCA
+    mean = ipca.mean_.astype(dtype)
+    components = ipca.components_.astype(dtype)
+    X_pca = np.empty((n_samples, n_components), dtype=dtype)
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        block = np.asarray(X[start:stop], dtype=dtype) - mean
+        np.matmul(block, components.T, out=X_pca[start:stop])
+    return X_pca, mean, components
 
 
-def apply_pca(X: np.ndarray, n_components: int = 2) -> np.ndarray:
+def apply_pca(
+    X: np.ndarray,
+    n_components: int = 2,
+    dtype: Optional[Union[str, np.dtype]] = None,
+    return_params: bool = False,
+    svd_solver: str = "auto",
+    batch_size: Optional[int] = None,
+    random_state: Optional[int] = None,
+):
     """
     Apply PCA to reduce the dimensionality of the feature matrix.
 
@@ -81,12 +301,32 @@ def apply_pca(X: np.ndarray, n_components: int = 2) -> np.ndarray:
         Standardised feature matrix.
     n_components : int, default=2
         Number of principal components to keep.
+    dtype : str, numpy dtype or None, default None
+        If given, X is converted to this dtype first. Floating-point input
+        keeps its precision.
+    return_params : bool, default False
+        If True, also return the fitted mean and principal axes, so that
+        new data can be projected as ``(X_new - mean) @ components.T``.
+    svd_solver : {"auto", "full", "randomized", "arpack", "incremental"}, default "auto"
+        "auto", "full", "randomized" and "arpack" are passed to scikit-learn's
+        ``PCA``; "randomized" computes only the leading components and is
+        much cheaper than a full SVD when n_components << n_features.
+        "incremental" fits ``IncrementalPCA`` in row blocks of
+        ``batch_size``, so no full dense SVD (nor a converted copy of X) is
+        ever held in memory.
+    batch_size : int or None, default None
+        Rows per block for "incremental" (default 5 * n_features).
+    random_state : int or None, default None
+        Seed for the "randomized" and "arpack" solvers.
 
     Returns
     -------
     numpy.ndarray
         The PCA-transformed feature matrix with shape
         (n_samples, n_components).
+    mean : ndarray of shape (n_features,), only if return_params is True
+    components : ndarray of shape (n_components, n_features), only if
+        return_params is True
     """
     if not isinstance(X, np.ndarray):
         raise TypeError("X must be a NumPy array.")
@@ -97,6 +337,26 @@ def apply_pca(X: np.ndarray, n_components: int = 2) -> np.ndarray:
     if n_components > X.shape[1]:
         raise ValueError("n_components cannot exceed the number of features.")
 
-    pca = PCA(n_components=n_components)
+    if svd_solver not in PCA_SOLVERS:
+        raise ValueError(f"Unknown svd_solver '{svd_solver}'. Use one of {PCA_SOLVERS}.")
+
+    if svd_solver == "incremental":
+        out_dtype = np.dtype(dtype) if dtype is not None else X.dtype
+        if not np.issubdtype(out_dtype, np.floating):
+            out_dtype = np.dtype(np.float64)
+        X_pca, mean, components = _incremental_pca(X, n_components, out_dtype, batch_size)
+        if return_params:
+            return X_pca, mean, components
+        return X_pca
+
+    if dtype is not None:
+        X = X.astype(dtype, copy=False)
+
+    from sklearn.decomposition import PCA
+
+    pca = PCA(n_components=n_components, svd_solver=svd_solver, random_state=random_state)
     X_pca = pca.fit_transform(X)
+    if return_params:
+        dtype = X_pca.dtype
+        return X_pca, pca.mean_.astype(dtype), pca.components_.astype(dtype)
     return X_pca
@@ -0,0 +1,534 @@
+###
+## cluster_maker
+## James Foadi - University of Bath
+## November 2025
+###
+
+from __future__ import annotations
+
+import multiprocessing
+import time
+from contextlib import ExitStack
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .algorithms import (
+    _cluster_sums,
+    _float_dtype,
+    _nearest_centroid,
+    _sq_distances_to,
+)
+from .parallel import (
+    BACKENDS,
+    SharedArray,
+    _is_large_array,
+    effective_n_jobs,
+    resolve_shared,
+    shared_arrays,
+)
+
+Shard = Union[str, np.ndarray]
+
+SHARDED_INIT_METHODS = ("random", "k-means++")
+
+# Seconds to wait for a worker process to exit before terminating it
+_WORKER_JOIN_TIMEOUT = 5.0
+
+
+def _load_shard(
+    shard: Shard,
+    feature_cols: Optional[Sequence[Union[str, int]]],
+    dtype: Optional[Union[str, np.dtype]],
+) -> np.ndarray:
+    """
+    Feature matrix of one shard: an array as is (or attached from shared
+    memory), or a file read with ``load_features`` (``.npy`` shards are
+    memory-mapped).
+    """
+    shard = resolve_shared(shard)
+    if isinstance(shard, np.ndarray):
+        X = shard
+    else:
+        from .data_loader import input_format, load_features
+
+        if feature_cols is None:
+            if input_format(shard) != "npy":
+                raise ValueError("feature_cols is required for non-.npy shard files.")
+            X = np.load(shard, mmap_mode="r", allow_pickle=False)
+            feature_cols = list(range(X.shape[1]))
+        _, X = load_features(shard, feature_cols, dtype=dtype or "float64")
+    if X.ndim != 2:
+        raise ValueError("Every shard must be a 2D array.")
+    if dtype is not None:
+        X = X.astype(dtype, copy=False)
+    return X
+
+
+class _ShardGroup:
+    """
+    The shards held by one worker, with their per-shard state (labels and
+    k-means++ distances). Every method returns one entry per shard, in
+    shard order, so the coordinator's reductions do not depend on how
+    shards are spread over workers.
+    """
+
+    def __init__(
+        self,
+        shards: List[Shard],
+        feature_cols: Optional[Sequence[Union[str, int]]],
+        dtype: Optional[Union[str, np.dtype]],
+    ) -> None:
+        self.X = [_load_shard(shard, feature_cols, dtype) for shard in shards]
+        self.labels: List[Optional[np.ndarray]] = [None] * len(self.X)
+        self.x_sq: List[Optional[np.ndarray]] = [None] * len(self.X)
+        self.closest_sq: List[Optional[np.ndarray]] = [None] * len(self.X)
+        self.cumulative: List[Optional[np.ndarray]] = [None] * len(self.X)
+
+    def describe(self) -> List[Tuple[Tuple[int, int], np.dtype]]:
+        return [(X.shape, X.dtype) for X in self.X]
+
+    def rows(self, shard: int, indices: np.ndarray) -> np.ndarray:
+        return np.asarray(self.X[shard][indices])
+
+    def seed_distances(self, centre: np.ndarray) -> List[float]:
+        """
+        Update the squared distance of every row to its closest seed with
+        a new seed; return the per-shard totals.
+        """
+        totals = []
+        for i, X in enumerate(self.X):
+            dtype = np.result_type(X.dtype, np.float32)
+            if self.x_sq[i] is None:
+                self.x_sq[i] = np.einsum("ij,ij->i", X, X, dtype=dtype)
+            sq_dist = _sq_distances_to(X, self.x_sq[i], centre.astype(dtype))
+            if self.closest_sq[i] is None:
+                self.closest_sq[i] = sq_dist
+            else:
+                np.minimum(self.closest_sq[i], sq_dist, out=self.closest_sq[i])
+            self.cumulative[i] = np.cumsum(self.closest_sq[i])
+            totals.append(float(self.cumulative[i][-1]) if X.shape[0] else 0.0)
+        return totals
+
+    def locate(self, shard: int, value: float) -> int:
+        """
+        Row of a shard where the running sum of seed distances passes value.
+        """
+        cumulative = self.cumulative[shard]
+        idx = int(np.searchsorted(cumulative, value, side="right"))
+        return min(idx, cumulative.shape[0] - 1)
+
+    def assign(
+        self, centroids: np.ndarray
+    ) -> List[Tuple[np.ndarray, np.ndarray, float, int]]:
+        """
+        Assign every row to its nearest centroid.
+
+        Returns, per shard, the cluster sums and counts, the sum of squared
+        distances and the number of rows whose label changed.
+        """
+        k = centroids.shape[0]
+        results = []
+        for i, X in enumerate(self.X):
+            labels, min_sq_dist = _nearest_centroid(X, centroids)
+            previous = self.labels[i]
+            if previous is None:
+                n_reassigned = labels.shape[0]
+            else:
+                n_reassigned = int(np.count_nonzero(labels != previous))
+            self.labels[i] = labels
+            sums, counts = _cluster_sums(X, labels, k)
+            results.append(
+                (sums, counts, float(min_sq_dist.sum(dtype=np.float64)), n_reassigned)
+            )
+        return results
+
+    def final_labels(self) -> List[np.ndarray]:
+        return list(self.labels)
+
+    def release(self) -> None:
+        # Drop the seeding state, which is not needed during iterations
+        self.x_sq = [None] * len(self.X)
+        self.closest_sq = [None] * len(self.X)
+        self.cumulative = [None] * len(self.X)
+
+
+def _worker_main(conn, shards, feature_cols, dtype) -> None:
+    """
+    Worker-process loop: hold a shard group and run the coordinator's
+    requests ``(method, args)`` until it sends ``None``.
+    """
+    try:
+        group = _ShardGroup(shards, feature_cols, dtype)
+        conn.send(("ok", None))
+        while True:
+            request = conn.recv()
+            if request is None:
+                break
+            method, args = request
+            try:
+                conn.send(("ok", getattr(group, method)(*args)))
+            except Exception as exc:
+                conn.send(("error", exc))
+    except Exception as exc:
+        conn.send(("error", exc))
+    finally:
+        conn.close()
+
+
+class _ProcessWorkers:
+    """
+    One worker process per shard group, driven over pipes. Large array
+    shards are passed through shared memory, released by ``close``.
+    """
+
+    def __init__(self, groups, feature_cols, dtype) -> None:
+        self._conns = []
+        self._processes = []
+        self._shared = ExitStack()
+        try:
+            for shards in groups:
+                shards = self._share(shards)
+                parent, child = multiprocessing.Pipe()
+                process = multiprocessing.Process(
+                    target=_worker_main, args=(child, shards, feature_cols, dtype),
+                    daemon=True,
+                )
+                process.start()
+                child.close()
+                self._conns.append(parent)
+                self._processes.append(process)
+            for conn in self._conns:
+                self._receive(conn)
+        except BaseException:
+            self.close()
+            raise
+
+    def _share(self, shards: List[Shard]) -> List[Union[Shard, SharedArray]]:
+        positions = [i for i, shard in enumerate(shards) if _is_large_array(shard)]
+        if not positions:
+            return shards
+        handles = self._shared.enter_context(shared_arrays([shards[i] for i in positions]))
+        shards = list(shards)
+        for i, handle in zip(positions, handles):
+            shards[i] = handle
+        return shards
+
+    @staticmethod
+    def _receive(conn) -> Any:
+        try:
+            status, value = conn.recv()
+        except EOFError:
+            raise RuntimeError("A shard worker process exited unexpectedly.") from None
+        if status == "error":
+            raise value
+        return value
+
+    def call(self, worker: int, method: str, *args) -> Any:
+        self._conns[worker].send((method, args))
+        return self._receive(self._conns[worker])
+
+    def call_all(self, method: str, *args) -> List[Any]:
+        # Send to every worker first so the groups run concurrently
+        for conn in self._conns:
+            conn.send((method, args))
+        return [self._receive(conn) for conn in self._conns]
+
+    def close(self) -> None:
+        for conn in self._conns:
+            try:
+                conn.send(None)
+            except (OSError, ValueError):
+                pass
+        for process in self._processes:
+            process.join(_WORKER_JOIN_TIMEOUT)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        for conn in self._conns:
+            conn.close()
+        self._conns, self._processes = [], []
+        self._shared.close()
+
+
+class _ThreadWorkers:
+    """
+    Shard groups held in this process and run in a thread pool.
+    """
+
+    def __init__(self, groups, feature_cols, dtype) -> None:
+        self._groups = [_ShardGroup(shards, feature_cols, dtype) for shards in groups]
+        self._executor = ThreadPoolExecutor(max_workers=len(self._groups))
+
+    def call(self, worker: int, method: str, *args) -> Any:
+        return getattr(self._groups[worker], method)(*args)
+
+    def call_all(self, method: str, *args) -> List[Any]:
+        return list(
+            self._executor.map(lambda group: getattr(group, method)(*args), self._groups)
+        )
+
+    def close(self) -> None:
+        self._executor.shutdown()
+        self._groups = []
+
+
+class _ShardIndex:
+    """
+    Map global row indices (rows of the concatenated shards) to
+    (worker, shard within the worker, local row).
+    """
+
+    def __init__(self, group_sizes: List[List[int]]) -> None:
+        self.locations = [
+            (worker, shard)
+            for worker, sizes in enumerate(group_sizes)
+            for shard in range(len(sizes))
+        ]
+        sizes = [size for sizes in group_sizes for size in sizes]
+        self.offsets = np.concatenate([[0], np.cumsum(sizes)]).astype(np.int64)
+        self.n_samples = int(self.offsets[-1])
+
+    def find(self, index: int) -> Tuple[int, int, int]:
+        position = int(np.searchsorted(self.offsets, index, side="right")) - 1
+        worker, shard = self.locations[position]
+        return worker, shard, int(index - self.offsets[position])
+
+
+def _fetch_rows(workers, index: _ShardIndex, indices: Sequence[int]) -> np.ndarray:
+    rows = []
+    for global_index in indices:
+        worker, shard, local = index.find(int(global_index))
+        rows.append(workers.call(worker, "rows", shard, np.array([local]))[0])
+    return np.array(rows)
+
+
+def _sharded_init(
+    workers,
+    index: _ShardIndex,
+    k: int,
+    random_state: Optional[int],
+    init: Union[str, np.ndarray],
+    n_features: int,
+    dtype: np.dtype,
+) -> np.ndarray:
+    """
+    ``init_centroids`` over the concatenated shards, drawing the same
+    random numbers (and so, up to rounding in the running sums of
+    k-means++, the same rows) as the single-process version.
+    """
+    n_samples = index.n_samples
+    if k <= 0:
+        raise ValueError("k must be a positive integer.")
+    if k > n_samples:
+        raise ValueError("k cannot be larger than the number of samples.")
+    if isinstance(init, np.ndarray):
+        if init.shape != (k, n_features):
+            raise ValueError("init array must have shape (k, n_features).")
+        return init.astype(dtype)
+    if init not in SHARDED_INIT_METHODS:
+        raise ValueError(
+            f"Unknown init '{init}' for sharded K-means. "
+            f"Use one of {SHARDED_INIT_METHODS} or an array."
+        )
+
+    rng = np.random.RandomState(random_state)
+    if init == "random":
+        return _fetch_rows(workers, index, rng.choice(n_samples, size=k, replace=False))
+
+    # k-means++: workers keep the distances to the closest seed; the
+    # coordinator walks the per-shard totals to find the shard of each draw.
+    seeds = [_fetch_rows(workers, index, [rng.randint(0, n_samples)])[0]]
+    for _ in range(1, k):
+        totals = [t for group in workers.call_all("seed_distances", seeds[-1]) for t in group]
+        offsets = np.cumsum(totals)
+        total = offsets[-1]
+        if total > 0:
+            value = rng.uniform(0.0, total)
+            position = min(int(np.searchsorted(offsets, value, side="right")), len(totals) - 1)
+            worker, shard = index.locations[position]
+            before = offsets[position - 1] if position else 0.0
+            local = workers.call(worker, "locate", shard, value - before)
+            row = workers.call(worker, "rows", shard, np.array([local]))[0]
+        else:
+            # Every point coincides with a chosen centre
+            row = _fetch_rows(workers, index, [rng.randint(0, n_samples)])[0]
+        seeds.append(row)
+    workers.call_all("release")
+    return np.array(seeds)
+
+
+def _split_shards(shards: List[Shard], n_workers: int) -> List[List[Shard]]:
+    """
+    Contiguous groups of shards, one per worker.
+    """
+    bounds = np.linspace(0, len(shards), n_workers + 1).round().astype(int)
+    return [shards[a:b] for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+
+
+def sharded_kmeans(
+    shards: Sequence[Shard],
+    k: int,
+    max_iter: int = 300,
+    tol: float = 1e-4,
+    random_state: Optional[int] = None,
+    init: Union[str, np.ndarray] = "k-means++",
+    feature_cols: Optional[Sequence[Union[str, int]]] = None,
+    dtype: Optional[Union[str, np.dtype]] = None,
+    n_jobs: Optional[int] = -1,
+    backend: str = "processes",
+    return_inertia: bool = False,
+    return_stats: bool = False,
+):
+    """
+    K-means over data split into shards, without ever concatenating them.
+
+    Each worker loads and keeps its own shards. Every iteration the
+    coordinator broadcasts the centroids, each worker assigns its rows and
+    returns only per-shard cluster sums, counts and sums of squares (plus
+    the number of changed labels), and the coordinator reduces these into
+    the new centroids (map-reduce). Seeding draws the same random numbers
+    as ``init_centroids`` over the concatenated rows.
+
+    The result is that of ``kmeans`` on the concatenated shards (same
+    seeding, update, empty-cluster and stopping rules): the labels are the
+    same and the centroids and inertia agree to floating-point rounding,
+    since the per-shard sums are added in a different order.
+
+    Parameters
+    ----------
+    shards : list of str or ndarray
+        Shards in row order: arrays of shape (n_i, n_features), or file
+        paths read by each worker with ``load_features`` (``.npy`` shards
+        are memory-mapped).
+    k : int
+    max_iter, tol, random_state : as in ``kmeans``
+    init : {"k-means++", "random"} or ndarray, default "k-means++"
+    feature_cols : list or None, default None
+        Feature columns of file shards (all columns of ``.npy`` files if
+        None; required for other formats).
+    dtype : str, numpy dtype or None, default None
+        If given, shards are converted to this dtype.
+    n_jobs : int or None, default -1
+        Number of workers (at most one per shard); shards are split into
+        contiguous groups, one per worker.
+    backend : {"processes", "threads"}, default "processes"
+        "processes" starts one worker process per group (shard data stays
+        in the workers); "threads" runs the groups in this process.
+    return_inertia : bool, default False
+    return_stats : bool, default False
+        If True, also return a dict with "n_iter", "converged",
+        "inertia_per_iter", "n_reassigned_per_iter", "n_shards",
+        "n_workers" and the "time_init", "time_assign" (map) and
+        "time_update" (reduce) wall times.
+
+    Returns
+    -------
+    labels : ndarray of shape (n_samples,)
+        Labels of the concatenated shards.
+    centroids : ndarray of shape (k, n_features)
+    inertia : float, only if return_inertia is True
+    stats : dict, only if return_stats is True
+    """
+    shards = list(shards)
+    if not shards:
+        raise ValueError("At least one shard is required.")
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}'. Use one of {BACKENDS}.")
+    n_workers = min(effective_n_jobs(n_jobs), len(shards))
+    groups = _split_shards(shards, n_workers)
+
+    pool = _ProcessWorkers if backend == "processes" else _ThreadWorkers
+    workers = pool(groups, feature_cols, dtype)
+    try:
+        described = workers.call_all("describe")
+        shapes = [shape for group in described for shape, _ in group]
+        if len({shape[1] for shape in shapes}) != 1:
+            raise ValueError("All shards must have the same number of features.")
+        n_features = shapes[0][1]
+        X_dtype = np.result_type(*[dt for group in described for _, dt in group])
+        float_dtype = _float_dtype(np.empty(0, dtype=X_dtype))
+        index = _ShardIndex([[shape[0] for shape, _ in group] for group in described])
+
+        start_time = time.perf_counter()
+        centroids = _sharded_init(
+            workers, index, k, random_state, init, n_features, float_dtype
+        ).astype(float_dtype)
+        time_init = time.perf_counter() - start_time
+
+        inertia_history: List[float] = []
+        reassigned_history: List[int] = []
+        time_assign = time_update = 0.0
+        n_iter = 0
+        converged = stable = False
+
+        def assign() -> Tuple[np.ndarray, np.ndarray]:
+            # Map: per-shard sums, counts and SSE; reduce in shard order
+            nonlocal time_assign
+            start = time.perf_counter()
+            parts = [part for group in workers.call_all("assign", centroids) for part in group]
+            sums = np.zeros((k, n_features))
+            counts = np.zeros(k)
+            inertia = 0.0
+            n_reassigned = 0
+            for part_sums, part_counts, part_sse, part_reassigned in parts:
+                sums += part_sums
+                counts += part_counts
+                inertia += part_sse
+                n_reassigned += part_reassigned
+            inertia_history.append(inertia)
+            reassigned_history.append(n_reassigned)
+            time_assign += time.perf_counter() - start
+            return sums, counts
+
+        for _ in range(max_iter):
+            sums, counts = assign()
+            if len(reassigned_history) > 1 and reassigned_history[-1] == 0:
+                converged = stable = True
+                break
+
+            start = time.perf_counter()
+            new_centroids = np.empty_like(centroids)
+            non_empty = counts > 0
+            new_centroids[non_empty] = sums[non_empty] / counts[non_empty, np.newaxis]
+            if not non_empty.all():
+                # Same re-seeding of empty clusters as update_centroids
+                rng = np.random.RandomState(random_state)
+                for cluster_id in np.flatnonzero(~non_empty):
+                    row = _fetch_rows(workers, index, [rng.randint(0, index.n_samples)])
+                    new_centroids[cluster_id] = row[0]
+            shift = np.linalg.norm(new_centroids - centroids)
+            centroids = new_centroids
+            time_update += time.perf_counter() - start
+            n_iter += 1
+            if shift < tol:
+                converged = True
+                break
+
+        if not stable:
+            assign()
+
+        labels = np.concatenate(
+            [labels for group in workers.call_all("final_labels") for labels in group]
+        )
+    finally:
+        workers.close()
+
+    stats: Dict[str, object] = {
+        "n_iter": n_iter,
+        "converged": converged,
+        "inertia_per_iter": inertia_history,
+        "n_reassigned_per_iter": reassigned_history,
+        "n_shards": len(shards),
+        "n_workers": len(groups),
+        "time_init": time_init,
+        "time_assign": time_assign,
+        "time_update": time_update,
+    }
+    result = [labels, centroids]
+    if return_inertia:
+        result.append(inertia_history[-1])
+    if return_stats:
+        result.append(stats)
+    return tuple(result)
@@ -0,0 +1,264 @@
+###
+## cluster_maker
+## James Foadi - University of Bath
+## November 2025
+###
+
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from .algorithms import (
+    _exact_distances,
+    _float_dtype,
+    _nearest_centroid,
+    _rows_per_chunk,
+    _sq_residuals,
+)
+
+ASSIGN_METHODS = ("auto", "brute", "kdtree", "filtering")
+
+# A KD-tree over the centroids beats the brute-force distance block once
+# there are enough centroids per cell of the feature space: roughly when
+# k >= _KDTREE_MIN_K_PER_CELL * 2 ** n_features. Above
+# _KDTREE_MAX_FEATURES dimensions the tree search degrades towards a
+# linear scan and brute force is always used.
+_KDTREE_MIN_K_PER_CELL = 16
+_KDTREE_MAX_FEATURES = 8
+
+DEFAULT_LEAF_SIZE = 256
+
+
+def choose_assign_method(k: int, n_features: int) -> str:
+    """
+    Assignment backend used for method="auto": "kdtree" for many centroids
+    in few dimensions, "brute" otherwise.
+    """
+    if 2 <= k and n_features <= _KDTREE_MAX_FEATURES:
+        if k >= _KDTREE_MIN_K_PER_CELL * 2 ** n_features:
+            return "kdtree"
+    return "brute"
+
+
+def _error_scale(dtype: np.dtype, n_features: int) -> float:
+    # Same rounding-error bound as the brute-force search, so near-ties are
+    # resolved by the same exact computation.
+    return 8.0 * (n_features + 2) * np.finfo(dtype).eps
+
+
+def kdtree_nearest(
+    X: np.ndarray,
+    centroids: np.ndarray,
+    workers: int = -1,
+    chunk_size: Optional[int] = None,
+    memory_budget: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Nearest-centroid search with a ``scipy.spatial.cKDTree`` built over the
+    centroids.
+
+    Each row chunk is queried for its two nearest centroids, in parallel
+    over ``workers`` threads (-1 for all CPUs). Rows whose two nearest
+    centroids are within rounding error of each other are re-evaluated
+    with ``np.linalg.norm``, as in the brute-force search, so the labels
+    are the same (ties go to the lowest centroid index).
+
+    Returns
+    -------
+    labels : ndarray of shape (n_samples,)
+    min_sq_dist : ndarray of shape (n_samples,)
+        Squared distance from each sample to its assigned centroid.
+    """
+    from scipy.spatial import cKDTree
+
+    n_samples, n_features = X.shape
+    k = centroids.shape[0]
+    dtype = np.result_type(X.dtype, centroids.dtype, np.float32)
+    centroids = np.asarray(centroids, dtype=dtype)
+    if k < 2:
+        labels = np.zeros(n_samples, dtype=np.intp)
+        return labels, _sq_residuals(X, labels, centroids, chunk_size, memory_budget)
+
+    tree = cKDTree(centroids.astype(np.float64))
+    c_sq_max = float(np.einsum("ij,ij->i", centroids, centroids).max())
+    error_scale = _error_scale(dtype, n_features)
+
+    labels = np.empty(n_samples, dtype=np.intp)
+    min_sq_dist = np.empty(n_samples, dtype=dtype)
+    # The tree works on a float64 copy of each chunk.
+    rows = _rows_per_chunk(
+        n_samples, max(1, n_features + 4) * 8, chunk_size, memory_budget
+    )
+    for start in range(0, n_samples, rows):
+        stop = min(start + rows, n_samples)
+        X_chunk = np.asarray(X[start:stop], dtype=np.float64)
+        distances, nearest = tree.query(X_chunk, k=2, workers=workers)
+        sq_dist = distances * distances
+
+        x_sq = np.einsum("ij,ij->i", X_chunk, X_chunk)
+        gap = sq_dist[:, 1] - sq_dist[:, 0]
+        ambiguous = np.flatnonzero(gap <= error_scale * (x_sq + c_sq_max))
+
+        chunk_labels = nearest[:, 0]
+        best = sq_dist[:, 0]
+        if ambiguous.size:
+            exact = _exact_distances(
+                np.asarray(X[start:stop][ambiguous], dtype=dtype), centroids,
+                memory_budget=memory_budget,
+            )
+            exact_labels = np.argmin(exact, axis=1)
+            chunk_labels[ambiguous] = exact_labels
+            best[ambiguous] = exact[np.arange(ambiguous.size), exact_labels] ** 2
+        labels[start:stop] = chunk_labels
+        min_sq_dist[start:stop] = best
+    return labels, min_sq_dist
+
+
+class DataKDTree:
+    """
+    KD-tree over the data, for the filtering algorithm of Kanungo et al.
+
+    The tree is built once per fit and reused by every assignment pass.
+    Each node stores the bounding box of its points; during a pass every
+    node carries the set of centroids that may still be the nearest for
+    some point in its box. A centroid is pruned when the candidate closest
+    to the box centre is nearer to every point of the box (tested on the
+    box vertex furthest in the direction of the pruned centroid). A node
+    left with a single candidate is assigned as a whole, and the points of
+    the remaining leaves are searched by brute force over their candidates.
+
+    Pruning keeps a margin of the same rounding-error bound as the
+    brute-force search, so near-ties are never pruned and the labels equal
+    ``assign_clusters`` (ties go to the lowest centroid index). The
+    filtering is most effective in low dimension with well-separated
+    clusters.
+
+    Parameters
+    ----------
+    X : ndarray of shape (n_samples, n_features)
+        Data, kept by reference (not copied).
+    leaf_size : int, default 256
+        Nodes with at most this many points are not split.
+    """
+
+    def __init__(self, X: np.ndarray, leaf_size: int = DEFAULT_LEAF_SIZE) -> None:
+        if leaf_size <= 0:
+            raise ValueError("leaf_size must be a positive integer.")
+        self.X = X
+        self.leaf_size = int(leaf_size)
+        n_samples = X.shape[0]
+        order = np.arange(n_samples)
+
+        lo: List[np.ndarray] = []
+        hi: List[np.ndarray] = []
+        bounds: List[Tuple[int, int]] = []
+        children: List[Tuple[int, int]] = []
+
+        def add_node(start: int, stop: int) -> int:
+            points = np.asarray(X[order[start:stop]], dtype=np.float64)
+            lo.append(points.min(axis=0))
+            hi.append(points.max(axis=0))
+            bounds.append((start, stop))
+            children.append((-1, -1))
+            return len(bounds) - 1
+
+        pending = [add_node(0, n_samples)] if n_samples else []
+        while pending:
+            node = pending.pop()
+            start, stop = bounds[node]
+            width = hi[node] - lo[node]
+            dim = int(np.argmax(width))
+            if stop - start <= self.leaf_size or width[dim] == 0.0:
+                continue
+            # Median split along the widest side of the box
+            mid = (start + stop) // 2
+            members = order[start:stop]
+            split = np.argpartition(np.asarray(X[members, dim]), mid - start)
+            order[start:stop] = members[split]
+            children[node] = (add_node(start, mid), add_node(mid, stop))
+            pending.extend(children[node])
+
+        self.order = order
+        self.lo = np.array(lo).reshape(len(bounds), X.shape[1])
+        self.hi = np.array(hi).reshape(len(bounds), X.shape[1])
+        self.bounds = np.array(bounds, dtype=np.intp).reshape(len(bounds), 2)
+        self.children = np.array(children, dtype=np.intp).reshape(len(bounds), 2)
+        # Squared norm of the box point furthest from the origin, for the
+        # rounding-error margin of the pruning test.
+        self._reach = np.maximum(self.lo ** 2, self.hi ** 2).sum(axis=1)
+
+    @property
+    def n_nodes(self) -> int:
+        return self.bounds.shape[0]
+
+    def _prune(
+        self,
+        node: int,
+        candidates: np.ndarray,
+        centroids: np.ndarray,
+        c_sq: np.ndarray,
+        error_scale: float,
+    ) -> np.ndarray:
+        lo, hi = self.lo[node], self.hi[node]
+        C = centroids[candidates]
+        to_mid = C - 0.5 * (lo + hi)
+        best = int(np.argmin(np.einsum("ij,ij->i", to_mid, to_mid)))
+        z = C[best]
+
+        # Vertex of the box furthest in the direction of each candidate
+        vertex = np.where(C > z, hi, lo)
+        to_c = C - vertex
+        to_z = z - vertex
+        gain = np.einsum("ij,ij->i", to_c, to_c) - np.einsum("ij,ij->i", to_z, to_z)
+        margin = error_scale * (self._reach[node] + c_sq[candidates] + c_sq[candidates[best]])
+        return candidates[gain <= margin]
+
+    def nearest(self, centroids: np.ndarray) -> Tuple[np.ndarray, np.ndarray, int]:
+        """
+        Nearest centroid of every point of the tree.
+
+        Returns
+        -------
+        labels : ndarray of shape (n_samples,)
+        min_sq_dist : ndarray of shape (n_samples,)
+            Squared distance from each sample to its assigned centroid.
+        n_distances : int
+            Number of point-to-centroid distances evaluated in the leaves
+            (n_samples * k for brute force).
+        """
+        X = self.X
+        n_samples, n_features = X.shape
+        k = centroids.shape[0]
+        dtype = np.result_type(_float_dtype(X), centroids.dtype)
+        centroids = np.asarray(centroids, dtype=dtype)
+        centroids64 = centroids.astype(np.float64)
+        c_sq = np.einsum("ij,ij->i", centroids64, centroids64)
+        error_scale = _error_scale(dtype, n_features)
+
+        labels = np.empty(n_samples, dtype=np.intp)
+        n_distances = 0
+        stack = [(0, np.arange(k))] if n_samples else []
+        while stack:
+            node, candidates = stack.pop()
+            if candidates.size > 1:
+                candidates = self._prune(node, candidates, centroids64, c_sq, error_scale)
+            start, stop = self.bounds[node]
+            members = self.order[start:stop]
+            if candidates.size == 1:
+                labels[members] = candidates[0]
+                continue
+            left, right = self.children[node]
+            if left >= 0:
+                stack.append((right, candidates))
+                stack.append((left, candidates))
+                continue
+            # Candidates stay in increasing order, so ties still go to the
+            # lowest centroid index.
+            leaf_labels, _ = _nearest_centroid(X[members], centroids[candidates])
+            labels[members] = candidates[leaf_labels]
+            n_distances += members.size * candidates.size
+
+        min_sq_dist = _sq_residuals(X, labels, centroids)
+        return labels, min_sq_dist, n_distances
@@ -0,0 +1,343 @@
+import unittest
+
+import numpy as np
+
+from cluster_maker import algorithms
+from cluster_maker.algorithms import (
+    assign_clusters,
+    bisecting_kmeans,
+    update_centroids,
+    kmeans,
+    kmeans_elkan,
+    kmeans_hamerly,
+    MiniBatchKMeans,
+    KMeansWorkspace,
+    init_centroids,
+)
+from cluster_maker.spatial import DataKDTree, choose_assign_method
+
+
+def brute_force_labels(X, centroids):
+    diff = X[:, np.newaxis, :] - centroids[np.newaxis, :, :]
+    return np.argmin(np.linalg.norm(diff, axis=2), axis=1)
+
+
+class TestInitCentroids(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        centres = np.array([[0.0, 0.0], [50.0, 0.0], [0.0, 50.0], [50.0, 50.0]])
+        self.X = np.vstack([c + rng.normal(size=(100, 2)) for c in centres])
+
+    def test_reproducible(self):
+        for init in ("random", "k-means++", "k-means||"):
+            first = init_centroids(self.X, 4, random_state=3, init=init)
+            second = init_centroids(self.X, 4, random_state=3, init=init)
+            self.assertEqual(first.shape, (4, 2))
+            np.testing.assert_array_equal(first, second)
+
+    def test_kmeans_plus_plus_spreads_centroids(self):
+        for seed in range(5):
+            centroids = init_centroids(self.X, 4, random_state=seed, init="k-means++")
+            nearest = assign_clusters(centroids, np.array(
+                [[0.0, 0.0], [50.0, 0.0], [0.0, 50.0], [50.0, 50.0]]
+            ))
+            self.assertEqual(sorted(nearest), [0, 1, 2, 3])
+
+    def test_kmeans_parallel_top_up_picks_distinct_rows(self):
+        # Without sampling rounds, all but the first candidate come from the top-up
+        for seed in range(20):
+            centroids = algorithms._kmeans_parallel(
+                self.X, 20, np.random.RandomState(seed), n_rounds=0
+            )
+            self.assertEqual(len(np.unique(centroids, axis=0)), 20)
+
+    def test_unknown_init(self):
+        with self.assertRaises(ValueError):
+            init_centroids(self.X, 4, init="bogus")
+
+
+class TestAssignClusters(unittest.TestCase):
+    def test_matches_brute_force(self):
+        rng = np.random.RandomState(0)
+        X = rng.normal(loc=50.0, size=(500, 8))
+        centroids = rng.normal(loc=50.0, size=(7, 8))
+
+        expected = brute_force_labels(X, centroids)
+        np.testing.assert_array_equal(assign_clusters(X, centroids), expected)
+        np.testing.assert_array_equal(
+            assign_clusters(X, centroids, chunk_size=13), expected
+        )
+
+    def test_ties_go_to_lowest_index(self):
+        rng = np.random.RandomState(1)
+        X = rng.normal(size=(100, 3))
+        centroids = rng.normal(size=(4, 3))
+        centroids[2] = centroids[0]
+
+        labels = assign_clusters(X, centroids, memory_budget=256)
+        np.testing.assert_array_equal(labels, brute_force_labels(X, centroids))
+        self.assertNotIn(2, labels)
+
+
+class TestUpdateCentroids(unittest.TestCase):
+    def test_matches_per_cluster_mean(self):
+        rng = np.random.RandomState(0)
+        X = rng.normal(size=(200, 4))
+        labels = rng.randint(0, 5, size=200)
+
+        centroids = update_centroids(X, labels, 5)
+        for cluster_id in range(5):
+            np.testing.assert_allclose(
+                centroids[cluster_id], X[labels == cluster_id].mean(axis=0)
+            )
+
+    def test_sample_weight(self):
+        X = np.array([[0.0, 0.0], [4.0, 4.0], [10.0, 10.0]])
+        labels = np.array([0, 0, 1])
+        weights = np.array([3.0, 1.0, 2.0])
+
+        centroids = update_centroids(X, labels, 2, sample_weight=weights)
+        np.testing.assert_allclose(centroids, [[1.0, 1.0], [10.0, 10.0]])
+
+    def test_empty_cluster_is_reseeded_from_X(self):
+        rng = np.random.RandomState(2)
+        X = rng.normal(size=(30, 2))
+        labels = np.zeros(30, dtype=int)
+
+        centroids = update_centroids(X, labels, 3, random_state=0)
+        expected_rng = np.random.RandomState(0)
+        np.testing.assert_array_equal(centroids[1], X[expected_rng.randint(0, 30)])
+        np.testing.assert_array_equal(centroids[2], X[expected_rng.randint(0, 30)])
+
+
+class TestKMeansRestarts(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        self.X = rng.normal(size=(300, 3))
+
+    @staticmethod
+    def inertia(X, labels, centroids):
+        return float(np.sum((X - centroids[labels]) ** 2))
+
+    def test_n_init_keeps_lowest_inertia(self):
+        labels, centroids = kmeans(self.X, 5, random_state=0, init="random", n_init=6)
+        best = self.inertia(self.X, labels, centroids)
+
+        seeds = np.random.RandomState(0).randint(0, 2 ** 31 - 1, size=6)
+        for seed in seeds:
+            single = kmeans(self.X, 5, random_state=int(seed), init="random")
+            self.assertLessEqual(best, self.inertia(self.X, *single) + 1e-9)
+
+    def test_parallel_matches_serial(self):
+        serial = kmeans(self.X, 5, random_state=0, n_init=4)
+        for backend in ("threads", "processes"):
+            parallel = kmeans(
+                self.X, 5, random_state=0, n_init=4, n_jobs=2, backend=backend
+            )
+            np.testing.assert_array_equal(parallel[0], serial[0])
+            np.testing.assert_array_equal(parallel[1], serial[1])
+
+    def test_workspace_matches_plain_lloyd(self):
+        centroids = init_centroids(self.X, 4, random_state=3)
+        for _ in range(300):
+            labels = assign_clusters(self.X, centroids)
+            new_centroids = update_centroids(self.X, labels, 4, random_state=3)
+            shift = np.linalg.norm(new_centroids - centroids)
+            centroids = new_centroids
+            if shift < 1e-4:
+                break
+        labels = assign_clusters(self.X, centroids)
+
+        fit_labels, fit_centroids = kmeans(self.X, 4, random_state=3)
+        np.testing.assert_array_equal(fit_labels, labels)
+        np.testing.assert_array_equal(fit_centroids, centroids)
+
+    def test_stats_record_each_iteration(self):
+        labels, centroids, inertia, stats = kmeans(
+            self.X, 4, random_state=0, tol=0.0, return_inertia=True, return_stats=True
+        )
+        self.assertTrue(stats["converged"])
+        # tol=0 only stops on a pass that changes no label
+        self.assertEqual(stats["n_reassigned_per_iter"][0], self.X.shape[0])
+        self.assertEqual(stats["n_reassigned_per_iter"][-1], 0)
+        self.assertEqual(len(stats["inertia_per_iter"]), stats["n_iter"] + 1)
+        self.assertAlmostEqual(stats["inertia_per_iter"][-1], inertia)
+        # Lloyd iterations never increase the objective
+        history = np.array(stats["inertia_per_iter"])
+        self.assertTrue(np.all(np.diff(history) <= 1e-9 * history[0]))
+        for key in ("time_init", "time_assign", "time_update"):
+            self.assertGreaterEqual(stats[key], 0.0)
+
+    def test_stops_when_labels_are_stable(self):
+        labels, centroids = kmeans(self.X, 4, random_state=0)
+        # Starting from a converged solution, the first update reproduces
+        # it and the next pass changes nothing.
+        _, again, stats = kmeans(self.X, 4, init=centroids, return_stats=True)
+        self.assertEqual(stats["n_iter"], 1)
+        self.assertEqual(stats["n_reassigned_per_iter"], [self.X.shape[0], 0])
+        np.testing.assert_allclose(again, centroids)
+
+    def test_integer_input_gives_float_centroids(self):
+        X = (self.X * 10).astype(int)
+        labels, centroids = kmeans(X, 3, random_state=0, init="random")
+        expected = kmeans(X.astype(np.float64), 3, random_state=0, init="random")
+        self.assertEqual(centroids.dtype, np.float64)
+        np.testing.assert_array_equal(labels, expected[0])
+        np.testing.assert_allclose(centroids, expected[1])
+
+    def test_workspace_reused_across_fits(self):
+        workspace = KMeansWorkspace.for_data(self.X, 6)
+        results = {}
+        for k in (2, 4, 6):
+            results[k] = kmeans(self.X, k, random_state=0, workspace=workspace)
+        for k, (labels, centroids) in results.items():
+            fresh = kmeans(self.X, k, random_state=0)
+            np.testing.assert_array_equal(labels, fresh[0])
+            np.testing.assert_array_equal(centroids, fresh[1])
+            # Results must not alias the workspace buffers
+            self.assertFalse(np.shares_memory(labels, workspace.labels))
+            self.assertFalse(np.shares_memory(centroids, workspace.centroids))
+
+
+class TestAcceleratedKMeans(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        centres = rng.normal(scale=10.0, size=(6, 10))
+        self.X = np.vstack([c + rng.normal(size=(200, 10)) for c in centres])
+
+    def test_same_result_as_kmeans(self):
+        for accelerated in (kmeans_elkan, kmeans_hamerly):
+            for seed in (0, 1, 2):
+                labels, centroids = kmeans(self.X, 6, random_state=seed)
+                fast_labels, fast_centroids = accelerated(
+                    self.X, 6, random_state=seed
+                )
+                np.testing.assert_array_equal(fast_labels, labels)
+                np.testing.assert_array_equal(fast_centroids, centroids)
+
+    def test_reports_skipped_distances(self):
+        _, _, stats = kmeans_elkan(self.X, 6, random_state=0, return_stats=True)
+        self.assertGreater(stats["n_distances_skipped"], 0)
+        self.assertEqual(
+            stats["n_distances_computed"] + stats["n_distances_skipped"],
+            stats["n_distances_total"],
+        )
+
+
+class TestSpatialAssignment(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        centres = rng.uniform(-20.0, 20.0, size=(40, 2))
+        self.X = np.vstack([c + rng.normal(size=(100, 2)) for c in centres])
+        self.centroids = rng.uniform(-20.0, 20.0, size=(200, 2))
+
+    def test_matches_brute_force(self):
+        expected = brute_force_labels(self.X, self.centroids)
+        for method in ("brute", "kdtree", "filtering"):
+            labels = assign_clusters(self.X, self.centroids, method=method)
+            np.testing.assert_array_equal(labels, expected)
+
+    def test_ties_go_to_lowest_index(self):
+        X = np.round(self.X)
+        centroids = np.round(self.centroids)
+        centroids[7] = centroids[3]
+        expected = assign_clusters(X, centroids, method="brute")
+        self.assertNotIn(7, expected)
+        for method in ("kdtree", "filtering"):
+            labels = assign_clusters(X, centroids, method=method)
+            np.testing.assert_array_equal(labels, expected)
+
+    def test_filtering_prunes_distances(self):
+        tree = DataKDTree(self.X, leaf_size=32)
+        labels, min_sq_dist, n_distances = tree.nearest(self.centroids)
+        np.testing.assert_array_equal(labels, brute_force_labels(self.X, self.centroids))
+        self.assertLess(n_distances, self.X.shape[0] * self.centroids.shape[0] // 4)
+        residuals = self.X - self.centroids[labels]
+        np.testing.assert_allclose(min_sq_dist, np.sum(residuals ** 2, axis=1))
+
+    def test_kmeans_same_result_for_every_method(self):
+        labels, centroids = kmeans(self.X, 40, random_state=0, assign="brute")
+        for method in ("kdtree", "filtering", "auto"):
+            fast_labels, fast_centroids, stats = kmeans(
+                self.X, 40, random_state=0, assign=method, return_stats=True
+            )
+            np.testing.assert_array_equal(fast_labels, labels)
+            np.testing.assert_array_equal(fast_centroids, centroids)
+        self.assertEqual(stats["assign"], choose_assign_method(40, 2))
+
+    def test_auto_choice(self):
+        self.assertEqual(choose_assign_method(1000, 2), "kdtree")
+        self.assertEqual(choose_assign_method(8, 2), "brute")
+        self.assertEqual(choose_assign_method(10_000, 32), "brute")
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError):
+            kmeans(self.X, 3, assign="ball_tree")
+
+
+class TestBisectingKMeans(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        centres = rng.uniform(-30.0, 30.0, size=(8, 3))
+        self.X = np.vstack([c + rng.normal(size=(50, 3)) for c in centres])
+
+    def test_recovers_separated_clusters(self):
+        labels, centroids, inertia = bisecting_kmeans(
+            self.X, 8, random_state=0, return_inertia=True
+        )
+        self.assertEqual(centroids.shape, (8, 3))
+        self.assertEqual(np.bincount(labels, minlength=8).tolist(), [50] * 8)
+        expected = np.sum((self.X - centroids[labels]) ** 2)
+        self.assertAlmostEqual(inertia, expected, places=6)
+
+    def test_tree_gives_every_smaller_k(self):
+        _, _, tree = bisecting_kmeans(self.X, 8, random_state=1, return_tree=True)
+        self.assertTrue(np.all(np.diff(tree.inertia_path) <= 0))
+        for k in range(1, 8):
+            labels, centroids, inertia = bisecting_kmeans(
+                self.X, k, random_state=1, return_inertia=True
+            )
+            np.testing.assert_array_equal(tree.labels(k), labels)
+            np.testing.assert_allclose(tree.centroids(k), centroids)
+            self.assertAlmostEqual(tree.inertia(k), inertia, places=6)
+
+    def test_duplicate_points_still_split(self):
+        X = np.zeros((5, 2))
+        labels, centroids = bisecting_kmeans(X, 3, random_state=0)
+        self.assertEqual(len(np.unique(labels)), 3)
+        np.testing.assert_array_equal(centroids, np.zeros((3, 2)))
+
+
+class TestMiniBatchKMeans(unittest.TestCase):
+    def test_partial_fit_keeps_running_means(self):
+        rng = np.random.RandomState(0)
+        X = rng.normal(size=(600, 3))
+
+        model = MiniBatchKMeans(4, random_state=1)
+        for start in range(0, 600, 150):
+            model.partial_fit(X[start:start + 150])
+
+        self.assertEqual(model.n_batches_, 4)
+        self.assertEqual(model.counts_.sum(), 600)
+
+        # One more batch: each centroid moves to the running mean of its points
+        batch = rng.normal(size=(150, 3))
+        before = model.centroids_.copy()
+        counts_before = model.counts_.copy()
+        labels = model.predict(batch)
+        model.partial_fit(batch)
+        for cluster_id in range(4):
+            mask = labels == cluster_id
+            expected = (
+                before[cluster_id] * counts_before[cluster_id]
+                + batch[mask].sum(axis=0)
+            ) / (counts_before[cluster_id] + mask.sum())
+            np.testing.assert_allclose(model.centroids_[cluster_id], expected)
+
+    def test_predict_before_fit(self):
+        with self.assertRaises(ValueError):
+            MiniBatchKMeans(2).predict(np.zeros((3, 2)))
+
+
+if __name__ == "__main__":
+    unittest.main()
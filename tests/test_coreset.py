@@ -0,0 +1,69 @@
+import unittest
+
+import numpy as np
+
+from cluster_maker.algorithms import assign_clusters, kmeans
+from cluster_maker.coreset import StreamingCoreset, build_coreset
+from cluster_maker.evaluation import compute_inertia
+
+
+class TestCoreset(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        centres = rng.uniform(-20.0, 20.0, size=(5, 3))
+        self.X = np.vstack([c + rng.normal(size=(4000, 3)) for c in centres])
+
+    def test_small_input_is_kept_as_is(self):
+        points, weights = build_coreset(self.X[:100], 5, size=500)
+        np.testing.assert_array_equal(points, self.X[:100])
+        np.testing.assert_array_equal(weights, np.ones(100))
+
+    def test_weights_estimate_the_cost(self):
+        points, weights = build_coreset(self.X, 5, size=1000, random_state=0)
+        self.assertLessEqual(points.shape[0], 1000)
+        self.assertTrue(np.all(weights > 0))
+        self.assertAlmostEqual(weights.sum() / self.X.shape[0], 1.0, delta=0.1)
+
+        _, centroids = kmeans(self.X, 5, random_state=0)
+        full = compute_inertia(self.X, assign_clusters(self.X, centroids), centroids)
+        estimate = compute_inertia(
+            points, assign_clusters(points, centroids), centroids, sample_weight=weights
+        )
+        self.assertAlmostEqual(estimate / full, 1.0, delta=0.1)
+
+    def test_fit_on_coreset_is_close_to_full_fit(self):
+        points, weights = build_coreset(
+            self.X, 5, size=1000, random_state=0, chunk_size=3000
+        )
+        _, centroids, inertia = kmeans(
+            self.X, 5, random_state=0, n_init=3, return_inertia=True
+        )
+        _, coreset_centroids = kmeans(
+            points, 5, random_state=0, n_init=3, sample_weight=weights
+        )
+        labels = assign_clusters(self.X, coreset_centroids)
+        self.assertLess(compute_inertia(self.X, labels, coreset_centroids), 1.05 * inertia)
+
+    def test_single_streaming_pass(self):
+        builder = StreamingCoreset(5, size=800, random_state=0)
+        for start in range(0, self.X.shape[0], 2500):
+            builder.partial_fit(self.X[start:start + 2500])
+        self.assertEqual(builder.n_samples_seen_, self.X.shape[0])
+        points, weights = builder.coreset()
+        self.assertLessEqual(points.shape[0], 800)
+        # Reading the coreset does not change the builder's state
+        again, again_weights = builder.coreset()
+        np.testing.assert_array_equal(points, again)
+        np.testing.assert_array_equal(weights, again_weights)
+
+        expected = build_coreset(self.X, 5, size=800, random_state=0, chunk_size=2500)
+        np.testing.assert_array_equal(points, expected[0])
+        np.testing.assert_array_equal(weights, expected[1])
+
+    def test_size_must_cover_k(self):
+        with self.assertRaises(ValueError):
+            StreamingCoreset(10, size=5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,12 +4,19 @@
 ## November 2025
 ###
 
+import os
+import tempfile
 import unittest
 
 import numpy as np
 import pandas as pd
 
-from cluster_maker.dataframe_builder import define_dataframe_structure, simulate_data
+from cluster_maker.dataframe_builder import (
+    define_dataframe_structure,
+    simulate_data,
+    iter_simulated_data,
+    write_simulated_data,
+)
 
 
 class TestDataFrameBuilder(unittest.TestCase):
@@ -33,6 +40,39 @@ class TestDataFrameBuilder(unittest.TestCase):
         self.assertEqual(data.shape[0], 100)
         self.assertIn("true_cluster", data.columns)
 
+    def test_simulate_data_per_cluster_counts_and_std(self):
+        seed_df = pd.DataFrame({"x": [0.0, 100.0], "y": [0.0, 100.0]})
+        data = simulate_data(
+            seed_df, n_points=[3000, 1000], cluster_std=[0.5, 4.0], random_state=0
+        )
+        counts = data["true_cluster"].value_counts().sort_index()
+        self.assertListEqual(counts.tolist(), [3000, 1000])
+        stds = data.groupby("true_cluster")["x"].std()
+        self.assertAlmostEqual(stds[0], 0.5, delta=0.05)
+        self.assertAlmostEqual(stds[1], 4.0, delta=0.3)
+
+        with self.assertRaises(ValueError):
+            simulate_data(seed_df, n_points=[10, 10, 10])
+        with self.assertRaises(ValueError):
+            simulate_data(seed_df, cluster_std=[1.0, 0.0])
+
+    def test_chunked_generation_matches_simulate_data(self):
+        seed_df = pd.DataFrame({"x": [0.0, 5.0, 9.0], "y": [2.0, 4.0, 1.0]})
+        expected = simulate_data(seed_df, n_points=101, cluster_std=1.5, random_state=3)
+        chunks = list(
+            iter_simulated_data(seed_df, 101, 1.5, random_state=3, chunk_size=10)
+        )
+        self.assertEqual(len(chunks), 11)
+        pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), expected)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "sim.csv")
+            write_simulated_data(
+                seed_df, path, 101, 1.5, random_state=3, chunk_size=10
+            )
+            written = pd.read_csv(path)
+        pd.testing.assert_frame_equal(written, expected, check_exact=False)
+
 
 if __name__ == "__main__":
     unittest.main()
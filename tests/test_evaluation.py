@@ -0,0 +1,133 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from cluster_maker.algorithms import KMeansWorkspace, kmeans
+from sklearn.metrics import silhouette_score
+
+from cluster_maker.evaluation import (
+    compute_inertia,
+    elbow_curve,
+    iter_elbow_curve,
+    silhouette_score_fast,
+    choose_silhouette_method,
+)
+
+
+class TestComputeInertia(unittest.TestCase):
+    def test_matches_residual_sum_and_kmeans_by_product(self):
+        rng = np.random.RandomState(0)
+        X = rng.normal(size=(500, 3))
+        labels, centroids, inertia = kmeans(X, 4, random_state=0, return_inertia=True)
+
+        expected = np.sum((X - centroids[labels]) ** 2)
+        self.assertAlmostEqual(compute_inertia(X, labels, centroids), expected)
+        self.assertAlmostEqual(inertia, expected)
+
+    def test_weighted_equals_repeated_rows(self):
+        rng = np.random.RandomState(1)
+        X = rng.normal(size=(200, 3))
+        counts = rng.randint(1, 4, size=200)
+        init = X[:4].copy()
+        labels, centroids, inertia = kmeans(
+            X, 4, init=init, sample_weight=counts, return_inertia=True
+        )
+        X_rep = np.repeat(X, counts, axis=0)
+        rep_labels, rep_centroids, rep_inertia = kmeans(
+            X_rep, 4, init=init, return_inertia=True
+        )
+        np.testing.assert_array_equal(np.repeat(labels, counts), rep_labels)
+        np.testing.assert_allclose(centroids, rep_centroids)
+        self.assertAlmostEqual(inertia, rep_inertia)
+        self.assertAlmostEqual(
+            compute_inertia(X, labels, centroids, sample_weight=counts), rep_inertia
+        )
+
+
+class TestSilhouetteFast(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        self.X = rng.normal(size=(600, 3))
+        self.X[:300] += 4.0
+        self.labels = (np.arange(600) >= 300).astype(int)
+        # A small cluster and a singleton, far from the others
+        self.X[:2] += 20.0
+        self.labels[:2] = 2
+        self.X[599] -= 20.0
+        self.labels[599] = 3
+
+    def test_exact_chunked_matches_sklearn(self):
+        expected = silhouette_score(self.X, self.labels)
+        score = silhouette_score_fast(
+            self.X, self.labels, method="exact", memory_budget=50_000
+        )
+        self.assertAlmostEqual(score, expected, places=10)
+
+    def test_approximations_are_close(self):
+        expected = silhouette_score(self.X, self.labels)
+        sampled = silhouette_score_fast(
+            self.X, self.labels, method="sampled", sample_size=200, random_state=0
+        )
+        simplified = silhouette_score_fast(self.X, self.labels, method="simplified")
+        self.assertAlmostEqual(sampled, expected, delta=0.05)
+        self.assertAlmostEqual(simplified, expected, delta=0.15)
+
+        simplified32 = silhouette_score_fast(
+            self.X.astype(np.float32), self.labels, method="simplified"
+        )
+        self.assertAlmostEqual(simplified32, simplified, places=5)
+
+    def test_auto_strategy(self):
+        self.assertEqual(choose_silhouette_method(1_000, 5, budget=10 ** 8)[0], "exact")
+        self.assertEqual(
+            choose_silhouette_method(10 ** 6, 5, budget=10 ** 8), ("sampled", 10_000)
+        )
+        self.assertEqual(choose_silhouette_method(10 ** 6, 5, budget=1_000)[0], "simplified")
+
+
+class TestElbowCurve(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        centres = np.array([[0.0, 0.0], [10.0, 0.0], [0.0, 10.0], [10.0, 10.0]])
+        self.X = np.vstack([c + rng.normal(size=(50, 2)) for c in centres])
+        self.k_values = [1, 2, 3, 4, 5]
+
+    def test_parallel_matches_serial(self):
+        serial = elbow_curve(self.X, self.k_values, random_state=0, use_sklearn=False)
+        parallel = elbow_curve(
+            self.X, self.k_values, random_state=0, use_sklearn=False, n_jobs=3
+        )
+        self.assertEqual(list(parallel), self.k_values)
+        for k in self.k_values:
+            self.assertAlmostEqual(parallel[k], serial[k])
+
+    def test_sweep_shares_one_workspace(self):
+        with mock.patch.object(
+            KMeansWorkspace, "for_data", wraps=KMeansWorkspace.for_data
+        ) as for_data:
+            inertias = elbow_curve(self.X, self.k_values, random_state=0, use_sklearn=False)
+        for_data.assert_called_once_with(self.X, 5)
+        for k in self.k_values:
+            expected = kmeans(self.X, k, random_state=0, return_inertia=True)[2]
+            self.assertAlmostEqual(inertias[k], expected)
+
+    def test_warm_start_decreasing(self):
+        for n_jobs in (None, 2):
+            inertias = elbow_curve(
+                self.X, self.k_values, random_state=0, use_sklearn=False,
+                warm_start=True, n_jobs=n_jobs,
+            )
+            values = [inertias[k] for k in self.k_values]
+            self.assertTrue(all(a >= b for a, b in zip(values, values[1:])))
+
+    def test_precomputed_values_are_not_refitted(self):
+        pairs = list(iter_elbow_curve(
+            self.X, [2, 3], use_sklearn=False, precomputed={3: -1.0}
+        ))
+        self.assertEqual(pairs[0], (3, -1.0))
+        self.assertEqual([k for k, _ in pairs], [3, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from cluster_maker.preprocessing import select_features, standardise_features, apply_pca
+from cluster_maker.algorithms import (
+    init_centroids,
+    update_centroids,
+    kmeans,
+    kmeans_elkan,
+    minibatch_kmeans,
+    warm_start_centroids,
+)
+from cluster_maker.evaluation import compute_inertia
+from cluster_maker.interface import run_clustering
+
+
+class TestFloat32Pipeline(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        self.df = pd.DataFrame({
+            "x": np.concatenate([rng.normal(0, 1, 100), rng.normal(8, 1, 100)]),
+            "y": np.concatenate([rng.normal(0, 1, 100), rng.normal(8, 1, 100)]),
+            "z": rng.normal(size=200),
+        })
+
+    def test_dtype_preserved_at_every_stage(self):
+        f32 = np.dtype(np.float32)
+
+        X_df = select_features(self.df, ["x", "y", "z"], dtype="float32")
+        self.assertTrue((X_df.dtypes == f32).all())
+        X = X_df.to_numpy()
+        self.assertEqual(X.dtype, f32)
+
+        X = standardise_features(X)
+        self.assertEqual(X.dtype, f32)
+        self.assertEqual(apply_pca(X, n_components=2).dtype, f32)
+
+        for init in ("random", "k-means++", "k-means||"):
+            self.assertEqual(init_centroids(X, 3, random_state=0, init=init).dtype, f32)
+
+        labels, centroids, inertia = kmeans(X, 2, random_state=0, return_inertia=True)
+        self.assertEqual(centroids.dtype, f32)
+        self.assertIsInstance(inertia, float)
+        self.assertAlmostEqual(inertia, compute_inertia(X, labels, centroids), places=2)
+        self.assertEqual(update_centroids(X, labels, 2).dtype, f32)
+        self.assertEqual(warm_start_centroids(X, labels, centroids, 0).dtype, f32)
+        self.assertEqual(kmeans_elkan(X, 2, random_state=0)[1].dtype, f32)
+        self.assertEqual(minibatch_kmeans(X, 2, random_state=0)[1].dtype, f32)
+
+    def test_kmeans_dtype_option(self):
+        X = self.df.to_numpy()
+        _, centroids = kmeans(X, 2, random_state=0, dtype="float32")
+        self.assertEqual(centroids.dtype, np.float32)
+
+    def test_run_clustering_float32(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "data.csv")
+            out_path = os.path.join(tmpdir, "out.csv")
+            self.df.to_csv(path, index=False)
+
+            for stream in (False, True):
+                result = run_clustering(
+                    path, ["x", "y"], k=2, random_state=0, output_path=out_path,
+                    dtype="float32", stream=stream, algorithm="minibatch_kmeans",
+                )
+                self.assertEqual(result["centroids"].dtype, np.float32)
+
+                # Feature columns are written at float32 precision: they
+                # parse back to the float32 values
+                written = pd.read_csv(out_path)
+                np.testing.assert_array_equal(
+                    written["x"].to_numpy(dtype=np.float32),
+                    self.df["x"].to_numpy(dtype=np.float32),
+                )
+                # Other columns keep their full precision
+                np.testing.assert_allclose(written["z"], self.df["z"], rtol=1e-12)
+
+
+if __name__ == "__main__":
+    unittest.main()
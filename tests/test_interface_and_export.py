@@ -1,10 +1,17 @@
+import importlib.util
 import os
 import tempfile
 import unittest
+import numpy as np
 import pandas as pd
 
 from cluster_maker.interface import run_clustering
-from cluster_maker.data_exporter import export_to_csv, export_formatted
+from cluster_maker.data_exporter import (
+    export_to_csv,
+    export_formatted,
+    export_labelled,
+    export_labels,
+)
 
 
 class TestInterfaceRunClustering(unittest.TestCase):
@@ -25,6 +32,148 @@ class TestInterfaceRunClustering(unittest.TestCase):
             with self.assertRaises(KeyError):
                 run_clustering(path, feature_cols=["x", "y"])
 
+    def test_run_clustering_streaming_writes_labels(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "data.csv")
+            out_path = os.path.join(tmpdir, "out.csv")
+            df = pd.DataFrame({
+                "x": [0.0, 0.1, 0.2, 10.0, 10.1, 10.2] * 5,
+                "y": [0.0, 0.2, 0.1, 10.0, 10.2, 10.1] * 5,
+            })
+            df.to_csv(path, index=False)
+
+            result = run_clustering(
+                path,
+                feature_cols=["x", "y"],
+                algorithm="minibatch_kmeans",
+                k=2,
+                output_path=out_path,
+                random_state=0,
+                stream=True,
+                chunk_size=7,
+            )
+
+            written = pd.read_csv(out_path)
+            self.assertEqual(len(written), len(df))
+            self.assertIn("cluster", written.columns)
+            self.assertIsNone(result["labels"])
+            self.assertEqual(result["centroids"].shape, (2, 2))
+
+            # MiniBatchKMeans seeds from the first chunk: it needs k rows
+            with self.assertRaisesRegex(ValueError, "chunk_size"):
+                run_clustering(
+                    path, feature_cols=["x", "y"], algorithm="minibatch_kmeans",
+                    k=5, stream=True, chunk_size=3,
+                )
+
+    def test_run_clustering_labels_only_output(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "data.csv")
+            out_path = os.path.join(tmpdir, "labels.npy")
+            pd.DataFrame({
+                "x": [0.0, 0.1, 0.2, 10.0, 10.1, 10.2],
+                "y": [0.0, 0.2, 0.1, 10.0, 10.2, 10.1],
+            }).to_csv(path, index=False)
+
+            result = run_clustering(
+                path, feature_cols=["x", "y"], k=2, random_state=0,
+                output_path=out_path, labels_only=True,
+            )
+            np.testing.assert_array_equal(np.load(out_path), result["labels"])
+            self.assertIn("cluster", result["data"].columns)
+
+    def _binary_input_matches_csv(self, suffix, write):
+        rng = np.random.RandomState(0)
+        X = np.vstack([rng.normal(size=(30, 3)), rng.normal(size=(30, 3)) + 6.0])
+        df = pd.DataFrame(X, columns=["x", "y", "z"])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            csv_path = os.path.join(tmpdir, "data.csv")
+            df.to_csv(csv_path, index=False)
+            expected = run_clustering(csv_path, feature_cols=["x", "z"], k=2, random_state=0)
+
+            path = os.path.join(tmpdir, "data" + suffix)
+            cols = write(df, path)
+            out_path = os.path.join(tmpdir, "out.csv")
+            result = run_clustering(
+                path, feature_cols=cols, k=2, random_state=0,
+                output_path=out_path, chunk_size=25,
+            )
+            np.testing.assert_array_equal(result["labels"], expected["labels"])
+            written = pd.read_csv(out_path)
+            self.assertEqual(len(written), len(df))
+            np.testing.assert_array_equal(written["cluster"], expected["labels"])
+        return result
+
+    def test_run_clustering_npy_input(self):
+        def write(df, path):
+            np.save(path, df.to_numpy())
+            return [0, 2]
+
+        result = self._binary_input_matches_csv(".npy", write)
+        self.assertIsNone(result["data"])
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow is not installed")
+    def test_run_clustering_parquet_input(self):
+        def write(df, path):
+            df.to_parquet(path)
+            return ["x", "z"]
+
+        result = self._binary_input_matches_csv(".parquet", write)
+        self.assertEqual(list(result["data"].columns), ["x", "z", "cluster"])
+
+    def test_run_clustering_bisecting_elbow_from_one_fit(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "data.csv")
+            rng = np.random.RandomState(0)
+            pd.DataFrame(rng.normal(size=(120, 2)), columns=["x", "y"]).to_csv(
+                path, index=False
+            )
+            result = run_clustering(
+                path,
+                feature_cols=["x", "y"],
+                algorithm="bisecting_kmeans",
+                k=3,
+                random_state=0,
+                compute_elbow=True,
+            )
+            tree = result["split_tree"]
+            self.assertEqual(tree.k, 8)
+            np.testing.assert_array_equal(result["labels"], tree.labels(3))
+            self.assertEqual(
+                result["elbow_inertias"], {k: tree.inertia(k) for k in range(1, 9)}
+            )
+
+    def test_run_clustering_coreset(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "data.csv")
+            rng = np.random.RandomState(0)
+            centres = np.array([[0.0, 0.0], [20.0, 0.0], [0.0, 20.0]])
+            X = np.vstack([c + rng.normal(size=(400, 2)) for c in centres])
+            pd.DataFrame(X, columns=["x", "y"]).to_csv(path, index=False)
+
+            full = run_clustering(path, feature_cols=["x", "y"], k=3, random_state=0)
+            in_memory = run_clustering(
+                path, feature_cols=["x", "y"], k=3, random_state=0,
+                coreset_size=200, compute_elbow=True,
+            )
+            streamed = run_clustering(
+                path, feature_cols=["x", "y"], k=3, random_state=0,
+                coreset_size=200, compute_elbow=True, stream=True, chunk_size=300,
+            )
+            self.assertEqual(len(in_memory["labels"]), 1200)
+            self.assertEqual(sorted(in_memory["elbow_inertias"]), list(range(1, 9)))
+            self.assertEqual(sorted(streamed["elbow_inertias"]), list(range(1, 9)))
+            for result in (in_memory, streamed):
+                self.assertLess(
+                    result["metrics"]["inertia"], 1.05 * full["metrics"]["inertia"]
+                )
+
+            with self.assertRaises(ValueError):
+                run_clustering(
+                    path, feature_cols=["x", "y"], algorithm="kmeans_elkan",
+                    coreset_size=200,
+                )
+
 
 class TestExportFunctions(unittest.TestCase):
 
@@ -58,3 +207,35 @@ class TestExportFunctions(unittest.TestCase):
 
         with self.assertRaises(Exception):
             export_formatted(df, invalid_path)
+
+    def test_export_labelled_matches_full_export(self):
+        df = pd.DataFrame({"x": np.linspace(0.0, 1.0, 7), "name": list("abcdefg")})
+        labels = np.array([0, 1, 1, 0, 2, 2, 1])
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            full_path = os.path.join(tmpdir, "full.csv")
+            export_to_csv(df.assign(cluster=labels), full_path, float_format="%.3f")
+            chunked_path = os.path.join(tmpdir, "chunked.csv.gz")
+            export_labelled(
+                df, labels, chunked_path, float_format="%.3f",
+                compression="gzip", chunk_size=3,
+            )
+            expected = pd.read_csv(full_path)
+            pd.testing.assert_frame_equal(pd.read_csv(chunked_path), expected)
+        # The input frame is left untouched
+        self.assertNotIn("cluster", df.columns)
+
+    def test_export_labels_compact_sidecar(self):
+        labels = np.array([3, 0, 2, 2, 1])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "labels.npy")
+            export_labels(labels, path)
+            loaded = np.load(path)
+            self.assertEqual(loaded.dtype, np.uint8)
+            np.testing.assert_array_equal(loaded, labels)
+
+            path = os.path.join(tmpdir, "labels.npz")
+            export_labels(labels, path, row_ids=np.arange(10, 15))
+            with np.load(path) as data:
+                np.testing.assert_array_equal(data["row_id"], np.arange(10, 15))
+                np.testing.assert_array_equal(data["cluster"], labels)
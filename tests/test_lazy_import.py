@@ -0,0 +1,47 @@
+import subprocess
+import sys
+import unittest
+
+
+def modules_after(statement):
+    """
+    Top-level modules loaded by a fresh interpreter after running statement.
+    """
+    code = (
+        f"{statement}\n"
+        "import sys\n"
+        "print(' '.join(sorted({name.split('.')[0] for name in sys.modules})))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    return set(output.split())
+
+
+class TestLazyImport(unittest.TestCase):
+    def test_import_package_is_light(self):
+        loaded = modules_after("import cluster_maker")
+        self.assertNotIn("matplotlib", loaded)
+        self.assertNotIn("sklearn", loaded)
+
+    def test_kmeans_does_not_need_plotting_or_sklearn(self):
+        loaded = modules_after(
+            "import numpy as np\n"
+            "from cluster_maker import kmeans\n"
+            "kmeans(np.random.RandomState(0).normal(size=(50, 2)), 3, random_state=0)"
+        )
+        self.assertNotIn("matplotlib", loaded)
+        self.assertNotIn("sklearn", loaded)
+        self.assertNotIn("pandas", loaded)
+
+    def test_lazy_attributes_resolve(self):
+        import cluster_maker
+
+        for name in cluster_maker.__all__:
+            self.assertTrue(callable(getattr(cluster_maker, name)), name)
+        with self.assertRaises(AttributeError):
+            cluster_maker.no_such_function
+
+
+if __name__ == "__main__":
+    unittest.main()
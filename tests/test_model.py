@@ -0,0 +1,80 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from cluster_maker.interface import run_clustering
+from cluster_maker.model import ClusterModel
+
+
+class TestClusterModel(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        centres = np.array([[0.0, 0.0, 5.0], [8.0, 1.0, 0.0], [1.0, 9.0, 2.0]])
+        X = np.vstack([c + rng.normal(size=(60, 3)) for c in centres])
+        self.df = pd.DataFrame(X, columns=["a", "b", "c"])
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "data.csv")
+        self.df.to_csv(self.path, index=False)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_predict_reproduces_run_clustering_labels(self):
+        result = run_clustering(
+            self.path, feature_cols=["a", "b", "c"], k=3, random_state=0, use_pca=True
+        )
+        model = result["model"]
+        np.testing.assert_array_equal(model.predict(self.df), result["labels"])
+        np.testing.assert_array_equal(
+            model.predict(self.df[["a", "b", "c"]].to_numpy()), result["labels"]
+        )
+        # Single rows, given as 1D arrays
+        row = self.df.iloc[5].to_numpy()
+        self.assertEqual(model.predict(row)[0], result["labels"][5])
+        self.assertEqual(model.project(self.df).shape, (len(self.df), 2))
+
+    def test_batched_predict_matches_direct_path(self):
+        result = run_clustering(self.path, feature_cols=["a", "b", "c"], k=3, random_state=0)
+        model = result["model"]
+        X = np.tile(self.df.to_numpy(), (100, 1))
+        labels = model.predict(X, chunk_size=1000)
+        np.testing.assert_array_equal(labels, np.tile(result["labels"], 100))
+
+    def test_save_load_roundtrip(self):
+        model = ClusterModel(
+            np.array([[0.0, 1.0], [2.0, 3.0]], dtype=np.float32),
+            mean=np.array([1.0, 2.0, 3.0]),
+            scale=np.array([2.0, 1.0, 0.5]),
+            pca_mean=np.zeros(3),
+            pca_components=np.array([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]]),
+            cluster_space="pca",
+            feature_names=["a", "b", "c"],
+        )
+        path = os.path.join(self.tmpdir.name, "model.npz")
+        model.save(path)
+        loaded = ClusterModel.load(path)
+
+        self.assertEqual(loaded.cluster_space, "pca")
+        self.assertEqual(loaded.feature_names, ["a", "b", "c"])
+        self.assertEqual(loaded.dtype, np.float32)
+        np.testing.assert_array_equal(loaded.pca_components, model.pca_components)
+        np.testing.assert_array_equal(loaded.predict(self.df), model.predict(self.df))
+
+    def test_save_keeps_path_without_suffix(self):
+        model = ClusterModel(np.array([[0.0, 1.0], [2.0, 3.0]]))
+        path = os.path.join(self.tmpdir.name, "model")
+        model.save(path)
+        self.assertFalse(os.path.exists(path + ".npz"))
+        np.testing.assert_array_equal(ClusterModel.load(path).centroids, model.centroids)
+
+    def test_wrong_number_of_features(self):
+        model = ClusterModel(np.zeros((2, 3)))
+        with self.assertRaises(ValueError):
+            model.predict(np.zeros((4, 2)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import pickle
+import unittest
+from functools import partial
+from multiprocessing import shared_memory
+from unittest import mock
+
+import numpy as np
+
+from cluster_maker import parallel
+from cluster_maker.algorithms import kmeans
+from cluster_maker.evaluation import elbow_curve
+from cluster_maker.parallel import parallel_map, shared_arrays
+
+
+def _probe(X, offset):
+    # Runs in a worker process
+    return X.flags.writeable, float(X.sum()) + offset
+
+
+def _fail(X, item):
+    raise RuntimeError("worker failed")
+
+
+def _exists(name):
+    try:
+        segment = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return False
+    segment.close()
+    return True
+
+
+class TestSharedMemory(unittest.TestCase):
+    def setUp(self):
+        self.X = np.random.RandomState(0).normal(size=(300, 3))
+
+    def test_handle_pickles_small_and_attaches_a_view(self):
+        with shared_arrays([self.X]) as (handle,):
+            self.assertLess(len(pickle.dumps(handle)), 200)
+            view = pickle.loads(pickle.dumps(handle)).attach()
+            np.testing.assert_array_equal(view, self.X)
+            self.assertFalse(view.flags.writeable)
+            self.assertFalse(view.flags.owndata)
+
+    def test_segments_are_removed_on_exit_and_on_error(self):
+        with shared_arrays([self.X]) as (handle,):
+            self.assertTrue(_exists(handle.name))
+        self.assertFalse(_exists(handle.name))
+
+        with self.assertRaises(RuntimeError):
+            with shared_arrays([self.X]) as (handle,):
+                raise RuntimeError("failed")
+        self.assertFalse(_exists(handle.name))
+
+    def test_parallel_map_shares_large_arrays(self):
+        with mock.patch.object(parallel, "SHARED_MEMORY_MIN_BYTES", 0):
+            results = parallel_map(
+                partial(_probe, self.X), [0.0, 1.0], n_jobs=2, backend="processes"
+            )
+        self.assertEqual(results, [(False, self.X.sum()), (False, self.X.sum() + 1.0)])
+
+        # Below the threshold the array is pickled as usual
+        results = parallel_map(partial(_probe, self.X), [0.0], n_jobs=2, backend="processes")
+        self.assertEqual(results, [(True, self.X.sum())])
+
+    def test_worker_error_releases_shared_memory(self):
+        created = []
+        real = shared_memory.SharedMemory
+
+        def record(*args, **kwargs):
+            segment = real(*args, **kwargs)
+            if kwargs.get("create"):
+                created.append(segment.name)
+            return segment
+
+        with mock.patch.object(parallel, "SHARED_MEMORY_MIN_BYTES", 0), \
+                mock.patch.object(parallel.shared_memory, "SharedMemory", record):
+            with self.assertRaises(RuntimeError):
+                parallel_map(partial(_fail, self.X), [0, 1], n_jobs=2, backend="processes")
+        self.assertEqual(len(created), 1)
+        self.assertFalse(_exists(created[0]))
+
+    def test_process_backends_match_serial(self):
+        with mock.patch.object(parallel, "SHARED_MEMORY_MIN_BYTES", 0):
+            for assign in ("brute", "filtering"):
+                serial = kmeans(self.X, 3, random_state=0, n_init=3, assign=assign)
+                shared = kmeans(
+                    self.X, 3, random_state=0, n_init=3, assign=assign,
+                    n_jobs=2, backend="processes",
+                )
+                np.testing.assert_array_equal(shared[0], serial[0])
+                np.testing.assert_array_equal(shared[1], serial[1])
+
+            k_values = [1, 2, 3, 4]
+            serial = elbow_curve(self.X, k_values, random_state=0, use_sklearn=False)
+            shared = elbow_curve(
+                self.X, k_values, random_state=0, use_sklearn=False,
+                n_jobs=2, backend="processes",
+            )
+        self.assertEqual(shared, serial)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,11 @@
+import os
+import tempfile
 import unittest
 import numpy as np
+import pandas as pd
 
 from cluster_maker.preprocessing import standardise_features, apply_pca
+from cluster_maker.interface import run_clustering
 
 
 class TestPCAExtension(unittest.TestCase):
@@ -13,3 +17,53 @@ class TestPCAExtension(unittest.TestCase):
         X_pca = apply_pca(X_scaled, n_components=2)
 
         self.assertEqual(X_pca.shape, (50, 2))
+
+    def test_solvers_agree_up_to_sign(self):
+        rng = np.random.RandomState(0)
+        # Clearly separated leading variances so the axes are well defined
+        X = rng.normal(size=(500, 6)) * np.array([10.0, 5.0, 1.0, 0.5, 0.2, 0.1])
+        reference = apply_pca(X, n_components=2, svd_solver="full")
+        for solver in ("randomized", "incremental"):
+            X_pca = apply_pca(
+                X, n_components=2, svd_solver=solver, batch_size=64, random_state=0
+            )
+            for j in range(2):
+                # Incremental PCA is approximate once components are dropped
+                sign = np.sign(X_pca[:, j] @ reference[:, j])
+                atol = 1e-3 * np.abs(reference[:, j]).max()
+                np.testing.assert_allclose(sign * X_pca[:, j], reference[:, j], atol=atol)
+
+    def test_incremental_keeps_float32(self):
+        X = np.random.RandomState(1).normal(size=(103, 4)).astype(np.float32)
+        X_pca, mean, components = apply_pca(
+            X, n_components=3, svd_solver="incremental", batch_size=50, return_params=True
+        )
+        self.assertEqual(X_pca.dtype, np.float32)
+        self.assertEqual(components.shape, (3, 4))
+        np.testing.assert_allclose(X_pca, (X - mean) @ components.T, rtol=1e-5, atol=1e-5)
+
+    def test_run_clustering_pca_before(self):
+        rng = np.random.RandomState(0)
+        centres = rng.normal(scale=8.0, size=(3, 6))
+        df = pd.DataFrame(
+            np.vstack([c + rng.normal(size=(40, 6)) for c in centres]),
+            columns=[f"f{i}" for i in range(6)],
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "data.csv")
+            df.to_csv(path, index=False)
+            result = run_clustering(
+                path,
+                feature_cols=list(df.columns),
+                k=3,
+                random_state=0,
+                use_pca=True,
+                pca_components=2,
+                pca_stage="before",
+            )
+        # Centroids live in the reduced space and the model maps raw rows there
+        self.assertEqual(result["centroids"].shape, (3, 2))
+        np.testing.assert_array_equal(result["model"].predict(df), result["labels"])
+
+        with self.assertRaises(ValueError):
+            run_clustering(path, feature_cols=list(df.columns), use_pca=True, pca_stage="middle")
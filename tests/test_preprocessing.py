@@ -0,0 +1,60 @@
+import os
+import pickle
+import tempfile
+import unittest
+
+import numpy as np
+
+from cluster_maker.preprocessing import StreamingStandardiser, standardise_features
+
+
+class TestStreamingStandardiser(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        self.X = rng.normal(loc=1e4, scale=3.0, size=(1000, 4))
+        self.X[:, 2] = 7.0  # constant feature
+
+    def test_chunked_statistics_match_numpy(self):
+        standardiser = StreamingStandardiser()
+        for start in range(0, 1000, 37):
+            standardiser.partial_fit(self.X[start:start + 37])
+        self.assertEqual(standardiser.n_samples_seen_, 1000)
+        np.testing.assert_allclose(standardiser.mean_, self.X.mean(axis=0), rtol=1e-14)
+        np.testing.assert_allclose(standardiser.var_, self.X.var(axis=0), rtol=1e-9, atol=1e-12)
+        self.assertEqual(standardiser.scale_[2], 1.0)
+
+    def test_merge_of_pickled_partials(self):
+        # Partial statistics as they would come back from worker processes
+        parts = [
+            pickle.loads(pickle.dumps(StreamingStandardiser().fit(self.X[a:b])))
+            for a, b in ((0, 250), (250, 251), (251, 1000))
+        ]
+        merged = StreamingStandardiser()
+        for part in parts:
+            merged.merge(part)
+        whole = StreamingStandardiser().fit(self.X)
+        np.testing.assert_allclose(merged.mean_, whole.mean_, rtol=1e-14)
+        np.testing.assert_allclose(merged.var_, whole.var_, rtol=1e-9, atol=1e-12)
+
+    def test_in_place_matches_copy(self):
+        expected = standardise_features(self.X)
+        X = self.X.copy()
+        result = standardise_features(X, copy=False)
+        self.assertTrue(np.shares_memory(result, X))
+        np.testing.assert_allclose(result, expected, atol=1e-9)
+
+    def test_transform_memory_mapped_in_place(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "X.dat")
+            X = np.memmap(path, dtype=np.float32, mode="w+", shape=self.X.shape)
+            X[:] = self.X
+            standardiser = StreamingStandardiser().fit(X, chunk_size=100)
+            standardiser.transform(X, copy=False, chunk_size=100)
+            X.flush()
+            self.assertEqual(X.dtype, np.float32)
+            np.testing.assert_allclose(X.mean(axis=0, dtype=np.float64), 0.0, atol=1e-3)
+            del X
+
+
+if __name__ == "__main__":
+    unittest.main()
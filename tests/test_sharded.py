@@ -0,0 +1,70 @@
+import multiprocessing
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from cluster_maker import parallel
+from cluster_maker.algorithms import kmeans
+from cluster_maker.sharded import sharded_kmeans
+
+
+class TestShardedKMeans(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        centres = rng.uniform(-10.0, 10.0, size=(4, 3))
+        X = np.vstack([c + rng.normal(size=(250, 3)) for c in centres])
+        rng.shuffle(X)
+        self.X = X
+        # Uneven shards, one of them empty
+        self.shards = np.split(X, [100, 100, 420, 777])
+
+    def test_matches_kmeans_on_concatenated_shards(self):
+        for init in ("k-means++", "random"):
+            labels, centroids, inertia = kmeans(
+                self.X, 4, random_state=2, init=init, return_inertia=True
+            )
+            for backend in ("threads", "processes"):
+                sharded = sharded_kmeans(
+                    self.shards, 4, random_state=2, init=init, backend=backend,
+                    n_jobs=2, return_inertia=True,
+                )
+                np.testing.assert_array_equal(sharded[0], labels)
+                np.testing.assert_allclose(sharded[1], centroids, rtol=1e-12)
+                self.assertAlmostEqual(sharded[2], inertia, places=6)
+
+    def test_array_shards_through_shared_memory(self):
+        expected = sharded_kmeans(self.shards, 4, random_state=1, backend="threads", n_jobs=2)
+        with mock.patch.object(parallel, "SHARED_MEMORY_MIN_BYTES", 0):
+            shared = sharded_kmeans(self.shards, 4, random_state=1, backend="processes", n_jobs=2)
+        np.testing.assert_array_equal(shared[0], expected[0])
+        np.testing.assert_array_equal(shared[1], expected[1])
+
+    def test_npy_file_shards(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = []
+            for i, shard in enumerate(self.shards):
+                paths.append(os.path.join(tmpdir, f"day_{i}.npy"))
+                np.save(paths[-1], shard)
+            labels, centroids, stats = sharded_kmeans(
+                paths, 4, random_state=0, n_jobs=3, return_stats=True
+            )
+        expected = kmeans(self.X, 4, random_state=0)
+        np.testing.assert_array_equal(labels, expected[0])
+        np.testing.assert_allclose(centroids, expected[1], rtol=1e-12)
+        self.assertEqual(stats["n_shards"], 5)
+        self.assertEqual(stats["n_workers"], 3)
+
+    def test_errors_stop_the_workers(self):
+        shards = [self.X[:10], self.X[10:20, :2]]
+        with self.assertRaises(ValueError):
+            sharded_kmeans(shards, 2, backend="processes", n_jobs=2)
+        with self.assertRaises(ValueError):
+            sharded_kmeans(["missing.csv"], 2, backend="processes")
+        self.assertEqual(multiprocessing.active_children(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()